@@ -1,40 +1,72 @@
 import os
 import pandas as pd
+from instrumentation import span
+from DataCleaning.lake import DEFAULT_HUB, write_series, files
 
 RAW_DIR = "DataScraping/Rawdata"
-OUT_DIR = "DataCleaning/price"
+OUT_DIR = "DataCleaning"
+HUBS = (DEFAULT_HUB,)
 
-def clean_price():
-    src = os.path.join(RAW_DIR, "price", "Price.xlsx")
+def raw_inputs(year=None) -> list:
+    # the original single workbook for year=None, else the yearly download in price/<year>/
+    if year is None:
+        return [os.path.join(RAW_DIR, "price", "Price.xlsx")]
+    src = os.path.join(RAW_DIR, "price", str(year), "Price.xlsx")
+    if not os.path.exists(src):
+        raise FileNotFoundError(f"Price file not found: {src} "
+                                f"(python pipeline.py --years {year} --sources price --fetch)")
+    return [src]
+
+def clean_price(year=None, hubs=HUBS):
+    # daily price per settlement point into the lake (hubs=None keeps every point);
+    # year=None also writes the flat Price_Clean.csv used by the ALL_IN_ONE merge
+    src = raw_inputs(year)[0]
     if not os.path.exists(src):
         raise FileNotFoundError(f"Price file not found: {src}")
 
-    xls = pd.ExcelFile(src) #Obtain it in months
-    df = pd.concat(pd.read_excel(xls, sheet_name=s) for s in xls.sheet_names)
+    with span("parse", stage="price", year=year) as sp:
+        sp.read(src)
+        xls = pd.ExcelFile(src) #Obtain it in months
+        df = pd.concat(pd.read_excel(xls, sheet_name=s) for s in xls.sheet_names)
+        sp.rows_out = len(df)
 
-    df = df[df["Settlement Point Name"] == "HB_BUSAVG"] #keep HB_BUSAVG only
+    if hubs is not None:
+        df = df[df["Settlement Point Name"].isin(hubs)] #keep HB_BUSAVG only by default
 
     df["Delivery Date"] = pd.to_datetime(df["Delivery Date"])
+    if year is not None:
+        df = df[df["Delivery Date"].dt.year == year]
+        if df.empty:
+            raise ValueError(f"No {year} price rows in {src}")
 
-    
-    hourly = (     # date x hours
-        df.groupby(["Delivery Date", "Delivery Hour"])["Settlement Point Price"]
-          .mean()
-          .reset_index()
-    )
-
-    daily = (          #price,daily
-        hourly.groupby("Delivery Date")["Settlement Point Price"]
+    with span("groupby", stage="price", rows_in=len(df), year=year) as sp:
+        hourly = (     # point x date x hours
+            df.groupby(["Settlement Point Name", "Delivery Date", "Delivery Hour"])["Settlement Point Price"]
               .mean()
               .reset_index()
-              .rename(columns={"Delivery Date": "date",
-                               "Settlement Point Price": "Price_t"})
-    )
-
-    os.makedirs(OUT_DIR, exist_ok=True)
-    out_path = os.path.join(OUT_DIR, "Price_Clean.csv")
-    daily.to_csv(out_path, index=False)
-    print(f"Successfuly Saved: {out_path} (rows={len(daily)})")
+        )
+
+        daily = (          #price,daily
+            hourly.groupby(["Settlement Point Name", "Delivery Date"])["Settlement Point Price"]
+                  .mean()
+                  .reset_index()
+                  .rename(columns={"Settlement Point Name": "settlement_point",
+                                   "Delivery Date": "date",
+                                   "Settlement Point Price": "Price_t"})
+        )
+        sp.rows_out = len(daily)
+
+    with span("write", stage="price", rows_in=len(daily), year=year) as sp:
+        years = write_series("price", daily, optional=year is None)
+        sp.wrote(*files("price", years))
+        if year is None:
+            out_path = os.path.join(OUT_DIR, "Price_Clean.csv")
+            flat = daily.drop(columns="settlement_point") if daily["settlement_point"].nunique() <= 1 else daily
+            flat.to_csv(out_path, index=False)
+            sp.wrote(out_path)
+            print(f"Successfuly Saved: {out_path} (rows={len(daily)})")
+    print(f"Successfuly Saved: price lake {years} (rows={len(daily)})")
+    return years
 
 if __name__ == "__main__":
     clean_price()
@@ -1,12 +1,25 @@
 import os, glob
 import pandas as pd
 import numpy as np
+from instrumentation import span
+from DataCleaning.lake import write_series, files
 
 RAW_DIR = "DataScraping/Rawdata/CDD_HDD"
-OUT_PATH = "DataCleaning/price/CDD_HDD_Clean.csv"
+OUT_PATH = "DataCleaning/CDD_HDD_Clean.csv"
 
-def read_all():
-    files = sorted(glob.glob(os.path.join(RAW_DIR, "*.csv")))
+def raw_inputs(year=None) -> list:
+    # the original 2024 pull lives directly in CDD_HDD/, yearly pulls in CDD_HDD/<year>/
+    if year is None:
+        return sorted(glob.glob(os.path.join(RAW_DIR, "*.csv")))
+    year_dir = os.path.join(RAW_DIR, str(year))
+    files = sorted(glob.glob(os.path.join(year_dir, "*.csv")))
+    if not files:
+        raise FileNotFoundError(f"No CSVs found under {year_dir}/ "
+                                f"(python pipeline.py --years {year} --sources weather --fetch)")
+    return files
+
+def read_all(year=None):
+    files = raw_inputs(year)
     if not files:
         raise FileNotFoundError(f"No CSVs found under {RAW_DIR}")
     parts = []
@@ -21,23 +34,34 @@ def read_all():
         tmp = df[[dcol, tcol, vcol]].copy()
         tmp.columns = ["date","datatype","value"]
         tmp["date"] = pd.to_datetime(tmp["date"])
+        if year is not None:
+            tmp = tmp[tmp["date"].dt.year == year]
         parts.append(tmp)
-    return pd.concat(parts, ignore_index=True)
+    out = pd.concat(parts, ignore_index=True)
+    if year is not None and out.empty:
+        raise ValueError(f"No {year} rows in {RAW_DIR}/{year}/")
+    return out
 
 def maybe_fix_units(wide):
     for c in ["TMAX","TMIN","TAVG"]:  #unit
         if c in wide.columns:
             s = wide[c].dropna()
             if len(s) and s.abs().median() > 200:
+                print(f"[warn] {c} median {s.abs().median():.0f} looks like tenths of a degree; dividing by 10")
                 wide[c] = wide[c] / 10.0
     return wide
 
-def main():
-    longdf = read_all()
+def main(year=None):
+    with span("parse", stage="weather", year=year) as sp:
+        sp.read(*raw_inputs(year))
+        longdf = read_all(year)
+        sp.rows_out = len(longdf)
 
-    wide = (longdf   # index=date, columns=datatype, values=mean(value)
-            .pivot_table(index="date", columns="datatype", values="value", aggfunc="mean")
-            .reset_index())
+    with span("groupby", stage="weather", rows_in=len(longdf), year=year) as sp:
+        wide = (longdf   # index=date, columns=datatype, values=mean(value)
+                .pivot_table(index="date", columns="datatype", values="value", aggfunc="mean")
+                .reset_index())
+        sp.rows_out = len(wide)
 
     wide = maybe_fix_units(wide)  # fix probable mistake
 
@@ -54,9 +78,15 @@ def main():
            .rename(columns={"CDD":"CDD_t","HDD":"HDD_t"})
            .sort_values("date"))
 
-    os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
-    out.to_csv(OUT_PATH, index=False)
-    print(f"Successfuly saved {OUT_PATH} (rows={len(out)})")
+    with span("write", stage="weather", rows_in=len(out), year=year) as sp:
+        years = write_series("weather", out, optional=year is None)
+        sp.wrote(*files("weather", years))
+        if year is None:
+            os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
+            out.to_csv(OUT_PATH, index=False)
+            sp.wrote(OUT_PATH)
+    print(f"Successfuly saved {OUT_PATH if year is None else 'weather lake'} {years} (rows={len(out)})")
+    return years
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,208 @@
+'''
+---------------------------------------------------------------
+Parquet lake for the cleaned series (canonical store)
+---------------------------------------------------------------
+
+    DataCleaning/lake/<series>/year=2024/month=7/part-0.parquet
+
+One dataset per series (price, load, weather, renewables), hive-partitioned by
+year and month, typed columns (date32 dates, float64 values, string settlement
+points), zstd-compressed with min/max statistics per row group. Readers project
+columns and push date ranges down, so e.g.
+
+    read_series("price", ["date", "Price_t"], start="2023-06-01", end="2023-08-31",
+                settlement_points=["HB_HOUSTON"])
+
+only opens the three summer-2023 month partitions. pyarrow is imported on first use.
+'''
+
+import os
+import glob
+import importlib.util
+import re
+import shutil
+from datetime import date
+import pandas as pd
+
+LAKE_DIR = "DataCleaning/lake"  # repo-root relative, like the paths in the cleaning scripts
+DEFAULT_HUB = "HB_BUSAVG"
+ROW_GROUP_ROWS = 64 * 1024
+VALUES = {
+    "price": ["Price_t"],
+    "load": ["Load_t"],
+    "weather": ["CDD_t", "HDD_t"],
+    "renewables": ["RenewableShare_t"],
+}
+SERIES = tuple(VALUES)
+
+def _schema(series: str):
+    import pyarrow as pa
+    fields = [pa.field("date", pa.date32(), nullable=False)]
+    if series == "price":
+        fields.append(pa.field("settlement_point", pa.string()))
+    fields += [pa.field(c, pa.float64()) for c in VALUES[series]]
+    return pa.schema(fields)
+
+def _partitioning():
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    return ds.partitioning(pa.schema([("year", pa.int16()), ("month", pa.int8())]), flavor="hive")
+
+def series_dir(series: str, root: str = LAKE_DIR) -> str:
+    if series not in VALUES:
+        raise KeyError(f"Unknown series {series!r}; expected one of {SERIES}")
+    return os.path.join(root, series)
+
+def year_dir(series: str, year: int, root: str = LAKE_DIR) -> str:
+    return os.path.join(series_dir(series, root), f"year={year}")
+
+def years_available(series: str, root: str = LAKE_DIR) -> list[int]:
+    found = glob.glob(os.path.join(series_dir(series, root), "year=*"))
+    return sorted(int(re.search(r"year=(\d+)", p).group(1)) for p in found)
+
+def files(series: str, years, root: str = LAKE_DIR) -> list[str]:
+    return [f for y in years for f in glob.glob(os.path.join(year_dir(series, y, root), "*", "*.parquet"))]
+
+def written_at(series: str, year: int, root: str = LAKE_DIR):
+    '''mtime of the newest file in a year partition, None if the year is not in the lake.'''
+    found = files(series, [year], root)
+    return max(map(os.path.getmtime, found)) if found else None
+
+def have_pyarrow() -> bool:
+    return importlib.util.find_spec("pyarrow") is not None
+
+def write_series(series: str, df: pd.DataFrame, root: str = LAKE_DIR, optional: bool = False) -> list[int]:
+    '''
+    Upsert df into the lake: in every year df touches, rows with the same date (and
+    settlement point, for price) are replaced and all other stored rows are kept, so a
+    posting that spills one day into the previous year, or a run for one hub, leaves
+    the rest of that year alone. Rows are sorted by date (and settlement point) before
+    writing, so row-group min/max stats on date are tight. Returns the years written.
+    optional=True (the cleaners' flat-CSV runs) skips the lake with a warning when
+    pyarrow is not installed; otherwise that is an ImportError.
+    '''
+    if not have_pyarrow():
+        if optional:
+            print(f"[warn] pyarrow is not installed: {series} not written to the Parquet lake "
+                  "(pip install -r requirements.txt)")
+            return []
+        raise ImportError("The Parquet lake needs pyarrow: pip install -r requirements.txt")
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    schema = _schema(series)
+    keys = [c for c in ("date", "settlement_point") if c in schema.names]
+    out = df.copy()
+    out["date"] = pd.to_datetime(out["date"])
+    years = sorted(int(y) for y in out["date"].dt.year.unique())
+
+    stored = set(years_available(series, root))
+    old = [read_series(series, start=date(y, 1, 1), end=date(y, 12, 31), root=root)
+           for y in years if y in stored]
+    if old:
+        out = pd.concat(old + [out[schema.names]], ignore_index=True)
+        out = out.drop_duplicates(keys, keep="last")
+
+    out = out.sort_values(keys)
+    out["year"] = out["date"].dt.year.astype("int16")
+    out["month"] = out["date"].dt.month.astype("int8")
+    out["date"] = out["date"].dt.date
+
+    full = schema.append(pa.field("year", pa.int16())).append(pa.field("month", pa.int8()))
+    table = pa.Table.from_pandas(out[full.names], schema=full, preserve_index=False)
+
+    for y in years:  # merged above, so each touched year is rewritten whole
+        shutil.rmtree(year_dir(series, y, root), ignore_errors=True)
+
+    ds.write_dataset(
+        table, series_dir(series, root), format="parquet",
+        partitioning=_partitioning(),
+        basename_template="part-{i}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+        max_rows_per_group=ROW_GROUP_ROWS,
+    )
+    return years
+
+def dataset(series: str, root: str = LAKE_DIR):
+    import pyarrow.dataset as ds
+    path = series_dir(series, root)
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f"No {series} dataset under {root}; run the cleaning stage first")
+    return ds.dataset(path, format="parquet", partitioning=_partitioning())
+
+def date_filter(start=None, end=None):
+    '''Partition (year/month) pruning plus a row-group-level predicate on date.'''
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+
+    year, month, day = ds.field("year"), ds.field("month"), ds.field("date")
+    expr = None
+    if start is not None:
+        s = pd.Timestamp(start)
+        e = (year > s.year) | ((year == s.year) & (month >= s.month))
+        e = e & (day >= pa.scalar(s.date(), pa.date32()))
+        expr = e
+    if end is not None:
+        t = pd.Timestamp(end)
+        e = (year < t.year) | ((year == t.year) & (month <= t.month))
+        e = e & (day <= pa.scalar(t.date(), pa.date32()))
+        expr = e if expr is None else expr & e
+    return expr
+
+def read_series(series: str, columns=None, start=None, end=None,
+                settlement_points=None, root: str = LAKE_DIR) -> pd.DataFrame:
+    '''
+    Load one series with column projection and predicate pushdown.
+    start/end are inclusive dates (anything pd.Timestamp accepts).
+    '''
+    import pyarrow.dataset as ds
+
+    columns = list(columns) if columns else _schema(series).names
+    expr = date_filter(start, end)
+    if settlement_points is not None:
+        if series != "price":
+            raise KeyError(f"{series} has no settlement_point column")
+        sp = ds.field("settlement_point").isin(list(settlement_points))
+        expr = sp if expr is None else expr & sp
+
+    df = dataset(series, root).to_table(columns=columns, filter=expr).to_pandas()
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"])
+        df = df.sort_values("date", kind="stable").reset_index(drop=True)
+    return df
+
+def read_panel(start=None, end=None, hub: str = DEFAULT_HUB, root: str = LAKE_DIR) -> pd.DataFrame:
+    '''The four series joined on date for one hub: the ALL_IN_ONE.csv layout.'''
+    price = read_series("price", ["date", "Price_t"], start, end, settlement_points=[hub], root=root)
+    panel = price
+    for s in ("load", "weather", "renewables"):
+        panel = panel.merge(read_series(s, None, start, end, root=root), on="date", how="inner")
+    return panel
+
+def series_dates(start=None, end=None, hub: str = DEFAULT_HUB, root: str = LAKE_DIR) -> dict:
+    '''Only the date column of each series (for the cross-source coverage check).'''
+    return {s: read_series(s, ["date"], start, end,
+                           settlement_points=[hub] if s == "price" else None, root=root)["date"]
+            for s in SERIES}
+
+def merge_years(years, out_path: str = "DataCleaning/ALL_IN_ONE.csv",
+                hub: str = DEFAULT_HUB, root: str = LAKE_DIR) -> str:
+    '''
+    Stack read_panel() year by year into ALL_IN_ONE.csv, so only one year of each
+    series is in memory at a time. Years missing from any series are skipped.
+    '''
+    merged = []
+    for y in years:
+        if not all(written_at(s, y, root) for s in SERIES):
+            print(f"[warn] {y}: not every series is in the lake, not merged")
+            continue
+        merged.append(read_panel(date(y, 1, 1), date(y, 12, 31), hub, root))
+    if not merged:
+        raise FileNotFoundError(f"No complete year among {list(years)} under {root}")
+    out = pd.concat(merged, ignore_index=True)
+    out["date"] = out["date"].dt.strftime("%Y-%m-%d")
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+    out.to_csv(out_path, index=False)
+    print(f"[done] Merged {len(merged)} year(s) → {out_path} (rows={len(out)})")
+    return out_path
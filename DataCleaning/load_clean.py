@@ -1,12 +1,26 @@
-import os, glob
+import os, glob, re, csv, hashlib
 import pandas as pd
 from typing import List
+from instrumentation import span
+from DataCleaning.lake import write_series, files as lake_files
+from DataCleaning.quality import check_day_lengths, summarize
 
 RAW_DIR = "DataScraping/Rawdata/load/load_raw_data"
-OUT_PATH = "DataCleaning/price/Load_Clean.csv"
+OUT_PATH = "DataCleaning/Load_Clean.csv"
 
-def _norm_cols(df: pd.DataFrame) -> dict:
-    return {c.lower().strip(): c for c in df.columns}
+# candidate header names, in priority order
+DATE_KEYS = ["operday","date","delivery date","operating day"]
+HOUR_KEYS = ["hourending","delivery hour","hour"]
+LOAD_KEYS = ["total","system load","load (mw)","load","actual load (mw)"]
+FLAG_KEYS = ["dstflag","timezone"]
+SNIFF_ROWS = 50  # rows read to find numeric zone columns when there is no total column
+
+# header fingerprint → resolved layout ({"date": col, "load": [cols]}) or None if unknown.
+# ERCOT changed the file layout only a few times, so this holds a handful of entries.
+_LAYOUTS = {}
+
+def _norm_cols(cols) -> dict:
+    return {c.lower().strip(): c for c in cols}
 
 def _pick_first(d: dict, keys: List[str]):
     for k in keys:
@@ -23,61 +37,106 @@ def _numeric_zone_cols(df: pd.DataFrame, ignore: List[str]) -> List[str]:
             cand.append(c)
     return cand
 
-def load_and_clean() -> pd.DataFrame:
-    files = sorted(glob.glob(os.path.join(RAW_DIR, "*.csv")))
+def _header(f: str) -> str:
+    with open(f, encoding="utf-8-sig") as fh:
+        return fh.readline().rstrip("\r\n")
+
+def resolve_layout(f: str, header: str):
+    """Date + load column(s) for one header line; zone columns are typed from a small sample."""
+    cols = next(csv.reader([header]))
+    norm = _norm_cols(cols)
+    date_col = _pick_first(norm, DATE_KEYS)   # date/hour columns
+    if not date_col:
+        return None
+    load_col = _pick_first(norm, LOAD_KEYS)
+    if load_col:
+        return {"date": date_col, "load": [load_col]}
+    ignore = {date_col, _pick_first(norm, HOUR_KEYS)} | {norm[k] for k in FLAG_KEYS if k in norm}
+    zone_cols = _numeric_zone_cols(pd.read_csv(f, nrows=SNIFF_ROWS), ignore=list(ignore))  # sum all numeric zone columns
+    return {"date": date_col, "load": zone_cols} if zone_cols else None
+
+def layout_for(f: str):
+    """(fingerprint, header, layout) — the layout is resolved once per distinct header."""
+    header = _header(f)
+    key = hashlib.sha1(header.encode()).hexdigest()[:12]
+    if key not in _LAYOUTS:
+        _LAYOUTS[key] = resolve_layout(f, header)
+    return key, header, _LAYOUTS[key]
+
+def _report_unknown(unknown: dict):
+    print(f"[warn] Skipped {sum(len(v[1]) for v in unknown.values())} load file(s) "
+          f"with {len(unknown)} unrecognised header layout(s):")
+    for key, (header, fs) in unknown.items():
+        print(f"  {key}  {len(fs)} file(s), e.g. {os.path.basename(fs[0])}\n      header: {header}")
+    print(f"  Known names: date {DATE_KEYS}, load {LOAD_KEYS} (or numeric zone columns)")
+
+def _posted(f: str):
+    # cdr.00014836.0000000000000000.20240101.055000.ACTUALSYSLOADFZNP6346.csv → "20240101"
+    m = re.search(r"\.(\d{8})\.\d{6}\.", os.path.basename(f))
+    return m.group(1) if m else None
+
+def raw_inputs(year=None) -> List[str]:
+    flat = sorted(glob.glob(os.path.join(RAW_DIR, "*.csv")))
+    if year is None:
+        return flat
+    # each posting carries the previous operating day, so year Y spans the
+    # postings from Y-01-02 to (Y+1)-01-01 (the last one sits in the next year's folder)
+    cand = (flat + glob.glob(os.path.join(RAW_DIR, str(year), "*.csv"))
+                 + glob.glob(os.path.join(RAW_DIR, str(year + 1), "*.csv")))
+    lo, hi = f"{year}0102", f"{year + 1}0101"
+    return sorted(set(f for f in cand if _posted(f) is None or lo <= _posted(f) <= hi))
+
+def load_and_clean(year=None) -> pd.DataFrame:
+    files = raw_inputs(year)
     if not files:
-        raise FileNotFoundError(f"No CSVs under {RAW_DIR}")
-
-    dfs = []
-    for f in files:
-        df = pd.read_csv(f)
-        norm = _norm_cols(df)
-
-        date_col = _pick_first(norm, ["operday","date","delivery date","operating day"])   # date/hour columns
-        hour_col = _pick_first(norm, ["hourending","delivery hour","hour"])
-
-        if not date_col:
-            raise KeyError(f"No date column found in {f}. Have: {list(df.columns)}")
-
-        load_col = _pick_first(norm, ["total","system load","load (mw)","load","actual load (mw)"])
-
-        tmp = df.copy()
-        tmp[date_col] = pd.to_datetime(tmp[date_col])
-
-        if load_col:
-            tmp.rename(columns={date_col: "date", load_col: "Load"}, inplace=True)
-            keep = ["date"]
-            if hour_col:
-                tmp.rename(columns={hour_col: "hour"}, inplace=True)
-                keep.append("hour")
-            keep.append("Load")
-            tmp = tmp[keep]
-        else:
-            ignore = {date_col}  # sum all numeric zone columns except none
-            if hour_col: 
-                ignore.add(hour_col)
-            ignore |= set([_pick_first(norm, ["dstflag"]), _pick_first(norm, ["timezone"])]) - {None}
-            zone_cols = _numeric_zone_cols(df, ignore=list(ignore))
-            if not zone_cols:
-                raise KeyError(f"No load or zone numeric columns found in {f}. Have: {list(df.columns)}")
-            tmp = tmp[[date_col] + ([hour_col] if hour_col else []) + zone_cols].copy()
-            tmp.rename(columns={date_col: "date"}, inplace=True)
-            if hour_col:
-                tmp.rename(columns={hour_col: "hour"}, inplace=True)
-            tmp["Load"] = tmp[zone_cols].sum(axis=1)
-
-        dfs.append(tmp[["date","Load"]])
-
-    big = pd.concat(dfs, ignore_index=True)
-
-    daily = (big.groupby("date", as_index=False)["Load"] # daily average in MW
-                 .mean()
-                 .rename(columns={"Load": "Load_t"})
-                 .sort_values("date"))
-
-    os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
-    daily.to_csv(OUT_PATH, index=False)
-    print(f"Successfuly Saved: {OUT_PATH} (rows={len(daily)})")
+        raise FileNotFoundError(f"No CSVs under {RAW_DIR}" + (f" for {year}" if year else ""))
+
+    with span("parse", stage="load", year=year) as sp:
+        sp.read(*files)
+        dfs = []
+        unknown = {}
+        for f in files:
+            key, header, lay = layout_for(f)
+            if lay is None:
+                unknown.setdefault(key, (header, []))[1].append(f)
+                continue
+            df = pd.read_csv(f, usecols=[lay["date"]] + lay["load"],
+                             dtype={c: "float64" for c in lay["load"]})
+            load = df[lay["load"][0]] if len(lay["load"]) == 1 else df[lay["load"]].sum(axis=1)
+            dfs.append(pd.DataFrame({"date": df[lay["date"]], "Load": load}))
+
+        if unknown:
+            _report_unknown(unknown)
+        if not dfs:
+            raise KeyError(f"No load file under {RAW_DIR} has a recognised header layout")
+        sp.attrs["layouts"] = sum(v is not None for v in _LAYOUTS.values())
+
+        big = pd.concat(dfs, ignore_index=True)
+        big["date"] = pd.to_datetime(big["date"])  # once for all files (repeated strings are cached)
+        if year is not None:
+            big = big[big["date"].dt.year == year]
+        sp.rows_out = len(big)
+
+    # one row per hour: DST days should have 23/25 rows, every other day 24
+    dst = check_day_lengths(big["date"])
+    if len(dst):
+        print(f"[warn] Load day lengths: {summarize(dst)}")
+
+    with span("groupby", stage="load", rows_in=len(big), year=year) as sp:
+        daily = (big.groupby("date", as_index=False)["Load"] # daily average in MW
+                     .mean()
+                     .rename(columns={"Load": "Load_t"})
+                     .sort_values("date"))
+        sp.rows_out = len(daily)
+
+    with span("write", stage="load", rows_in=len(daily), year=year) as sp:
+        years = write_series("load", daily, optional=year is None)
+        sp.wrote(*lake_files("load", years))
+        if year is None:
+            os.makedirs(os.path.dirname(OUT_PATH), exist_ok=True)
+            daily.to_csv(OUT_PATH, index=False)
+            sp.wrote(OUT_PATH)
+    print(f"Successfuly Saved: {OUT_PATH if year is None else 'load lake'} {years} (rows={len(daily)})")
     return daily
 
 if __name__ == "__main__":
@@ -0,0 +1,273 @@
+'''
+---------------------------------------------------------------
+Incremental intraday aggregation of 15-minute RTM prices
+---------------------------------------------------------------
+
+    python -m DataCleaning.price_stream DataScraping/Rawdata/price/intervals --poll 60 --query HB_BUSAVG
+
+Same aggregation as Price_Clean.clean_price (interval → hourly mean → daily mean of
+the hourly means), kept up to date one settlement-interval file at a time instead of
+re-reading the annual workbook. State is a few dense NumPy arrays indexed by
+[settlement point, day since origin, hour]:
+
+    hour_sum / hour_cnt      running sum and count of interval prices per hour
+    day_hmean / day_hours    sum of the hourly means per day, and hours with data
+    month_dmean / month_days sum of the daily means per month, and days with data
+
+Each ingest touches only the cells of the new rows and rolls the change of the hour
+mean up to its day and the change of the day mean up to its month, so
+hourly(), daily() and month_to_date() are O(1) lookups. The state is checkpointed
+to one .npz (written atomically), together with the names of the files already
+ingested, so a restart resumes where it stopped and never counts a file twice.
+'''
+
+import argparse
+import glob
+import json
+import os
+import time
+from pathlib import Path
+import numpy as np
+import pandas as pd
+from instrumentation import span
+
+CHECKPOINT = "DataCleaning/price_stream.npz"
+PATTERNS = ("*.csv", "*.zip")  # ERCOT posts each interval as a zipped CSV
+
+# workbook headers ("Delivery Date") and interval-file headers ("DeliveryDate") both map here
+COLUMNS = {
+    "date": "deliverydate",
+    "hour": "deliveryhour",
+    "point": "settlementpointname",
+    "price": "settlementpointprice",
+}
+
+def _columns(df: pd.DataFrame) -> dict:
+    norm = {c.lower().replace(" ", "").replace("_", ""): c for c in df.columns}
+    missing = [v for v in COLUMNS.values() if v not in norm]
+    if missing:
+        raise KeyError(f"Interval data is missing {missing}. Have: {list(df.columns)}")
+    return {k: norm[v] for k, v in COLUMNS.items()}
+
+def _mean(s, n):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(n > 0, s / np.maximum(n, 1), np.nan)
+
+class PriceAggregator:
+    """Running hourly/daily/month-to-date prices per settlement point."""
+
+    def __init__(self, origin=None, hubs=None, days: int = 366, points: int = 16):
+        # origin: first day of the day axis (Jan 1 of the first date seen if None)
+        self.origin = None if origin is None else np.datetime64(origin, "D")
+        self.hubs = None if hubs is None else set(hubs)
+        self.points = []
+        self._pidx = {}
+        self.ingested = []
+        self.last_day = -1
+        self.n_rows = 0
+        self._alloc(points, days)
+
+    # ---------- storage ----------
+    def _alloc(self, n_points: int, n_days: int):
+        self.hour_sum = np.zeros((n_points, n_days, 24))
+        self.hour_cnt = np.zeros((n_points, n_days, 24), dtype=np.int32)
+        self.day_hmean = np.zeros((n_points, n_days))
+        self.day_hours = np.zeros((n_points, n_days), dtype=np.int16)
+        n_months = self._month_of(np.array([n_days - 1]))[0] + 1 if self.origin is not None else 13
+        self.month_dmean = np.zeros((n_points, n_months))
+        self.month_days = np.zeros((n_points, n_months), dtype=np.int16)
+
+    def _ensure(self, n_points: int, n_days: int):
+        '''Grow (doubling) so indices < n_points / n_days fit; amortised O(1) per row.'''
+        P, D = self.hour_sum.shape[:2]
+        if n_points <= P and n_days <= D:
+            return
+        old = {k: getattr(self, k) for k in ("hour_sum", "hour_cnt", "day_hmean",
+                                             "day_hours", "month_dmean", "month_days")}
+        self._alloc(P if n_points <= P else max(2 * P, n_points),
+                    D if n_days <= D else max(2 * D, n_days))
+        for k, a in old.items():
+            getattr(self, k)[tuple(slice(0, s) for s in a.shape)] = a
+
+    def _month_of(self, day_idx: np.ndarray) -> np.ndarray:
+        dates = self.origin + day_idx.astype("timedelta64[D]")
+        return (dates.astype("datetime64[M]") - self.origin.astype("datetime64[M]")).astype(np.int64)
+
+    def _point_ids(self, names: np.ndarray) -> np.ndarray:
+        codes, uniques = pd.factorize(names)
+        ids = np.empty(len(uniques), dtype=np.int64)
+        for i, name in enumerate(uniques):  # only the distinct names of this batch
+            if name not in self._pidx:
+                self._pidx[name] = len(self.points)
+                self.points.append(name)
+            ids[i] = self._pidx[name]
+        return ids[codes]
+
+    # ---------- updates ----------
+    def ingest_frame(self, df: pd.DataFrame) -> int:
+        '''Add a batch of interval rows (any number of points, hours and days).'''
+        c = _columns(df)
+        if self.hubs is not None:
+            df = df[df[c["point"]].isin(self.hubs)]
+        if df.empty:
+            return 0
+
+        dates = pd.to_datetime(df[c["date"]]).to_numpy().astype("datetime64[D]")
+        if self.origin is None:
+            self.origin = dates.min().astype("datetime64[Y]").astype("datetime64[D]")
+            self._alloc(*self.hour_sum.shape[:2])
+        d = (dates - self.origin).astype(np.int64)
+        if d.min() < 0:
+            raise ValueError(f"Interval dates before the state origin {self.origin}")
+        h = df[c["hour"]].to_numpy(dtype=np.int64) - 1  # hour ending 1..24; the repeated DST hour joins its hour, as in clean_price
+        p = self._point_ids(df[c["point"]].to_numpy())
+        price = df[c["price"]].to_numpy(dtype=float)
+        self._ensure(int(p.max()) + 1, int(d.max()) + 1)
+        P, D, _ = self.hour_sum.shape
+        M = self.month_dmean.shape[1]
+
+        # hours: running sums, and how much each touched hour's mean moved
+        cell = (p * D + d) * 24 + h
+        ucell = np.unique(cell)
+        hs, hc = self.hour_sum.reshape(-1), self.hour_cnt.reshape(-1)
+        old_cnt = hc[ucell].copy()
+        old_mean = np.where(old_cnt > 0, hs[ucell] / np.maximum(old_cnt, 1), 0.0)
+        np.add.at(hs, cell, price)
+        np.add.at(hc, cell, 1)
+        new_mean = hs[ucell] / hc[ucell]
+
+        # days: move the sum of hourly means, count hours that just got their first value
+        uday_of_cell = ucell // 24
+        uday = np.unique(uday_of_cell)
+        dm, dh = self.day_hmean.reshape(-1), self.day_hours.reshape(-1)
+        old_dh = dh[uday].copy()
+        old_dmean = np.where(old_dh > 0, dm[uday] / np.maximum(old_dh, 1), 0.0)
+        np.add.at(dm, uday_of_cell, new_mean - old_mean)
+        np.add.at(dh, uday_of_cell, (old_cnt == 0).astype(dh.dtype))
+        new_dmean = dm[uday] / dh[uday]
+
+        # months: same roll-up from the daily means
+        month = (uday // D) * M + self._month_of(uday % D)
+        mm, md = self.month_dmean.reshape(-1), self.month_days.reshape(-1)
+        np.add.at(mm, month, new_dmean - old_dmean)
+        np.add.at(md, month, (old_dh == 0).astype(md.dtype))
+
+        self.last_day = max(self.last_day, int(d.max()))
+        self.n_rows += len(price)
+        return len(price)
+
+    def ingest_file(self, path) -> int:
+        n = self.ingest_frame(pd.read_csv(path))
+        self.ingested.append(os.path.basename(path))
+        return n
+
+    def poll(self, directory, patterns=PATTERNS) -> list:
+        '''Ingest files in `directory` not seen before, in name (= posting time) order.'''
+        seen = set(self.ingested)
+        new = sorted(f for pat in patterns for f in glob.glob(os.path.join(directory, pat))
+                     if os.path.basename(f) not in seen)
+        for f in new:
+            self.ingest_file(f)
+        return new
+
+    # ---------- O(1) queries ----------
+    def _day(self, day) -> int:
+        return self.last_day if day is None else int((np.datetime64(day, "D") - self.origin).astype(np.int64))
+
+    def hourly(self, point: str, day, hour_ending: int) -> float:
+        p, d = self._pidx[point], self._day(day)
+        return float(_mean(self.hour_sum[p, d, hour_ending - 1], self.hour_cnt[p, d, hour_ending - 1]))
+
+    def daily(self, point: str, day=None) -> float:
+        '''Price_t of `day` (default: the latest day seen) so far.'''
+        p, d = self._pidx[point], self._day(day)
+        return float(_mean(self.day_hmean[p, d], self.day_hours[p, d]))
+
+    def month_to_date(self, point: str, day=None) -> float:
+        '''Mean of the daily Price_t values of the month containing `day`.'''
+        p, m = self._pidx[point], int(self._month_of(np.array([self._day(day)]))[0])
+        return float(_mean(self.month_dmean[p, m], self.month_days[p, m]))
+
+    def daily_frame(self) -> pd.DataFrame:
+        '''
+        Exact daily table in the clean_price layout (settlement_point, date, Price_t),
+        recomputed from the hourly sums; ready for lake.write_series("price", ...).
+        '''
+        n, D = len(self.points), self.last_day + 1
+        cnt = self.hour_cnt[:n, :D]
+        hmean = np.nan_to_num(_mean(self.hour_sum[:n, :D], cnt))
+        hours = (cnt > 0).sum(axis=2)
+        price = hmean.sum(axis=2) / np.maximum(hours, 1)
+        p, d = np.nonzero(hours > 0)
+        return pd.DataFrame({
+            "settlement_point": np.asarray(self.points, dtype=object)[p],
+            "date": self.origin + d.astype("timedelta64[D]"),
+            "Price_t": price[p, d],
+        })
+
+    # ---------- checkpoint ----------
+    def save(self, path=CHECKPOINT) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        n, D = len(self.points), self.last_day + 1
+        M = int(self._month_of(np.array([max(D - 1, 0)]))[0]) + 1 if self.origin is not None else 0
+        meta = {"origin": None if self.origin is None else str(self.origin),
+                "hubs": None if self.hubs is None else sorted(self.hubs),
+                "points": self.points, "ingested": self.ingested,
+                "last_day": self.last_day, "n_rows": self.n_rows}
+        tmp = path.with_name(path.name + ".tmp")
+        with open(tmp, "wb") as f:  # file handle: np.savez would otherwise append ".npz"
+            np.savez(f, meta=np.array(json.dumps(meta)),
+                     hour_sum=self.hour_sum[:n, :D], hour_cnt=self.hour_cnt[:n, :D],
+                     day_hmean=self.day_hmean[:n, :D], day_hours=self.day_hours[:n, :D],
+                     month_dmean=self.month_dmean[:n, :M], month_days=self.month_days[:n, :M])
+        os.replace(tmp, path)
+        return path
+
+    @classmethod
+    def load(cls, path=CHECKPOINT) -> "PriceAggregator":
+        with np.load(path) as z:
+            meta = json.loads(str(z["meta"]))
+            agg = cls(origin=meta["origin"], hubs=meta["hubs"])
+            agg.points = meta["points"]
+            agg._pidx = {name: i for i, name in enumerate(agg.points)}
+            agg.ingested, agg.last_day, agg.n_rows = meta["ingested"], meta["last_day"], meta["n_rows"]
+            agg._ensure(max(len(agg.points), 1), max(agg.last_day + 1, 1))
+            for k in ("hour_sum", "hour_cnt", "day_hmean", "day_hours", "month_dmean", "month_days"):
+                a = z[k]
+                getattr(agg, k)[tuple(slice(0, s) for s in a.shape)] = a
+        return agg
+
+def watch(directory, checkpoint=CHECKPOINT, hubs=None, poll_s: float = 60.0,
+          once: bool = False, query=None):
+    '''Poll `directory` for new interval files, checkpoint after every batch.'''
+    agg = PriceAggregator.load(checkpoint) if os.path.exists(checkpoint) else PriceAggregator(hubs=hubs)
+    print(f"[info] Watching {directory} ({len(agg.ingested)} file(s) already in {checkpoint})")
+    while True:
+        with span("ingest", stage="price_stream") as sp:
+            new = agg.poll(directory)
+            sp.rows_out = len(new)
+        if new:
+            agg.save(checkpoint)
+            msg = f"[info] +{len(new)} file(s), {agg.n_rows} rows total"
+            if query and query in agg._pidx:
+                msg += (f" | {query} today {agg.daily(query):.2f}"
+                        f", month-to-date {agg.month_to_date(query):.2f}")
+            print(msg)
+        if once:
+            return agg
+        time.sleep(poll_s)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Incremental hourly/daily RTM price aggregates.")
+    ap.add_argument("directory", help="folder that receives the RTM interval files")
+    ap.add_argument("--checkpoint", default=CHECKPOINT)
+    ap.add_argument("--hub", action="append", help="settlement point to keep (repeatable; default all)")
+    ap.add_argument("--poll", type=float, default=60.0, help="seconds between directory scans")
+    ap.add_argument("--once", action="store_true", help="ingest what is there and exit")
+    ap.add_argument("--query", help="print today / month-to-date for this settlement point")
+    args = ap.parse_args(argv)
+    watch(args.directory, args.checkpoint, args.hub, args.poll, args.once, args.query)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+'''
+---------------------------------------------------------------
+Data-quality checks and repair policies for the cleaned panel
+---------------------------------------------------------------
+
+    clean, issues = run_quality(panel)                       # daily ALL_IN_ONE layout
+    clean, issues = run_quality(hourly, freq="h")            # adds the DST day-length check
+    clean, issues = run_quality(panel, policy={"negative_price": "keep", "outliers": "nan"})
+
+Checks: duplicate timestamps, gaps, DST 23/25-hour days (hourly data), values outside
+the plausible range of each cleaned column (unit mix-ups), rolling-MAD outliers,
+negative prices and, given the per-source dates, cross-source coverage. Flags are
+computed with whole-column NumPy/pandas operations and collapsed into runs, so the
+issues table has one row per contiguous stretch instead of one row per bad value.
+Everything is linear in the number of rows (rolling medians use a fixed window).
+On naive local hourly data the fall-back day's repeated hour is flagged "dst_repeat" and
+kept (never merged as a duplicate), and the hour a spring-forward day skips is not a gap.
+'''
+
+import sys
+import numpy as np
+import pandas as pd
+
+ISSUE_COLUMNS = ["check", "column", "start", "end", "rows", "severity", "detail", "action"]
+
+# plausible range of each cleaned column: (low, high, what a violation usually means)
+UNIT_RULES = {
+    "Price_t": (-251.0, 5001.0, "$/MWh outside the ERCOT offer floor/cap"),
+    "Load_t": (15_000.0, 120_000.0, "MW out of range; kW or GW would be off by 1000x"),
+    "CDD_t": (0.0, 60.0, "degree-days out of range; tenths of °F would be ~10x"),
+    "HDD_t": (0.0, 80.0, "degree-days out of range; tenths of °F would be ~10x"),
+    "RenewableShare_t": (0.0, 1.0, "share outside [0, 1]; percent instead of fraction?"),
+}
+PRICE_COL = "Price_t"
+
+POLICY_CHOICES = {
+    "duplicates": ("mean", "first", "drop"),
+    "gaps": ("flag", "interpolate"),
+    "units": ("flag", "nan", "drop"),
+    "negative_price": ("drop", "keep", "clip"),
+    "outliers": ("flag", "nan", "clip", "drop"),
+}
+# negative_price=drop keeps what data_loader always did; ERCOT does clear below zero,
+# so "keep" is the better choice once the model can handle it
+DEFAULT_POLICY = {
+    "duplicates": "mean",
+    "gaps": "flag",
+    "units": "flag",
+    "negative_price": "drop",
+    "outliers": "flag",
+}
+MAD_WINDOW = 31
+MAD_K = 6.0
+
+def parse_policy(items) -> dict:
+    '''["negative_price=keep", "outliers=nan"] → full policy dict (defaults filled in).'''
+    policy = dict(DEFAULT_POLICY)
+    for item in items or []:
+        key, _, value = item.partition("=")
+        if key not in POLICY_CHOICES:
+            raise KeyError(f"Unknown policy {key!r}; choose from {list(POLICY_CHOICES)}")
+        if value not in POLICY_CHOICES[key]:
+            raise ValueError(f"Policy {key}={value!r} not in {POLICY_CHOICES[key]}")
+        policy[key] = value
+    return policy
+
+# ---------- helpers ----------
+def _runs(mask):
+    '''Start/end positions (inclusive) of each stretch of True in a boolean array.'''
+    m = np.asarray(mask, dtype=np.int8)
+    edges = np.diff(np.concatenate(([0], m, [0])))
+    return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1) - 1
+
+def _issues(check, column, ts, mask, severity, detail, action) -> pd.DataFrame:
+    starts, ends = _runs(mask)
+    ts = np.asarray(ts)
+    return pd.DataFrame({
+        "check": check, "column": column,
+        "start": ts[starts], "end": ts[ends], "rows": ends - starts + 1,
+        "severity": severity, "detail": detail, "action": action,
+    }, columns=ISSUE_COLUMNS)
+
+def _value_cols(df: pd.DataFrame, ts: str) -> list:
+    return [c for c in df.columns if c != ts and pd.api.types.is_numeric_dtype(df[c])]
+
+def dst_days(years) -> tuple:
+    '''US DST dates (2007+ rules): 2nd Sunday of March (23 h) and 1st Sunday of November (25 h).'''
+    years = np.asarray(sorted(set(years)))
+    mar1 = pd.to_datetime([f"{y}-03-01" for y in years])
+    nov1 = pd.to_datetime([f"{y}-11-01" for y in years])
+    spring = mar1 + pd.to_timedelta((6 - mar1.dayofweek) % 7 + 7, unit="D")
+    fall = nov1 + pd.to_timedelta((6 - nov1.dayofweek) % 7, unit="D")
+    return spring, fall
+
+def _step(freq) -> pd.Timedelta:
+    '''Fixed length of `freq` ("D", "h", "15min"). pandas 3 no longer treats Day as a Tick.'''
+    off = pd.tseries.frequencies.to_offset(freq)
+    if isinstance(off, pd.offsets.Day):
+        return pd.Timedelta(days=off.n)
+    if isinstance(off, pd.offsets.Tick):
+        return pd.Timedelta(off)
+    raise ValueError(f"freq {freq!r} has no fixed length; use days, hours or minutes")
+
+def _naive_sub_daily(ts: pd.Series, freq: str) -> bool:
+    # DST only shows up in naive local wall-clock stamps finer than a day
+    return _step(freq) < pd.Timedelta("1D") and ts.dt.tz is None
+
+def dst_repeat_mask(ts: pd.Series) -> np.ndarray:
+    '''
+    Naive local timestamps in the repeated hour of a fall-back day (01:00–02:00, so both
+    hour-beginning and hour-ending stamps) that occur exactly twice: the clock really
+    shows them twice, so they are not duplicates.
+    '''
+    if ts.empty:
+        return np.zeros(0, dtype=bool)
+    _, fall = dst_days(ts.dt.year.unique())
+    day = ts.dt.normalize()
+    in_hour = day.isin(fall) & (ts >= day + pd.Timedelta("1h")) & (ts <= day + pd.Timedelta("2h"))
+    return (in_hour & (ts.groupby(ts).transform("size") == 2)).to_numpy()
+
+def _spring_hole(start: pd.DatetimeIndex, end: pd.DatetimeIndex) -> np.ndarray:
+    '''Gaps that are just the wall-clock hour skipped on a spring-forward day (02:00–03:00).'''
+    spring, _ = dst_days(start.year)
+    day = start.normalize()
+    return np.asarray(day.isin(spring) & (end.normalize() == day)
+                      & (start >= day + pd.Timedelta("2h")) & (end <= day + pd.Timedelta("3h")))
+
+# ---------- checks (flag only) ----------
+def check_duplicates(ts: pd.Series, ignore=None) -> pd.DataFrame:
+    '''Repeated timestamps; rows in `ignore` (e.g. dst_repeat_mask) are not counted.'''
+    mask = ts.duplicated(keep=False).to_numpy()
+    if ignore is not None:
+        mask = mask & ~ignore
+    return _issues("duplicates", ts.name, ts, mask, "warn", "repeated timestamp", "flagged")
+
+def check_gaps(ts: pd.Series, freq: str) -> pd.DataFrame:
+    '''One row per hole in a sorted, de-duplicated timestamp column.'''
+    step = _step(freq)
+    t = ts.to_numpy()
+    if len(t) < 2:
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+    diffs = np.diff(t)
+    at = np.flatnonzero(diffs > step.to_timedelta64())
+    start, end = t[at] + step.to_timedelta64(), t[at + 1] - step.to_timedelta64()
+    if _naive_sub_daily(ts, freq):  # the hour a spring-forward day never has is not missing
+        real = ~_spring_hole(pd.DatetimeIndex(start), pd.DatetimeIndex(end))
+        at, start, end = at[real], start[real], end[real]
+    missing = (diffs[at] // step.to_timedelta64()).astype(int) - 1
+    return pd.DataFrame({
+        "check": "gaps", "column": ts.name,
+        "start": start, "end": end,
+        "rows": missing, "severity": "warn",
+        "detail": [f"{m} missing {freq} step(s)" for m in missing], "action": "flagged",
+    }, columns=ISSUE_COLUMNS)
+
+def check_day_lengths(ts: pd.Series) -> pd.DataFrame:
+    '''
+    Hourly data: every local day should have 24 rows, the spring-forward day 23 and
+    the fall-back day 25. A 24-hour DST day usually means the repeated hour was
+    averaged away (or the skipped one invented) upstream.
+    '''
+    counts = ts.dt.normalize().value_counts(sort=False).sort_index()
+    if counts.empty:
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+    spring, fall = dst_days(counts.index.year)
+    expected = pd.Series(24, index=counts.index)
+    expected[counts.index.isin(spring)] = 23
+    expected[counts.index.isin(fall)] = 25
+    bad = counts != expected
+    days = counts.index[bad.to_numpy()]
+    return pd.DataFrame({
+        "check": "day_length", "column": ts.name, "start": days, "end": days, "rows": counts[bad].to_numpy(),
+        "severity": np.where(expected[bad] != 24, "warn", "error"),
+        "detail": [f"{c} hours, expected {e}" for c, e in zip(counts[bad], expected[bad])],
+        "action": "flagged",
+    }, columns=ISSUE_COLUMNS)
+
+def unit_masks(df: pd.DataFrame) -> dict:
+    out = {}
+    for col, (lo, hi, _) in UNIT_RULES.items():
+        if col in df.columns:
+            x = df[col].to_numpy(dtype=float)
+            out[col] = (x < lo) | (x > hi)
+    return out
+
+def rolling_band(s: pd.Series, window: int = MAD_WINDOW):
+    '''Centred rolling median and rolling MAD (scaled to a normal sigma).'''
+    minp = window // 2 + 1
+    s = s.astype(float)
+    med = s.rolling(window, center=True, min_periods=minp).median()
+    mad = (s - med).abs().rolling(window, center=True, min_periods=minp).median() * 1.4826
+    return med, mad
+
+def outlier_masks(df: pd.DataFrame, cols, window: int = MAD_WINDOW, k: float = MAD_K) -> dict:
+    '''
+    Robust z-score against a centred rolling median, scaled by a rolling median of
+    absolute deviations (Hampel-style). Windows with MAD == 0 never flag.
+    '''
+    out = {}
+    for col in cols:
+        med, mad = rolling_band(df[col], window)
+        dev = (df[col].astype(float) - med).abs()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            z = (dev / mad).to_numpy()
+        out[col] = np.nan_to_num(z, nan=0.0, posinf=0.0) > k
+    return out
+
+def check_coverage(dates_by_source: dict) -> pd.DataFrame:
+    '''
+    Dates present in some sources but not in others (an inner join drops them
+    silently). One row per contiguous stretch missing from each source.
+    '''
+    norm = {k: pd.DatetimeIndex(pd.to_datetime(v)).normalize().unique() for k, v in dates_by_source.items()}
+    if not norm:
+        return pd.DataFrame(columns=ISSUE_COLUMNS)
+    union = norm[next(iter(norm))]
+    for idx in norm.values():
+        union = union.union(idx)
+    parts = [_issues("coverage", src, union, ~union.isin(idx), "warn",
+                     f"dates missing from {src}, dropped by the merge", "flagged")
+             for src, idx in norm.items()]
+    return pd.concat(parts, ignore_index=True)
+
+# ---------- the stage ----------
+def run_quality(df: pd.DataFrame, ts: str = "date", freq: str = "D", policy=None,
+                coverage: dict | None = None, price_col: str = PRICE_COL):
+    '''
+    Validate `df` once and apply `policy` (see DEFAULT_POLICY / POLICY_CHOICES).
+    Returns (repaired frame, issues table). Every issue row says what was done to it.
+    '''
+    policy = {**DEFAULT_POLICY, **(policy or {})}
+    issues = []
+
+    df = df.copy()
+    df[ts] = pd.to_datetime(df[ts])
+    if not df[ts].is_monotonic_increasing:  # already sorted on every normal run
+        df = df.sort_values(ts, kind="stable")
+    df = df.reset_index(drop=True)
+    values = _value_cols(df, ts)
+
+    # DST day lengths need the raw rows, before repeated hours are merged
+    if _step(freq) < pd.Timedelta("1D"):
+        issues.append(check_day_lengths(df[ts]))
+
+    # the fall-back day's repeated hour is real data: flagged, never merged as duplicates
+    dst = dst_repeat_mask(df[ts]) if _naive_sub_daily(df[ts], freq) else np.zeros(len(df), dtype=bool)
+    if dst.any():
+        issues.append(_issues("dst_repeat", ts, df[ts], dst, "info",
+                              "repeated fall-back hour (DST), not a duplicate", "kept"))
+
+    dup = check_duplicates(df[ts], ignore=dst)
+    if len(dup):
+        issues.append(dup.assign(action=policy["duplicates"]))
+        rest = df[~dst]
+        if policy["duplicates"] == "mean":  # numeric columns averaged, the rest keep the first value
+            how = {c: "mean" if c in values else "first" for c in df.columns if c != ts}
+            rest = rest.groupby(ts, as_index=False, sort=False).agg(how)
+        elif policy["duplicates"] == "first":
+            rest = rest.drop_duplicates(ts, keep="first")
+        else:
+            rest = rest[~rest[ts].duplicated(keep=False)]
+        df = pd.concat([rest, df[dst]]).sort_values(ts, kind="stable") if dst.any() else rest
+        df = df.reset_index(drop=True)
+
+    gaps = check_gaps(df[ts], freq)
+    if len(gaps):
+        issues.append(gaps.assign(action=policy["gaps"]))
+        if policy["gaps"] == "interpolate":  # add the missing steps only (kept DST repeats stay as they are)
+            fill = np.concatenate([pd.date_range(a, b, freq=freq).to_numpy()
+                                   for a, b in zip(gaps["start"], gaps["end"])])
+            df = pd.concat([df, pd.DataFrame({ts: fill})], ignore_index=True)
+            df = df.sort_values(ts, kind="stable").reset_index(drop=True)
+            df[values] = df[values].interpolate(method="linear", limit_area="inside")
+
+    keep = np.ones(len(df), dtype=bool)
+    for col, mask in unit_masks(df).items():
+        if mask.any():
+            issues.append(_issues("units", col, df[ts], mask, "error", UNIT_RULES[col][2], policy["units"]))
+            if policy["units"] == "nan":
+                df.loc[mask, col] = np.nan
+            elif policy["units"] == "drop":
+                keep &= ~mask
+
+    if price_col in df.columns:
+        neg = (df[price_col] < 0).to_numpy()
+        if neg.any():
+            issues.append(_issues("negative_price", price_col, df[ts], neg, "info",
+                                  "price below zero (legal in ERCOT)", policy["negative_price"]))
+            if policy["negative_price"] == "drop":
+                keep &= ~neg
+            elif policy["negative_price"] == "clip":
+                df.loc[neg, price_col] = 0.0
+
+    for col, mask in outlier_masks(df, values).items():
+        if mask.any():
+            issues.append(_issues("outliers", col, df[ts], mask, "warn",
+                                  f"robust z > {MAD_K:g} vs rolling {MAD_WINDOW}-step median",
+                                  policy["outliers"]))
+            if policy["outliers"] == "nan":
+                df.loc[mask, col] = np.nan
+            elif policy["outliers"] == "clip":  # pull back to the edge of the median ± k·MAD band
+                med, mad = rolling_band(df[col])
+                df.loc[mask, col] = df[col].clip(med - MAD_K * mad, med + MAD_K * mad)[mask]
+            elif policy["outliers"] == "drop":
+                keep &= ~mask
+
+    if coverage:
+        issues.append(check_coverage(coverage))
+
+    df = df[keep].reset_index(drop=True)
+    issues = [i for i in issues if len(i)]
+    table = pd.concat(issues, ignore_index=True) if issues else pd.DataFrame(columns=ISSUE_COLUMNS)
+    return df, table
+
+def summarize(issues: pd.DataFrame) -> str:
+    if issues.empty:
+        return "no data-quality issues"
+    by = issues.groupby("check")["rows"].sum()
+    return f"{len(issues)} issue(s): " + ", ".join(f"{k}={int(v)} row(s)" for k, v in by.items())
+
+def main(argv=None):
+    # python -m DataCleaning.quality DataCleaning/ALL_IN_ONE.csv [issues.csv] [--policy key=value ...]
+    argv = sys.argv[1:] if argv is None else list(argv)
+    items = []
+    while "--policy" in argv:
+        i = argv.index("--policy")
+        items.append(argv[i + 1])
+        del argv[i:i + 2]
+    src = argv[0] if argv else "DataCleaning/ALL_IN_ONE.csv"
+    out = argv[1] if len(argv) > 1 else src.rsplit(".", 1)[0] + ".issues.csv"
+    _, issues = run_quality(pd.read_csv(src), policy=parse_policy(items))
+    issues.to_csv(out, index=False)
+    print(f"[done] {summarize(issues)} → {out}")
+
+if __name__ == "__main__":
+    main()
@@ -2,9 +2,12 @@ import os
 import re
 import pandas as pd
 import numpy as np
+from instrumentation import span
+from DataCleaning.lake import write_series, files
 
 XLSX = "DataScraping/Rawdata/RenewableShare/IntGenbyFuel2024.xlsx"
-OUT  = "DataCleaning/price/RenewableShare_Clean.csv"
+XLSX_YEAR = "DataScraping/Rawdata/RenewableShare/IntGenbyFuel{year}.xlsx"
+OUT  = "DataCleaning/RenewableShare_Clean.csv"
 MONTHS = ["Jan","Feb","Mar","Apr","May","Jun","Jul","Aug","Sep","Oct","Nov","Dec"]
 
 def find_header_row(df: pd.DataFrame):
@@ -56,41 +59,58 @@ def parse_month(xl: pd.ExcelFile, sheet: str) -> pd.DataFrame:
 
     return out[["date","fuel","total"]]
 
-def main():
-    if not os.path.exists(XLSX):
-        raise FileNotFoundError(f"Not found: {XLSX}")
-
-    xl = pd.ExcelFile(XLSX)
-    parts = []
-    for s in xl.sheet_names:
-        if s in MONTHS:
-            part = parse_month(xl, s)
-            if not part.empty:
-                parts.append(part)
-
-    if not parts:
-        raise RuntimeError("No usable monthly sheets parsed (Jan..Dec).")
-
-    df = pd.concat(parts, ignore_index=True)
-
-    daily_total = df.groupby("date", as_index=False)["total"].sum().rename(columns={"total":"total_gen"})  #putem together
-    wind_total  = (df[df["fuel"].str.contains("wind")]
-                   .groupby("date", as_index=False)["total"].sum()
-                   .rename(columns={"total":"wind"}))
-    solar_total = (df[df["fuel"].str.contains("solar")]
-                   .groupby("date", as_index=False)["total"].sum()
-                   .rename(columns={"total":"solar"}))
-
-    merged = daily_total.merge(wind_total, on="date", how="left").merge(solar_total, on="date", how="left")
-    merged[["wind","solar"]] = merged[["wind","solar"]].fillna(0.0)
-    merged["RenewableShare_t"] = np.where(merged["total_gen"]>0,
-                                          (merged["wind"] + merged["solar"]) / merged["total_gen"],
-                                          np.nan)
-    result = merged[["date","RenewableShare_t"]].sort_values("date")
-
-    os.makedirs(os.path.dirname(OUT), exist_ok=True)
-    result.to_csv(OUT, index=False)
+def raw_inputs(year=None) -> list:
+    return [XLSX if year is None else XLSX_YEAR.format(year=year)]
+
+def main(year=None):
+    xlsx = raw_inputs(year)[0]
+    if not os.path.exists(xlsx):
+        raise FileNotFoundError(f"Not found: {xlsx}")
+
+    with span("parse", stage="renewables", year=year) as sp:
+        sp.read(xlsx)
+        xl = pd.ExcelFile(xlsx)
+        parts = []
+        for s in xl.sheet_names:
+            if s in MONTHS:
+                part = parse_month(xl, s)
+                if not part.empty:
+                    parts.append(part)
+
+        if not parts:
+            raise RuntimeError("No usable monthly sheets parsed (Jan..Dec).")
+
+        df = pd.concat(parts, ignore_index=True)
+        if year is not None:
+            df = df[pd.to_datetime(df["date"]).dt.year == year]
+        sp.rows_out = len(df)
+
+    with span("groupby", stage="renewables", rows_in=len(df), year=year) as sp:
+        daily_total = df.groupby("date", as_index=False)["total"].sum().rename(columns={"total":"total_gen"})  #putem together
+        wind_total  = (df[df["fuel"].str.contains("wind")]
+                       .groupby("date", as_index=False)["total"].sum()
+                       .rename(columns={"total":"wind"}))
+        solar_total = (df[df["fuel"].str.contains("solar")]
+                       .groupby("date", as_index=False)["total"].sum()
+                       .rename(columns={"total":"solar"}))
+
+        merged = daily_total.merge(wind_total, on="date", how="left").merge(solar_total, on="date", how="left")
+        merged[["wind","solar"]] = merged[["wind","solar"]].fillna(0.0)
+        merged["RenewableShare_t"] = np.where(merged["total_gen"]>0,
+                                              (merged["wind"] + merged["solar"]) / merged["total_gen"],
+                                              np.nan)
+        result = merged[["date","RenewableShare_t"]].sort_values("date")
+        sp.rows_out = len(result)
+
+    with span("write", stage="renewables", rows_in=len(result), year=year) as sp:
+        years = write_series("renewables", result, optional=year is None)
+        sp.wrote(*files("renewables", years))
+        if year is None:
+            os.makedirs(os.path.dirname(OUT), exist_ok=True)
+            result.to_csv(OUT, index=False)
+            sp.wrote(OUT)
     print(f"Success")
+    return years
 
 if __name__ == "__main__":
     main()
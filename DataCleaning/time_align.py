@@ -0,0 +1,298 @@
+'''
+---------------------------------------------------------------
+Hourly, DST-correct alignment of price, load, fuel mix, weather
+---------------------------------------------------------------
+
+    python -m DataCleaning.time_align                     # legacy 2024 inputs, HB_BUSAVG
+    python -m DataCleaning.time_align --year 2023 --hub HB_HOUSTON
+
+Every ERCOT source labels time as (operating day, hour ending) in Central prevailing
+time: hours run 01:00 ... 24:00, the spring-forward day has no HE03 and the fall-back
+day has HE02 twice, the second one flagged (DSTFlag / Repeated Hour Flag = "Y").
+to_utc() turns those labels into the UTC start of each interval in one vectorized
+tz_localize, so "24:00" is simply the last hour of its own day and the repeated HE02
+gets its own UTC hour instead of being averaged into the first one.
+
+price_hourly / load_hourly / fuel_hourly keep the intraday detail the daily cleaners
+average away. hourly_panel() joins them on ts_utc with sorted merge_asof joins and
+broadcasts the daily CDD/HDD onto every hour of its local day:
+
+    ts_utc, ts_local, date, Price_h, Load_h, RenewableShare_h, CDD_t, HDD_t
+'''
+
+import argparse
+import csv
+import os
+import re
+import numpy as np
+import pandas as pd
+from instrumentation import span
+from DataCleaning import Price_Clean, load_clean, renew_share_clean
+from DataCleaning.lake import DEFAULT_HUB, read_series, years_available
+from DataCleaning.quality import check_day_lengths, check_duplicates, summarize
+
+CENTRAL = "America/Chicago"  # ERCOT publishes everything in Central prevailing time
+OUT_PATH = "DataCleaning/ALL_IN_ONE_hourly.csv"
+WEATHER_CSV = "DataCleaning/CDD_HDD_Clean.csv"
+# merge_asof tolerance: every source is keyed on the hour start, so only an exact hour
+# matches and a missing hour stays NaN instead of copying the previous one forward
+TOLERANCE = pd.Timedelta("59min")
+# fuel-mix interval columns: "0:15" ... "23:45" and a closing "0:00" (= 24:00), optionally
+# marked as the repeated hour; time-typed header cells come back as "00:15:00"
+INTERVAL_RE = re.compile(r"^\s*(\d{1,2}):(\d{2})(?::\d{2})?\s*(.*)$")
+
+def minutes_ending(label) -> np.ndarray:
+    '''Hour-ending labels (1, "01:00", "24:00", "1:15") → minutes after local midnight.'''
+    s = pd.Series(label)
+    if pd.api.types.is_numeric_dtype(s):
+        return s.to_numpy(dtype="int64") * 60
+    parts = s.astype(str).str.extract(r"(\d{1,2})(?::(\d{2}))?")
+    return (parts[0].astype("int64") * 60 + parts[1].fillna(0).astype("int64")).to_numpy()
+
+def repeated_hour(flag, keys: pd.DataFrame) -> np.ndarray:
+    '''
+    True for rows of the second (standard-time) pass through the fall-back hour.
+    Uses the file's flag column when there is one (DSTFlag "Y", or a timezone column
+    saying "CST"; outside the ambiguous hour the flag is ignored). Older files without
+    it list the repeated hour twice, so the later of two identical labels is the repeated one.
+    '''
+    if flag is not None:
+        return pd.Series(flag).astype(str).str.strip().str.upper().isin(["Y", "CST"]).to_numpy()
+    return keys.duplicated(keep="first").to_numpy()
+
+def to_utc(day, minutes_end, repeated, width: int = 60) -> pd.DatetimeIndex:
+    '''
+    UTC start of each interval that ends `minutes_end` minutes after local midnight
+    of `day` and lasts `width` minutes. Labels that do not exist locally (an HE03 on
+    the spring-forward day) come back as NaT.
+    '''
+    start = (pd.DatetimeIndex(pd.to_datetime(day))
+             + pd.to_timedelta(np.asarray(minutes_end) - width, unit="min"))
+    # ambiguous=True picks daylight time, i.e. the first pass through 01:00-02:00
+    local = start.tz_localize(CENTRAL, ambiguous=~np.asarray(repeated, dtype=bool),
+                              nonexistent="NaT")
+    return local.tz_convert("UTC")
+
+def _drop_nat(df: pd.DataFrame, source: str) -> pd.DataFrame:
+    bad = df["ts_utc"].isna()
+    if bad.any():
+        print(f"[warn] {source}: dropped {int(bad.sum())} row(s) labelled with a skipped DST hour")
+        df = df[~bad]
+    return df
+
+def _in_year(day: pd.Series, year) -> np.ndarray:
+    return np.ones(len(day), dtype=bool) if year is None else (day.dt.year == year).to_numpy()
+
+def price_hourly(year=None, hubs=Price_Clean.HUBS) -> pd.DataFrame:
+    '''Hourly mean of the 15-minute RTM prices: settlement_point, ts_utc, Price_h.'''
+    src = Price_Clean.raw_inputs(year)[0]
+    if not os.path.exists(src):
+        raise FileNotFoundError(f"Price file not found: {src}")
+
+    with span("parse", stage="price_hourly", year=year) as sp:
+        sp.read(src)
+        xls = pd.ExcelFile(src)
+        df = pd.concat(pd.read_excel(xls, sheet_name=s) for s in xls.sheet_names)
+        if hubs is not None:
+            df = df[df["Settlement Point Name"].isin(hubs)]
+        day = pd.to_datetime(df["Delivery Date"])
+        keep = _in_year(day, year)
+        df, day = df[keep], day[keep]
+        sp.rows_out = len(df)
+
+    with span("align", stage="price_hourly", rows_in=len(df), year=year) as sp:
+        hour = df["Delivery Hour"].to_numpy(dtype="int64")
+        if "Delivery Interval" in df.columns:
+            minutes, width = (hour - 1) * 60 + df["Delivery Interval"].to_numpy(dtype="int64") * 15, 15
+        else:
+            minutes, width = hour * 60, 60
+        flag = next((df[c] for c in ("Repeated Hour Flag", "DSTFlag") if c in df.columns), None)
+        rep = repeated_hour(flag, pd.DataFrame({"p": df["Settlement Point Name"].to_numpy(),
+                                                "d": day.to_numpy(), "m": minutes}))
+        ts = to_utc(day, minutes, rep, width)
+        out = pd.DataFrame({"settlement_point": df["Settlement Point Name"].to_numpy(),
+                            "ts_utc": ts.floor("h"),
+                            "Price_h": df["Settlement Point Price"].to_numpy(dtype="float64")})
+        out = _drop_nat(out, "price")
+        out = (out.groupby(["settlement_point", "ts_utc"], as_index=False, sort=False)["Price_h"].mean()
+                  .sort_values(["ts_utc", "settlement_point"], kind="stable")
+                  .reset_index(drop=True))
+        sp.rows_out = len(out)
+    return out
+
+def load_hourly(year=None) -> pd.DataFrame:
+    '''System load per hour (MW): ts_utc, Load_h. Same file discovery as load_clean.'''
+    files = load_clean.raw_inputs(year)
+    if not files:
+        raise FileNotFoundError(f"No CSVs under {load_clean.RAW_DIR}" + (f" for {year}" if year else ""))
+
+    with span("parse", stage="load_hourly", year=year) as sp:
+        sp.read(*files)
+        dfs = []
+        unknown = {}
+        for f in files:
+            key, header, lay = load_clean.layout_for(f)
+            norm = load_clean._norm_cols(next(csv.reader([header])))
+            hour_col = load_clean._pick_first(norm, load_clean.HOUR_KEYS)
+            if lay is None or hour_col is None:
+                unknown.setdefault(key, (header, []))[1].append(f)
+                continue
+            flag_col = load_clean._pick_first(norm, load_clean.FLAG_KEYS)
+            df = pd.read_csv(f, usecols=[lay["date"], hour_col] + lay["load"] + ([flag_col] if flag_col else []),
+                             dtype={c: "float64" for c in lay["load"]})
+            load = df[lay["load"][0]] if len(lay["load"]) == 1 else df[lay["load"]].sum(axis=1)
+            dfs.append(pd.DataFrame({"date": df[lay["date"]], "he": df[hour_col].astype(str),
+                                     "flag": df[flag_col] if flag_col else None, "Load_h": load}))
+
+        if unknown:
+            load_clean._report_unknown(unknown)
+        if not dfs:
+            raise KeyError(f"No load file under {load_clean.RAW_DIR} has a recognised header layout")
+
+        big = pd.concat(dfs, ignore_index=True)
+        big["date"] = pd.to_datetime(big["date"])
+        big = big[_in_year(big["date"], year)]
+        sp.rows_out = len(big)
+
+    with span("align", stage="load_hourly", rows_in=len(big), year=year) as sp:
+        minutes = minutes_ending(big["he"])
+        flag = big["flag"] if big["flag"].notna().any() else None
+        rep = repeated_hour(flag, pd.DataFrame({"d": big["date"].to_numpy(), "m": minutes}))
+        out = pd.DataFrame({"ts_utc": to_utc(big["date"], minutes, rep),
+                            "Load_h": big["Load_h"].to_numpy()})
+        out = _drop_nat(out, "load")
+        # overlapping postings repeat an hour; keep one value per hour
+        out = out.groupby("ts_utc", as_index=False)["Load_h"].mean()
+        sp.rows_out = len(out)
+    return out
+
+def _fuel_sheet(xl: pd.ExcelFile, sheet: str) -> pd.DataFrame:
+    '''One monthly sheet → long (date, minutes_end, repeated, fuel, mwh).'''
+    df = xl.parse(sheet, header=None).dropna(how="all").dropna(axis=1, how="all")
+    hdr = renew_share_clean.find_header_row(df) if not df.empty else None
+    if hdr is None:
+        return pd.DataFrame(columns=["date", "minutes", "repeated", "fuel", "mwh"])
+    head = df.iloc[hdr].astype(str).str.strip().tolist()
+    body = df.iloc[hdr + 1:]
+    lower = [h.lower() for h in head]
+    dates = pd.to_datetime(body.iloc[:, lower.index("date")], errors="coerce").to_numpy()
+    fuels = body.iloc[:, lower.index("fuel")].astype(str).str.strip().str.lower().to_numpy()
+
+    # interval columns by position: a second column with the same label, or a label
+    # with a trailing marker such as "(DST)" or "*", is the repeated fall-back hour
+    pos, minutes, repeated, seen = [], [], [], set()
+    for i, h in enumerate(head):
+        m = INTERVAL_RE.match(h)
+        if not m:
+            continue
+        mins = int(m.group(1)) * 60 + int(m.group(2))
+        if mins == 0 and pos:  # the day's last interval is labelled 0:00, not 24:00
+            mins = 24 * 60
+        pos.append(i)
+        minutes.append(mins)
+        repeated.append(bool(m.group(3)) or mins in seen)
+        seen.add(mins)
+    if not pos:
+        return pd.DataFrame(columns=["date", "minutes", "repeated", "fuel", "mwh"])
+
+    vals = body.iloc[:, pos].apply(pd.to_numeric, errors="coerce").to_numpy(dtype="float64")
+    n, k = vals.shape
+    return pd.DataFrame({
+        "date": np.repeat(dates, k),
+        "minutes": np.tile(minutes, n),
+        "repeated": np.tile(repeated, n),
+        "fuel": np.repeat(fuels, k),
+        "mwh": vals.ravel(),
+    })
+
+def fuel_intervals(year=None) -> pd.DataFrame:
+    '''Fuel-mix generation per 15-minute interval: ts_utc (interval start), fuel, mwh.'''
+    xlsx = renew_share_clean.raw_inputs(year)[0]
+    if not os.path.exists(xlsx):
+        raise FileNotFoundError(f"Not found: {xlsx}")
+
+    with span("parse", stage="fuel_hourly", year=year) as sp:
+        sp.read(xlsx)
+        xl = pd.ExcelFile(xlsx)
+        parts = [_fuel_sheet(xl, s) for s in xl.sheet_names if s in renew_share_clean.MONTHS]
+        long = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame()
+        if long.empty:
+            raise RuntimeError("No usable monthly sheets parsed (Jan..Dec).")
+        # the spring-forward day has empty cells for the skipped hour, other days
+        # for the repeated-hour columns
+        long = long.dropna(subset=["date", "mwh"])
+        long["date"] = pd.to_datetime(long["date"])
+        long = long[_in_year(long["date"], year)]
+        sp.rows_out = len(long)
+
+    with span("align", stage="fuel_hourly", rows_in=len(long), year=year) as sp:
+        ts = to_utc(long["date"], long["minutes"].to_numpy(), long["repeated"].to_numpy(), 15)
+        out = pd.DataFrame({"ts_utc": ts, "fuel": long["fuel"].to_numpy(), "mwh": long["mwh"].to_numpy()})
+        out = _drop_nat(out, "fuel mix")
+        sp.rows_out = len(out)
+    return out
+
+def fuel_hourly(year=None) -> pd.DataFrame:
+    '''Wind + solar share of generation per hour: ts_utc, RenewableShare_h.'''
+    long = fuel_intervals(year)
+    renew = long["fuel"].str.contains("wind|solar").to_numpy()
+    mwh = long["mwh"].to_numpy()
+    out = pd.DataFrame({"ts_utc": long["ts_utc"].dt.floor("h"), "total": mwh,
+                        "renew": np.where(renew, mwh, 0.0)})
+    hourly = out.groupby("ts_utc", as_index=False)[["total", "renew"]].sum()
+    hourly["RenewableShare_h"] = np.where(hourly["total"] > 0,
+                                          hourly["renew"] / hourly["total"], np.nan)
+    return hourly[["ts_utc", "RenewableShare_h"]]
+
+def weather_daily(start=None, end=None) -> pd.DataFrame:
+    '''Daily CDD_t/HDD_t from the lake, or from CDD_HDD_Clean.csv before the lake exists.'''
+    if years_available("weather"):
+        return read_series("weather", ["date", "CDD_t", "HDD_t"], start=start, end=end)
+    df = pd.read_csv(WEATHER_CSV, parse_dates=["date"])
+    lo = pd.Timestamp(start) if start is not None else df["date"].min()
+    hi = pd.Timestamp(end) if end is not None else df["date"].max()
+    return df[df["date"].between(lo, hi)].reset_index(drop=True)
+
+def hourly_panel(year=None, hub: str = DEFAULT_HUB, out_path=OUT_PATH) -> pd.DataFrame:
+    '''One row per UTC hour for `hub`, every source aligned on ts_utc.'''
+    panel = price_hourly(year, hubs=(hub,)).drop(columns="settlement_point")
+    load = load_hourly(year)
+    fuel = fuel_hourly(year)
+
+    with span("join", stage="hourly_panel", rows_in=len(panel), year=year) as sp:
+        for other in (load, fuel):  # all three are sorted on ts_utc already
+            panel = pd.merge_asof(panel, other, on="ts_utc", direction="backward", tolerance=TOLERANCE)
+
+        local = panel["ts_utc"].dt.tz_convert(CENTRAL)
+        panel.insert(1, "ts_local", local)
+        panel.insert(2, "date", local.dt.tz_localize(None).dt.normalize())
+
+        # daily weather: the same CDD/HDD on each hour of its local day
+        weather = weather_daily(panel["date"].min(), panel["date"].max())
+        panel = panel.merge(weather, on="date", how="left")
+        sp.rows_out = len(panel)
+
+    issues = pd.concat([check_duplicates(panel["ts_utc"]),
+                        check_day_lengths(panel["ts_local"].dt.tz_localize(None))],
+                       ignore_index=True)
+    if len(issues):
+        print(f"[warn] Hourly panel: {summarize(issues)}")
+
+    if out_path:
+        with span("write", stage="hourly_panel", rows_in=len(panel), year=year) as sp:
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+            panel.to_csv(out_path, index=False)
+            sp.wrote(out_path)
+        print(f"Successfuly Saved: {out_path} (rows={len(panel)})")
+    return panel
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Hourly price/load/fuel-mix/weather panel on a UTC index.")
+    ap.add_argument("--year", type=int, help="one year from the per-year raw folders (default: legacy inputs)")
+    ap.add_argument("--hub", default=DEFAULT_HUB)
+    ap.add_argument("--out", default=OUT_PATH)
+    args = ap.parse_args(argv)
+    hourly_panel(args.year, args.hub, args.out)
+
+if __name__ == "__main__":
+    main()
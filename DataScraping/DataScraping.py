@@ -7,16 +7,19 @@ Imports
 
 import os
 import logging
+import re
 import zipfile
 from io import BytesIO
 import time
 import pandas as pd
 import requests
-import glob
 from datetime import date
+from urllib.parse import urljoin
 import shutil
 from dotenv import load_dotenv
 
+from instrumentation import span
+
 '''
 ---------------------------------------------------------------
 Basic Setup
@@ -46,25 +49,70 @@ Function 1 — Fetch ERCOT Real-Time Market Prices (Price_t)
 '''
 
 '''
-ERCOT MIS download link for 2024 Real-Time Market
-Load Zone & Hub Settlement Point Prices (RTMLZHBSPP_2024.zip)
+ERCOT MIS download links for the yearly Real-Time Market
+Load Zone & Hub Settlement Point Prices (RTMLZHBSPP_<year>.zip).
+The doclookupId changes every year; years not listed here are looked up
+in the NP6-785-ER archive listing (report type 13061) on first use.
 '''
 
 ERCOT_RTM_2024_URL = "https://www.ercot.com/misdownload/servlets/mirDownload?doclookupId=1065471230"
+ERCOT_RTM_URLS = {
+    2024: ERCOT_RTM_2024_URL,
+}
+ERCOT_DOC_LIST_URL = "https://www.ercot.com/misapp/servlets/IceDocListJsonWS"
+ERCOT_RTM_REPORT_TYPE = 13061  # NP6-785-ER, Historical RTM Load Zone and Hub Prices
+
+def ercot_rtm_archive(list_url: str = ERCOT_DOC_LIST_URL) -> dict:
+    '''{year: download URL} for every RTMLZHBSPP_<year>.zip in the NP6-785-ER listing.'''
+    response = requests.get(list_url, params={"reportTypeId": ERCOT_RTM_REPORT_TYPE}, timeout=60)
+    response.raise_for_status()
+    docs = response.json()["ListDocsByRptTypeRes"]["DocumentList"]
+    if isinstance(docs, dict):  # a single document is not wrapped in a list
+        docs = [docs]
+    download = urljoin(list_url, "/misdownload/servlets/mirDownload")
+    urls = {}
+    for d in docs:
+        doc = d["Document"]
+        m = re.search(r"RTMLZHBSPP_(\d{4})", f"{doc.get('FriendlyName', '')} {doc.get('ConstructedName', '')}")
+        if m:
+            urls[int(m.group(1))] = f"{download}?doclookupId={doc['DocID']}"
+    return urls
+
+def ercot_rtm_url(year: int, list_url: str = ERCOT_DOC_LIST_URL) -> str:
+    if year not in ERCOT_RTM_URLS:
+        archive = ercot_rtm_archive(list_url)
+        if year not in archive:
+            raise ValueError(f"No ERCOT RTM download for {year} (RTMLZHBSPP_{year}.zip) in the NP6-785-ER "
+                             f"archive; available years: {sorted(set(ERCOT_RTM_URLS) | set(archive))}. "
+                             f"Pass url= or place Price.xlsx in Rawdata/price/{year}/")
+        ERCOT_RTM_URLS.update({y: u for y, u in archive.items() if y not in ERCOT_RTM_URLS})
+    return ERCOT_RTM_URLS[year]
 
 def fetch_ercot_lmp_2024(url: str = ERCOT_RTM_2024_URL, output_dir: str = PRICE_DIR) -> None:
+    '''2024 download into the original Rawdata/price/ layout.'''
+    fetch_ercot_lmp(2024, url, output_dir)
 
-    ''' Download the ERCOT 2024 Real-Time Market ZIP file and extract its contents.'''
+def fetch_ercot_lmp(year: int, url: str | None = None, output_dir: str | None = None,
+                    list_url: str = ERCOT_DOC_LIST_URL) -> None:
 
+    ''' Download one year of ERCOT Real-Time Market prices into Rawdata/price/<year>/Price.xlsx.'''
+
+    url = url or ercot_rtm_url(year, list_url)
+    output_dir = output_dir or os.path.join(PRICE_DIR, str(year))
+    os.makedirs(output_dir, exist_ok=True)
     logging.info(f"Downloading ERCOT ZIP from {url}")
 
-    response = requests.get(url, timeout=180)
-    response.raise_for_status()
+    with span("fetch", stage="price", url=url, year=year) as sp:
+        response = requests.get(url, timeout=180)
+        response.raise_for_status()
+        sp.bytes_read = len(response.content)
 
     zip_bytes = BytesIO(response.content)
-    with zipfile.ZipFile(zip_bytes) as zf:
+    with span("extract", stage="price", year=year) as sp, zipfile.ZipFile(zip_bytes) as zf:
         zf.extractall(output_dir)
         file_list = zf.namelist()
+        sp.rows_out = len(file_list)
+        sp.bytes_written = sum(i.file_size for i in zf.infolist())
         logging.info(f"Extracted {len(file_list)} file(s) to {output_dir}")
         for f in file_list:
             logging.info(f"  - {f}")
@@ -91,43 +139,55 @@ Function 2 — Extract ERCOT System Load daily archives (Load_t)
 '''
 
 def extract_load_zip_2024(load_zip_path: str = os.path.join(RAW_DIR, "load", "load.zip")) -> None:
+    '''2024 archive (load.zip) into the original flat load_raw_data/ layout.'''
+    extract_load_zip(2024, load_zip_path, os.path.join(os.path.dirname(load_zip_path), "load_raw_data"))
+
+def extract_load_zip(year: int, load_zip_path: str | None = None, raw_data_dir: str | None = None) -> None:
     '''
-    Extracts the main load.zip (which contains 366 sub-zip files),
-    extracts each sub-zip into a dedicated folder "load_raw_data",
-    and deletes only the 366 sub-zip files.
-    The main load.zip is preserved for reproducibility.
+    Extracts the main load_<year>.zip (which contains one sub-zip per daily posting),
+    extracts each sub-zip into "load_raw_data/<year>",
+    and deletes only the sub-zip files.
+    The main ZIP is preserved for reproducibility.
+
+    The yearly archive is downloaded manually from NP6-346-CD. Sub-zips are staged
+    in their own folder so archives of other years next to it are never touched.
     '''
 
     '''Define paths'''
-    load_dir = os.path.dirname(load_zip_path)
-    raw_data_dir = os.path.join(load_dir, "load_raw_data")
+    load_dir = os.path.join(RAW_DIR, "load")
+    load_zip_path = load_zip_path or os.path.join(load_dir, f"load_{year}.zip")
+    raw_data_dir = raw_data_dir or os.path.join(load_dir, "load_raw_data", str(year))
+    staging_dir = os.path.join(os.path.dirname(load_zip_path), f"_subzips_{year}")
     os.makedirs(raw_data_dir, exist_ok=True)
+    os.makedirs(staging_dir, exist_ok=True)
 
-    '''Extract the main load.zip (contains 366 smaller zips)'''
+    '''Extract the main ZIP (contains ~366 smaller zips)'''
     logging.info(f"Extracting main ZIP: {load_zip_path}")
-    with zipfile.ZipFile(load_zip_path, "r") as zf:
-        zf.extractall(load_dir)
-        logging.info(f"Extracted {len(zf.namelist())} sub-zips into {load_dir}")
-
-    '''Find all sub-zip files except the original load.zip'''
-    sub_zips = [
-        f for f in glob.glob(os.path.join(load_dir, "*.zip"))
-        if os.path.abspath(f) != os.path.abspath(load_zip_path)
-    ]
+    with span("extract", stage="load", year=year) as sp, zipfile.ZipFile(load_zip_path, "r") as zf:
+        sp.read(load_zip_path)
+        zf.extractall(staging_dir)
+        sub_zips = [os.path.join(staging_dir, n) for n in zf.namelist() if n.lower().endswith(".zip")]
+        sp.rows_out = len(zf.namelist())
+        logging.info(f"Extracted {len(zf.namelist())} sub-zips into {staging_dir}")
+
     total = len(sub_zips)
     logging.info(f"Found {total} sub-zip files. Extracting them into {raw_data_dir}...")
 
-    '''Extract each sub-zip into load_raw_data/'''
-    for idx, sub_zip in enumerate(sub_zips, start=1):
-        try:
-            with zipfile.ZipFile(sub_zip, "r") as sub_zf:
-                sub_zf.extractall(raw_data_dir)
-            os.remove(sub_zip)
-            logging.info(f"[{idx}/{total}] Extracted and removed: {os.path.basename(sub_zip)}")
-        except zipfile.BadZipFile:
-            logging.warning(f"⚠️ Skipped invalid ZIP: {sub_zip}")
-
-    logging.info("✅ All sub-zips extracted to 'load_raw_data' and removed successfully.")
+    '''Extract each sub-zip into load_raw_data/<year>/'''
+    with span("extract_daily", stage="load", rows_in=total, year=year) as sp:
+        for idx, sub_zip in enumerate(sub_zips, start=1):
+            try:
+                sp.read(sub_zip)
+                with zipfile.ZipFile(sub_zip, "r") as sub_zf:
+                    sub_zf.extractall(raw_data_dir)
+                    sp.bytes_written += sum(i.file_size for i in sub_zf.infolist())
+                os.remove(sub_zip)
+                logging.info(f"[{idx}/{total}] Extracted and removed: {os.path.basename(sub_zip)}")
+            except zipfile.BadZipFile:
+                logging.warning(f"⚠️ Skipped invalid ZIP: {sub_zip}")
+    shutil.rmtree(staging_dir, ignore_errors=True)
+
+    logging.info(f"✅ All sub-zips extracted to {raw_data_dir} and removed successfully.")
     logging.info(f"✅ Main ZIP preserved at {load_zip_path}")
 
 '''
@@ -136,6 +196,8 @@ Function 3 — Fetch NOAA raw (TMIN/TMAX/TAVG) for CDD/HDD
 ---------------------------------------------------------------
 '''
 
+NOAA_CDO_URL = "https://www.ncdc.noaa.gov/cdo-web/api/v2/data"
+
 def fetch_noaa_weather_2024(
     out_dir: str = CDD_HDD_DIR,
     year: int = 2024,
@@ -148,17 +210,40 @@ def fetch_noaa_weather_2024(
     max_retries: int = 5,
     backoff_base: float = 0.8,
     save_per_station: bool = False,
+    *,
+    base_url: str = NOAA_CDO_URL,
+) -> None:
+    '''2024 pull into the original Rawdata/CDD_HDD/ layout (same positional signature as before).'''
+    fetch_noaa_weather(year, out_dir, datatypes, zones, token_env_var, page_limit, request_timeout,
+                       sleep_between_pages, max_retries, backoff_base, save_per_station,
+                       base_url=base_url)
+
+def fetch_noaa_weather(
+    year: int,
+    out_dir: str | None = None,
+    datatypes = ("TMIN", "TMAX", "TAVG"),
+    zones: dict | None = None,
+    token_env_var: str = "NOAA_TOKEN",
+    page_limit: int = 1000,
+    request_timeout: int = 60,
+    sleep_between_pages: float = 0.15,
+    max_retries: int = 5,
+    backoff_base: float = 0.8,
+    save_per_station: bool = False,
+    base_url: str = NOAA_CDO_URL,
 ) -> None:
     '''
-    Fetch RAW NOAA GHCND daily observations for 2024 by ERCOT-like zones,
+    Fetch RAW NOAA GHCND daily observations for one year by ERCOT-like zones,
     using one representative station per zone, and saves a tidy long table:
 
-        CDD_HDD/noaa_raw.csv
+        CDD_HDD/<year>/noaa_raw.csv
         columns: [date, zone, station_id, datatype, value]
 
     Notes:
         • Requires an environment variable "NOAA_TOKEN" loaded from .env.
         • Month-split + pagination + retry to avoid overloading.
+        • Months after today are skipped, so the current year can be pulled (and re-pulled).
+        • base_url can point at a local stand-in (benchmarks/mock_server.py).
     '''
 
     '''Step 0 — Default zone→station mapping'''
@@ -171,15 +256,16 @@ def fetch_noaa_weather_2024(
         }
 
     '''Step 1 — Setup and token validation'''
+    out_dir = out_dir or os.path.join(CDD_HDD_DIR, str(year))
     os.makedirs(out_dir, exist_ok=True)
     if save_per_station:
         os.makedirs(os.path.join(out_dir, "stations"), exist_ok=True)
 
-    base_url = "https://www.ncdc.noaa.gov/cdo-web/api/v2/data"
     token = os.getenv(token_env_var)
     if not token:
         raise ValueError(f"Missing NOAA token. Please define {token_env_var} in your .env file.")
     headers = {"token": token}
+    io_stats = {"requests": 0, "bytes": 0}
 
     '''Step 2 — Helpers'''
     def _month_start_end(y: int, m: int) -> tuple[date, date]:
@@ -197,6 +283,8 @@ def fetch_noaa_weather_2024(
         while True:
             attempt += 1
             resp = requests.get(base_url, headers=headers, params=params, timeout=request_timeout)
+            io_stats["requests"] += 1
+            io_stats["bytes"] += len(resp.content)
             if resp.status_code in (429, 500, 502, 503, 504):
                 if attempt <= max_retries:
                     wait = (backoff_base ** attempt) + 0.5 * attempt
@@ -262,33 +350,41 @@ def fetch_noaa_weather_2024(
     if save_per_station:
         station_buffers: dict[str, list[dict]] = {sid: [] for sid in zones.values()}
 
-    for zone, station_id in zones.items():
-        for dtid in datatypes:
-            for m in range(1, 13):
-                m_start, m_end = _month_start_end(year, m)
-                start_iso, end_iso = m_start.isoformat(), m_end.isoformat()
-                logging.info(f"Fetching {zone} {station_id} {dtid} for {start_iso} → {end_iso}")
-                rows = _fetch_month_station_datatype(station_id, dtid, start_iso, end_iso)
-
-                for r in rows:
-                    long_records.append({
-                        "date": pd.to_datetime(r.get("date")).date() if r.get("date") else None,
-                        "zone": zone,
-                        "station_id": station_id,
-                        "datatype": r.get("datatype"),
-                        "value": r.get("value"),
-                    })
-                    if save_per_station:
-                        station_buffers[station_id].append({
+    with span("fetch", stage="weather", year=year) as sp:
+        for zone, station_id in zones.items():
+            for dtid in datatypes:
+                for m in range(1, 13):
+                    m_start, m_end = _month_start_end(year, m)
+                    if m_start > date.today():
+                        break
+                    start_iso, end_iso = m_start.isoformat(), m_end.isoformat()
+                    logging.info(f"Fetching {zone} {station_id} {dtid} for {start_iso} → {end_iso}")
+                    rows = _fetch_month_station_datatype(station_id, dtid, start_iso, end_iso)
+
+                    for r in rows:
+                        long_records.append({
                             "date": pd.to_datetime(r.get("date")).date() if r.get("date") else None,
+                            "zone": zone,
+                            "station_id": station_id,
                             "datatype": r.get("datatype"),
                             "value": r.get("value"),
                         })
+                        if save_per_station:
+                            station_buffers[station_id].append({
+                                "date": pd.to_datetime(r.get("date")).date() if r.get("date") else None,
+                                "datatype": r.get("datatype"),
+                                "value": r.get("value"),
+                            })
+        sp.rows_out = len(long_records)
+        sp.bytes_read = io_stats["bytes"]
+        sp.attrs["requests"] = io_stats["requests"]
 
     '''Step 4 — Save the table'''
     df_long = pd.DataFrame(long_records)
     out_long = os.path.join(out_dir, f"noaa_raw.csv")
-    df_long.to_csv(out_long, index=False)
+    with span("write", stage="weather", rows_in=len(df_long)) as sp:
+        df_long.to_csv(out_long, index=False)
+        sp.wrote(out_long)
     logging.info(f"Saved RAW NOAA file → {out_long} (rows={len(df_long)})")
 
 
@@ -298,29 +394,46 @@ Function 4 — Fetch ERCOT RenewableShare (Fuel Mix archive)
 ---------------------------------------------------------------
 '''
 
+FUEL_MIX_ARCHIVE_URL = "https://www.ercot.com/files/docs/2021/03/10/FuelMixReport_PreviousYears.zip"
+
 def fetch_ercot_renewableshare_2024_from_archive(
-    url: str = "https://www.ercot.com/files/docs/2021/03/10/FuelMixReport_PreviousYears.zip",
+    url: str = FUEL_MIX_ARCHIVE_URL,
     output_dir: str = os.path.join(RAW_DIR, "RenewableShare"),
     keep_filename: str = "IntGenbyFuel2024.xlsx",
 ) -> None:
+    '''2024 workbook only (IntGenbyFuel2024.xlsx).'''
+    fetch_ercot_renewableshare_from_archive([2024], url, output_dir, keep_filenames=[keep_filename])
+
+def fetch_ercot_renewableshare_from_archive(
+    years,
+    url: str = FUEL_MIX_ARCHIVE_URL,
+    output_dir: str = os.path.join(RAW_DIR, "RenewableShare"),
+    keep_filenames: list[str] | None = None,
+) -> list[str]:
     '''
     Download ERCOT Fuel Mix "Previous Years" ZIP, extract to Rawdata/RenewableShare,
-    keep ONLY the 2024 annual workbook (IntGenbyFuel2024.xlsx), and delete everything else
-    (including the source ZIP and other years' files/folders).
+    keep ONLY the annual workbooks of the requested years (IntGenbyFuel<year>.xlsx), and delete
+    everything else the archive brought in (including the source ZIP and other years' files/folders).
+    Workbooks kept by earlier runs are left alone, so years can be added one at a time.
+    The archive only holds completed years; the current year's workbook is published separately.
 
     Steps:
         1) Download ZIP to memory and also persist a temp copy for reproducibility logs.
         2) Extract all contents into output_dir (may include nested folders).
-        3) Locate IntGenbyFuel2024.xlsx anywhere under output_dir, move it to output_dir root.
-        4) Remove the temp ZIP file and all other files/folders except IntGenbyFuel2024.xlsx.
+        3) Locate each IntGenbyFuel<year>.xlsx anywhere under output_dir, move it to output_dir root.
+        4) Remove the temp ZIP file and all other extracted files/folders.
     '''
 
+    keep_filenames = keep_filenames or [f"IntGenbyFuel{y}.xlsx" for y in years]
+
     '''Step 1 — Prepare directory and download ZIP'''
     os.makedirs(output_dir, exist_ok=True)
     logging.info(f"Downloading ERCOT Fuel Mix archive from {url}")
 
-    response = requests.get(url, timeout=240)
-    response.raise_for_status()
+    with span("fetch", stage="renewables", url=url) as sp:
+        response = requests.get(url, timeout=240)
+        response.raise_for_status()
+        sp.bytes_read = len(response.content)
 
     zip_bytes = BytesIO(response.content)
     temp_zip_path = os.path.join(output_dir, "FuelMixReport_PreviousYears.zip")
@@ -329,45 +442,50 @@ def fetch_ercot_renewableshare_2024_from_archive(
     logging.info(f"Saved temporary ZIP → {temp_zip_path}")
 
     '''Step 2 — Extract all files'''
-    with zipfile.ZipFile(zip_bytes) as zf:
+    already_there = set(os.listdir(output_dir)) - {os.path.basename(temp_zip_path)}
+    with span("extract", stage="renewables") as sp, zipfile.ZipFile(zip_bytes) as zf:
         zf.extractall(output_dir)
         names = zf.namelist()
+        sp.rows_out = len(names)
+        sp.bytes_written = sum(i.file_size for i in zf.infolist())
         logging.info(f"Extracted {len(names)} item(s) into {output_dir}")
         for n in names[:10]:
             logging.info(f"  - {n}")
         if len(names) > 10:
             logging.info(f"  ... and {len(names) - 10} more")
 
-    '''Step 3 — Find the target Excel (case-insensitive), move to output_dir root'''
-    target_found_path = None
-    keep_lower = keep_filename.lower()
-
+    '''Step 3 — Find the target Excel files (case-insensitive), move to output_dir root'''
+    wanted = {k.lower(): k for k in keep_filenames}
+    found = {}
     for root, dirs, files in os.walk(output_dir):
         for fn in files:
-            if fn.lower() == keep_lower:
-                candidate = os.path.join(root, fn)
-                target_found_path = candidate
-                break
-        if target_found_path:
-            break
+            if fn.lower() in wanted and wanted[fn.lower()] not in found:
+                found[wanted[fn.lower()]] = os.path.join(root, fn)
 
-    if not target_found_path:
+    missing = [k for k in keep_filenames if k not in found]
+    if len(missing) == len(keep_filenames):
         raise FileNotFoundError(
-            f"Could not locate {keep_filename} after extraction under {output_dir}"
+            f"Could not locate any of {keep_filenames} after extraction under {output_dir}"
         )
-
-    final_keep_path = os.path.join(output_dir, keep_filename)
-    if os.path.abspath(target_found_path) != os.path.abspath(final_keep_path):
-        if os.path.exists(final_keep_path):
-            os.remove(final_keep_path)
-        shutil.move(target_found_path, final_keep_path)
-    logging.info(f"Kept workbook → {final_keep_path}")
-
-    '''Step 4 — Delete everything else (including the temp ZIP)'''
+    for k in missing:
+        logging.warning(f"{k} is not in the archive (current year, or not published yet)")
+
+    kept = []
+    for keep_filename, target_found_path in found.items():
+        final_keep_path = os.path.join(output_dir, keep_filename)
+        if os.path.abspath(target_found_path) != os.path.abspath(final_keep_path):
+            if os.path.exists(final_keep_path):
+                os.remove(final_keep_path)
+            shutil.move(target_found_path, final_keep_path)
+        kept.append(final_keep_path)
+        logging.info(f"Kept workbook → {final_keep_path}")
+
+    '''Step 4 — Delete everything else the archive brought in (including the temp ZIP)'''
     removed_count = 0
-    for entry in os.listdir(output_dir):
+    extracted = {n.replace("\\", "/").split("/")[0] for n in names}
+    for entry in extracted | {os.path.basename(temp_zip_path)}:
         path = os.path.join(output_dir, entry)
-        if entry == keep_filename:
+        if entry in found or entry in already_there or not os.path.lexists(path):
             continue
         try:
             if os.path.isfile(path) or os.path.islink(path):
@@ -379,8 +497,9 @@ def fetch_ercot_renewableshare_2024_from_archive(
         except Exception as e:
             logging.warning(f"Failed to remove {path}: {e}")
 
-    logging.info(f"Removed {removed_count} other item(s); only {keep_filename} remains.")
+    logging.info(f"Removed {removed_count} other item(s); kept {len(kept)} workbook(s).")
     logging.info("✅ ERCOT Fuel Mix previous-years archive processed successfully.")
+    return kept
 
 
 
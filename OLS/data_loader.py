@@ -1,27 +1,30 @@
-# data_loader.py  — portable + drop negative price rows
+# data_loader.py  — portable + data-quality stage (negative prices dropped by default)
 from pathlib import Path
 import sys
-import re
 import pandas as pd
+from schema import resolve_columns, write_schema
+from panel import write_panel
+import repo_root  # noqa: F401  (instrumentation, DataCleaning)
+from instrumentation import span
+from DataCleaning.quality import run_quality, summarize
 
 BASE_DIR    = Path(__file__).resolve().parent
 # default to ../DataCleaning/ALL_IN_ONE.csv; override via CLI arg
 DEFAULT_RAW = BASE_DIR.parent / "DataCleaning" / "ALL_IN_ONE.csv"
 OUT_PATH    = BASE_DIR / "preprocessed_data.csv"
+# Parquet lake written by DataCleaning (see DataCleaning/lake.py)
+DEFAULT_LAKE = BASE_DIR.parent / "DataCleaning" / "lake"
 
-def find_price_col(cols):
-    """
-    Find a column that looks like 'price' (e.g., Price, price_t, PRICE2022).
-    Case-insensitive, allows optional suffixes.
-    """
-    low_map = {c.lower(): c for c in cols}
-    pat = re.compile(r"^price(_?\w+)?$", re.I)
-    for lc, orig in low_map.items():
-        if pat.match(lc):
-            return orig
-    return None
+def read_raw(raw_path: Path, start=None, end=None, hub=None) -> pd.DataFrame:
+    """A lake directory is read with date-range pushdown for one hub; anything else as CSV."""
+    if raw_path.is_dir():
+        from DataCleaning.lake import read_panel, DEFAULT_HUB
+        return read_panel(start, end, hub or DEFAULT_HUB, root=str(raw_path))
+    return pd.read_csv(raw_path)
 
-def load_and_preprocess_data(raw_path: Path = DEFAULT_RAW, out_path: Path = OUT_PATH) -> Path:
+def load_and_preprocess_data(raw_path: Path = DEFAULT_RAW, out_path: Path = OUT_PATH,
+                             start=None, end=None, hub=None, policy=None) -> Path:
+    """policy: repair policies for DataCleaning.quality (default: its DEFAULT_POLICY)."""
     if not raw_path.exists():
         raise FileNotFoundError(
             f"Raw data not found at {raw_path}.\n"
@@ -31,15 +34,19 @@ def load_and_preprocess_data(raw_path: Path = DEFAULT_RAW, out_path: Path = OUT_
     print(f"[info] BASE_DIR  = {BASE_DIR}")
     print(f"[info] RAW_PATH  = {raw_path}")
     print(f"[info] OUT_PATH  = {out_path}")
-    print(f"[info] Reading raw CSV: {raw_path}")
+    print(f"[info] Reading raw data: {raw_path}")
 
-    df = pd.read_csv(raw_path)
+    with span("parse", stage="preprocess") as sp:
+        sp.read(raw_path)
+        df = read_raw(raw_path, start, end, hub)
+        sp.rows_out = len(df)
 
     # 1) Clean column names (strip whitespace)
     df.columns = [c.strip() for c in df.columns]
 
-    # 2) Auto-detect price column
-    price_col = find_price_col(df.columns)
+    # 2) Auto-detect price and date columns (strict "price" role: the raw panel may have other "p..." columns)
+    roles = resolve_columns(df.columns)
+    price_col, date_col = roles["price"], roles["date"]
     if price_col is None:
         raise KeyError(
             "Could not find a price column. Expected something like 'Price' or 'Price_t'.\n"
@@ -54,9 +61,24 @@ def load_and_preprocess_data(raw_path: Path = DEFAULT_RAW, out_path: Path = OUT_
             if coerced.notna().sum() > 0:
                 df[col] = coerced
 
-    # 4) Drop rows with negative price
+    # 4) Data-quality stage: gaps, duplicates, units, outliers, negative prices (+ coverage for the lake)
     before = len(df)
-    df = df[df[price_col] >= 0]
+    if date_col:
+        coverage = None
+        if raw_path.is_dir():
+            from DataCleaning.lake import series_dates, DEFAULT_HUB
+            coverage = series_dates(start, end, hub or DEFAULT_HUB, root=str(raw_path))
+        with span("quality", stage="preprocess", rows_in=len(df)) as sp:
+            df, issues = run_quality(df, ts=date_col, policy=policy, coverage=coverage, price_col=price_col)
+            sp.rows_out = len(df)
+        df[date_col] = df[date_col].dt.strftime("%Y-%m-%d")
+        issues_path = out_path.with_name(out_path.stem + ".issues.csv")
+        issues_path.parent.mkdir(parents=True, exist_ok=True)
+        issues.to_csv(issues_path, index=False)
+        print(f"[info] Quality: {summarize(issues)} → {issues_path}")
+    else:
+        print("[warn] No date column; only dropping negative prices")
+        df = df[df[price_col] >= 0]
     after_nonneg = len(df)
 
     # 5) Drop rows that are entirely NaN (optional safety)
@@ -65,11 +87,19 @@ def load_and_preprocess_data(raw_path: Path = DEFAULT_RAW, out_path: Path = OUT_
 
     # 6) Save
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    df.to_csv(out_path, index=False)
+    with span("write", stage="preprocess", rows_in=len(df)) as sp:
+        df.to_csv(out_path, index=False)
+        sp.wrote(out_path)
+    schema_out = write_schema(out_path, df.columns)
+    with span("write_panel", stage="preprocess", rows_in=len(df)) as sp:
+        panel_out = write_panel(df, out_path, date_col=date_col)
+        sp.wrote(*panel_out.glob("*"))
     print(f"[done] Wrote preprocessed data → {out_path} "
           f"(rows={after}, cols={df.shape[1]}; "
-          f"dropped {before - after_nonneg} with negative {price_col}, "
+          f"dropped {before - after_nonneg} in the quality stage, "
           f"{after_nonneg - after} all-NaN rows)")
+    print(f"[done] Wrote column mapping → {schema_out}")
+    print(f"[done] Wrote memory-mapped panel → {panel_out}")
 
     return out_path
 
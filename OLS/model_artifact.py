@@ -0,0 +1,160 @@
+# model_artifact.py — compact, versioned OLS model artifact (replaces the full results pickle)
+from pathlib import Path
+import hashlib
+import json
+import numpy as np
+import pandas as pd
+
+# Layout of an artifact directory (every array is a plain .npy, so it can be memory-mapped):
+#   meta.json       version, target/terms, summary stats, coef column names, inference
+#                   settings (robust covariances, bootstrap scheme/replicates), fingerprints
+#   params.npy      (k,)   coefficient vector
+#   cov.npy         (k, k) classic covariance matrix
+#   coef_table.npy  (k, m) coefficient table, columns listed in meta["coef_columns"]
+ARTIFACT_VERSION = 1
+STAT_NAMES = ("nobs", "df_model", "df_resid", "rsquared", "rsquared_adj",
+              "fvalue", "f_pvalue", "aic", "bic", "ssr", "scale")
+
+def data_fingerprint(y: np.ndarray, X: np.ndarray, terms) -> str:
+    """Hash of the exact estimation sample (target, design matrix and term names)."""
+    h = hashlib.sha256()
+    h.update(json.dumps(list(terms)).encode())
+    h.update(np.ascontiguousarray(y, dtype=float).tobytes())
+    h.update(np.ascontiguousarray(X, dtype=float).tobytes())
+    return h.hexdigest()[:16]
+
+def save_model_artifact(model, coef_df: pd.DataFrame, path: Path, y, X, inference=None) -> Path:
+    """
+    Write params, covariance, summary stats and the coefficient table of a fitted
+    statsmodels OLS. The design matrix and fitted values are NOT stored.
+    inference: how the robust / bootstrap columns of coef_df were computed (kept in meta).
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    terms = [str(t) for t in model.params.index]
+    table = coef_df.set_index("term").loc[terms]
+    params = np.asarray(model.params, dtype=float)
+    cov = np.asarray(model.cov_params(), dtype=float)
+    coef_table = table.to_numpy(dtype=float)
+
+    fp_data = data_fingerprint(y, X, terms)
+    h = hashlib.sha256(fp_data.encode())
+    h.update(json.dumps(inference, sort_keys=True).encode())
+    for arr in (params, cov, coef_table):
+        h.update(arr.tobytes())
+
+    meta = {
+        "version": ARTIFACT_VERSION,
+        "target": str(model.model.endog_names),
+        "terms": terms,
+        "features": [t for t in terms if t != "const"],
+        "has_const": "const" in terms,
+        "coef_columns": list(table.columns),
+        "stats": {s: float(getattr(model, s)) for s in STAT_NAMES},
+        "inference": inference,
+        "data_fingerprint": fp_data,
+        "model_fingerprint": h.hexdigest()[:16],
+    }
+
+    np.save(path / "params.npy", params)
+    np.save(path / "cov.npy", cov)
+    np.save(path / "coef_table.npy", coef_table)
+    (path / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    return path
+
+class ModelArtifact:
+    """Read-only view of a saved model; arrays are memory-mapped, not copied."""
+
+    def __init__(self, path: Path, meta: dict, params, cov, coef_table):
+        self.path = Path(path)
+        self.meta = meta
+        self.params = params
+        self.cov = cov
+        self.coef_table = coef_table
+        self._fitted = None
+        self._resid = None
+
+    def __getattr__(self, name):
+        # nobs, rsquared, aic, ... straight from the stored summary stats
+        stats = self.__dict__.get("meta", {}).get("stats", {})
+        if name in stats:
+            return stats[name]
+        raise AttributeError(name)
+
+    @property
+    def target(self) -> str:
+        return self.meta["target"]
+
+    @property
+    def terms(self) -> list:
+        return self.meta["terms"]
+
+    @property
+    def features(self) -> list:
+        return self.meta["features"]
+
+    @property
+    def fingerprint(self) -> str:
+        return self.meta["model_fingerprint"]
+
+    def coef_frame(self) -> pd.DataFrame:
+        """Coefficient table as a DataFrame (term + coef/std_err/.../ci_low/ci_high/...)."""
+        df = pd.DataFrame(np.asarray(self.coef_table), columns=self.meta["coef_columns"])
+        df.insert(0, "term", self.terms)
+        return df
+
+    def design(self, df: pd.DataFrame):
+        """
+        Rebuild (y, X) from the data exactly as the fit did and check it against the
+        stored fingerprint, so lazily computed fitted values never silently drift.
+        """
+        missing = [c for c in [self.target] + self.features if c not in df.columns]
+        if missing:
+            raise KeyError(f"Data is missing model columns {missing}. Available: {list(df.columns)}")
+        d = df[[self.target] + self.features].dropna()
+        y = d[self.target].to_numpy(dtype=float)
+        X = d[self.features].to_numpy(dtype=float)
+        if self.meta["has_const"]:
+            X = np.column_stack([np.ones(len(X)), X])
+        fp = data_fingerprint(y, X, self.terms)
+        if fp != self.meta["data_fingerprint"]:
+            raise ValueError(
+                f"Data does not match the fitted model (fingerprint {fp} != "
+                f"{self.meta['data_fingerprint']}). Re-run `python ols_regression.py`."
+            )
+        return d.index, y, X
+
+    def fitted_values(self, df: pd.DataFrame) -> pd.Series:
+        if self._fitted is None:
+            idx, y, X = self.design(df)
+            fitted = X @ np.asarray(self.params)
+            self._fitted = pd.Series(fitted, index=idx, name="fitted")
+            self._resid = pd.Series(y - fitted, index=idx, name="resid")
+        return self._fitted
+
+    def residuals(self, df: pd.DataFrame) -> pd.Series:
+        self.fitted_values(df)
+        return self._resid
+
+def load_model_artifact(path: Path, mmap: bool = True) -> ModelArtifact:
+    path = Path(path)
+    meta_path = path / "meta.json"
+    if not meta_path.exists():
+        raise FileNotFoundError(
+            f"Missing model artifact: {path}\n"
+            "Run `python ols_regression.py` first to create it."
+        )
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if meta.get("version") != ARTIFACT_VERSION:
+        raise ValueError(
+            f"Model artifact version {meta.get('version')} is not supported "
+            f"(expected {ARTIFACT_VERSION}). Re-run `python ols_regression.py`."
+        )
+    mode = "r" if mmap else None
+    return ModelArtifact(
+        path, meta,
+        np.load(path / "params.npy", mmap_mode=mode),
+        np.load(path / "cov.npy", mmap_mode=mode),
+        np.load(path / "coef_table.npy", mmap_mode=mode),
+    )
@@ -0,0 +1,85 @@
+# ols.py — single entry point for the OLS tools:  python ols.py {preprocess,fit,plot,report}
+#
+# Only argparse/pathlib are imported up front; pandas, statsmodels and matplotlib are
+# pulled in by the subcommand that needs them, so `--help` or a path check stays fast.
+import time
+_T0 = time.perf_counter()
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+# non-interactive backend before anything can import matplotlib
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+PLOT_MODES = ("auto", "full", "fast")
+
+def cmd_preprocess(args):
+    from data_loader import load_and_preprocess_data, DEFAULT_RAW, DEFAULT_LAKE, OUT_PATH
+    raw = args.raw.expanduser().resolve() if args.raw else (DEFAULT_LAKE if args.lake else DEFAULT_RAW)
+    from DataCleaning.quality import parse_policy
+    load_and_preprocess_data(raw, args.out or OUT_PATH, start=args.start, end=args.end, hub=args.hub,
+                             policy=parse_policy(args.policy))
+
+def cmd_fit(args):
+    from ols_regression import run_ols_regression
+    run_ols_regression(n_boot=args.n_boot, block_len=args.block_len, seed=args.seed,
+                       n_jobs=args.jobs, hac_maxlags=args.hac_lags, plot_mode=args.plot_mode)
+
+def cmd_plot(args):
+    import result_visual
+    result_visual.main(mode=args.plot_mode)
+
+def cmd_report(args):
+    from regression_report import generate_batch_report, MODEL_PATH, REPORT_PATH
+    generate_batch_report(args.model or [MODEL_PATH], args.out or REPORT_PATH, force=args.force)
+
+def build_parser() -> argparse.ArgumentParser:
+    ap = argparse.ArgumentParser(prog="ols", description="ERCOT price OLS pipeline.")
+    sub = ap.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("preprocess", help="clean ALL_IN_ONE.csv → preprocessed_data.csv")
+    p.add_argument("raw", nargs="?", type=Path,
+                   help="raw CSV or lake dir (default ../DataCleaning/ALL_IN_ONE.csv)")
+    p.add_argument("--out", type=Path)
+    p.add_argument("--lake", action="store_true", help="read ../DataCleaning/lake instead of the CSV")
+    p.add_argument("--start", help="first date to load from the lake, e.g. 2023-06-01")
+    p.add_argument("--end", help="last date to load from the lake (inclusive)")
+    p.add_argument("--hub", help="settlement point to take prices from (default HB_BUSAVG)")
+    p.add_argument("--policy", action="append", metavar="CHECK=ACTION",
+                   help="repair policy, e.g. negative_price=keep outliers=nan (repeatable)")
+    p.set_defaults(func=cmd_preprocess)
+
+    p = sub.add_parser("fit", help="fit OLS, write coefficients + model artifact")
+    p.add_argument("--n-boot", type=int, default=2000, help="block bootstrap replicates (0 = off)")
+    p.add_argument("--block-len", type=int, help="bootstrap block length (default ~ n^(1/3))")
+    p.add_argument("--hac-lags", type=int, help="Newey-West lags (default rule of thumb)")
+    p.add_argument("--seed", type=int, default=395)
+    p.add_argument("--jobs", type=int, help="bootstrap worker processes (default: all cores)")
+    p.add_argument("--plot-mode", choices=PLOT_MODES, default="auto")
+    p.set_defaults(func=cmd_fit)
+
+    p = sub.add_parser("plot", help="actual vs fitted figure (fit writes the residual figure)")
+    p.add_argument("--plot-mode", choices=PLOT_MODES, default="auto",
+                   help="fast = min/max envelope + hexbin; auto switches on large panels")
+    p.set_defaults(func=cmd_plot)
+
+    p = sub.add_parser("report", help="markdown/HTML regression report")
+    p.add_argument("--model", type=Path, action="append",
+                   help="model artifact dir; repeat for a multi-section report")
+    p.add_argument("--out", type=Path, help="report path (.md or .html)")
+    p.add_argument("--force", action="store_true", help="rewrite even if the model is unchanged")
+    p.set_defaults(func=cmd_report)
+    return ap
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    t_start = time.perf_counter()
+    print(f"[info] startup {(t_start - _T0) * 1e3:.1f} ms")
+    args.func(args)
+    print(f"[info] {args.command} took {time.perf_counter() - t_start:.2f} s (incl. imports)")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,111 +1,95 @@
-# ols_regression.py — portable + auto-detect column names + model pickle
+# ols_regression.py — portable + schema-resolved column names + compact model artifact
 from pathlib import Path
-import re
-import pickle
 import pandas as pd
-import statsmodels.api as sm
-import matplotlib.pyplot as plt
+from model_artifact import save_model_artifact
+from schema import FEATURE_ROLES, load_schema
+from panel import read_columns
+from plotting import plot_residuals
+from robust_inference import (ROBUST_COV_TYPES, robust_table, block_bootstrap, bootstrap_table,
+                              default_block_len, newey_west_lags)
+import repo_root  # noqa: F401  (instrumentation, DataCleaning)
+from instrumentation import span
 
 # ---------- repo-relative paths ----------
 BASE_DIR   = Path(__file__).resolve().parent
 DATA_PATH  = BASE_DIR / "preprocessed_data.csv"
-MODEL_PATH = BASE_DIR / "ols_model.pkl"
+MODEL_PATH = BASE_DIR / "ols_model"
 COEF_CSV   = BASE_DIR / "ols_coefficients.csv"
 RESID_PNG  = BASE_DIR / "ols_residuals_analysis.png"
 
-# keywords to find columns (case-insensitive, allows optional suffixes like _t)
-KEYS = {
-    "target": ["price", "p"],
-    "load": ["load"],
-    "cdd": ["cdd", "coolingdegree", "cooling_deg"],
-    "hdd": ["hdd", "heatingdegree", "heating_deg"],
-    "renew": ["renewableshare", "renew_share", "renew", "rs", "solar_wind_share"],
-}
-
-def _find_col(cols, keywords):
-    """Return first column whose name matches any keyword (case-insensitive, optional suffixes like _t)."""
-    low = {c.lower(): c for c in cols}
-    for kw in keywords:
-        pat = re.compile(rf"^{re.escape(kw)}(_?\w+)?$", flags=re.I)
-        for lc, orig in low.items():
-            if pat.match(lc):
-                return orig
-    return None
-
-def autodetect_columns(df: pd.DataFrame):
-    cols = list(df.columns)
-    tgt = _find_col(cols, KEYS["target"])
-    ld  = _find_col(cols, KEYS["load"])
-    cdd = _find_col(cols, KEYS["cdd"])
-    hdd = _find_col(cols, KEYS["hdd"])
-    rnw = _find_col(cols, KEYS["renew"])
-
-    missing = []
-    if tgt is None: missing.append("Price (target)")
-    if ld  is None: missing.append("Load")
-    if cdd is None: missing.append("CDD")
-    if hdd is None: missing.append("HDD")
-    if rnw is None: missing.append("RenewableShare")
-
-    if missing:
-        raise KeyError(
-            "Could not find required columns in preprocessed_data.csv:\n"
-            f"  Missing: {missing}\n"
-            f"  Available columns: {cols}\n"
-            "Tip: rename your headers or extend KEYS in this script."
-        )
-    return tgt, [ld, cdd, hdd, rnw]
-
 def run_ols_regression(
     data_path: Path = DATA_PATH,
     model_path: Path = MODEL_PATH,
     coef_csv: Path = COEF_CSV,
     resid_png: Path = RESID_PNG,
+    cov_types=ROBUST_COV_TYPES,
+    hac_maxlags=None,
+    n_boot: int = 2000,
+    block_len=None,
+    boot_scheme: str = "moving",
+    seed: int = 395,
+    n_jobs=None,
+    plot_mode: str = "auto",
 ):
     if not data_path.exists():
         raise FileNotFoundError(f"Missing data at {data_path}. Run data_loader.py first.")
 
-    df = pd.read_csv(data_path)
+    # heavy import only once there is work to do
+    import statsmodels.api as sm
 
-    # drop obvious non-feature columns if present
-    for c in ("date", "Date", "DATE", "timestamp", "time"):
-        if c in df.columns:
-            # don’t drop yet; just avoid selecting as a regressor
-            pass
-
-    target_col, features = autodetect_columns(df)
+    # roles come from preprocessed_data.schema.json (header check only, no detection)
+    roles = load_schema(data_path)
+    target_col, features = roles["target"], [roles[r] for r in FEATURE_ROLES]
+    with span("parse", stage="ols") as sp:
+        sp.read(data_path)
+        df = read_columns(data_path, [target_col] + features)  # mmap panel if fresh, else CSV
+        sp.rows_out = len(df)
 
     d = df[[target_col] + features].dropna().copy()
     y = d[target_col].astype(float)
     X = d[features].astype(float)
     X = sm.add_constant(X, has_constant="add")
 
-    model = sm.OLS(y, X).fit()
+    with span("fit", stage="ols", rows_in=len(y)):
+        model = sm.OLS(y, X).fit()
     print(model.summary())
 
-    with open(model_path, "wb") as f:
-        pickle.dump(model, f)
-    print(f"[done] Saved model → {model_path}")
-
     coef_df = pd.DataFrame({
         "term": model.params.index,
         "coef": model.params.values,
         "std_err": model.bse.values,
         "t_or_z": model.tvalues.values,
         "p_value": model.pvalues.values,
-    }).round(6)
-    coef_df.to_csv(coef_csv, index=False)
+        "ci_low": model.conf_int()[0].values,
+        "ci_high": model.conf_int()[1].values,
+    })
+
+    # robust inference: HC / Newey-West HAC + block bootstrap (n_boot=0 skips it)
+    hac_maxlags = newey_west_lags(len(y)) if hac_maxlags is None else hac_maxlags
+    inference = {"cov_types": list(cov_types), "hac_maxlags": hac_maxlags, "bootstrap": None}
+    with span("robust_se", stage="ols", rows_in=len(y)):
+        extra = robust_table(model, cov_types, hac_maxlags)
+    if n_boot:
+        block_len = default_block_len(len(y)) if block_len is None else block_len
+        with span("bootstrap", stage="ols", rows_in=len(y), n_boot=n_boot):
+            draws = block_bootstrap(X.values, y.values, n_boot=n_boot, block_len=block_len,
+                                    scheme=boot_scheme, seed=seed, n_jobs=n_jobs)
+        extra = extra.join(bootstrap_table(draws, model.params.index))
+        inference["bootstrap"] = {"scheme": boot_scheme, "n_boot": len(draws),
+                                  "block_len": block_len, "seed": seed}
+        print(f"[info] Block bootstrap: {len(draws)} replicates ({boot_scheme}, seed={seed})")
+    coef_df = coef_df.merge(extra, left_on="term", right_index=True, how="left")
+    with span("write", stage="ols", rows_in=len(coef_df)) as sp:
+        coef_df.round(6).to_csv(coef_csv, index=False)
+        save_model_artifact(model, coef_df, model_path, y.values, X.values, inference)
+        sp.wrote(coef_csv, *model_path.glob("*"))
     print(f"[done] Wrote coefficients → {coef_csv}")
+    print(f"[done] Saved model → {model_path}")
 
-    plt.figure(figsize=(9, 5.5))
-    plt.scatter(model.fittedvalues, model.resid, s=12)
-    plt.axhline(0, linewidth=1)
-    plt.xlabel("Fitted")
-    plt.ylabel("Residual")
-    plt.title("OLS Residuals vs Fitted")
-    plt.tight_layout()
-    plt.savefig(resid_png, dpi=300, bbox_inches="tight")
-    plt.close()
+    # scatter for small samples, hexbin density for large panels
+    with span("plot", stage="ols", rows_in=len(y)) as sp:
+        plot_residuals(model.fittedvalues.values, model.resid.values, resid_png, mode=plot_mode)
+        sp.wrote(resid_png)
     print(f"[done] Saved residuals plot → {resid_png}")
 
     return model
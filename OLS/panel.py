@@ -0,0 +1,126 @@
+# panel.py — memory-mapped columnar copy of preprocessed_data.csv for repeated sessions
+from pathlib import Path
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+
+# Layout of a panel directory (written by data_loader next to the CSV):
+#   columns.json    version, nrows, column → file/dtype, date column, CSV size + mtime
+#   date.npy        (n,) datetime64[D] date index (only if the data has a date column)
+#   c000.npy ...    (n,) one plain .npy per numeric column, opened with mmap_mode="r"
+# Every process that opens the panel maps the same files, so the OS page cache is
+# shared instead of each notebook/worker holding a private parsed copy.
+PANEL_VERSION = 1
+
+def panel_path(data_path: Path) -> Path:
+    """preprocessed_data.csv → preprocessed_data.panel/ (same folder)."""
+    data_path = Path(data_path)
+    return data_path.with_name(data_path.stem + ".panel")
+
+def _stamp(data_path: Path) -> dict:
+    st = os.stat(data_path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+
+def write_panel(df: pd.DataFrame, data_path: Path, date_col=None) -> Path:
+    """
+    Write the numeric columns of `df` (as saved to `data_path`) as one .npy each.
+    Call after the CSV is written: the CSV's size/mtime are recorded so a panel that
+    no longer matches its CSV is ignored by open_panel().
+    """
+    out = panel_path(data_path)
+    tmp = out.with_name(out.name + ".tmp")
+    shutil.rmtree(tmp, ignore_errors=True)
+    tmp.mkdir(parents=True)
+
+    columns, skipped = {}, []
+    for i, col in enumerate(df.columns):
+        if col == date_col:
+            continue
+        values = df[col].to_numpy()
+        if values.dtype.kind not in "biuf":
+            skipped.append(col)
+            continue
+        fname = f"c{i:03d}.npy"
+        np.save(tmp / fname, np.ascontiguousarray(values))
+        columns[col] = {"file": fname, "dtype": values.dtype.str}
+    if date_col:
+        dates = pd.to_datetime(df[date_col], errors="coerce").to_numpy().astype("datetime64[D]")
+        np.save(tmp / "date.npy", dates)
+
+    meta = {
+        "version": PANEL_VERSION,
+        "nrows": len(df),
+        "order": list(df.columns),
+        "columns": columns,
+        "date": date_col,
+        "skipped": skipped,
+        "source": _stamp(data_path),
+    }
+    (tmp / "columns.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+    shutil.rmtree(out, ignore_errors=True)
+    tmp.rename(out)
+    return out
+
+class Panel:
+    """Read-only columns of the preprocessed data; each one is an np.memmap."""
+
+    def __init__(self, path: Path, meta: dict):
+        self.path = Path(path)
+        self.meta = meta
+        self._cols = {}
+
+    def __len__(self) -> int:
+        return self.meta["nrows"]
+
+    def __contains__(self, name) -> bool:
+        return name in self.meta["columns"] or (name is not None and name == self.meta["date"])
+
+    @property
+    def columns(self) -> list:
+        return [c for c in self.meta["order"] if c in self]
+
+    @property
+    def index(self):
+        """datetime64[D] dates, or None when the data has no date column."""
+        return self[self.meta["date"]] if self.meta["date"] else None
+
+    def __getitem__(self, name) -> np.ndarray:
+        if name not in self._cols:
+            if name == self.meta["date"]:
+                fname = "date.npy"
+            elif name in self.meta["columns"]:
+                fname = self.meta["columns"][name]["file"]
+            else:
+                raise KeyError(f"{name!r} is not in panel {self.path.name}. Have: {self.columns}")
+            self._cols[name] = np.load(self.path / fname, mmap_mode="r")
+        return self._cols[name]
+
+    def frame(self, columns=None) -> pd.DataFrame:
+        """DataFrame over the mapped arrays (copy=False: no consolidation copy)."""
+        columns = self.columns if columns is None else list(columns)
+        return pd.DataFrame({c: self[c] for c in columns}, copy=False)
+
+def open_panel(data_path: Path):
+    """The panel for `data_path`, or None if there is none or the CSV changed since."""
+    data_path = Path(data_path)
+    path = panel_path(data_path)
+    meta_path = path / "columns.json"
+    if not meta_path.exists() or not data_path.exists():
+        return None
+    meta = json.loads(meta_path.read_text(encoding="utf-8"))
+    if meta.get("version") != PANEL_VERSION or meta.get("source") != _stamp(data_path):
+        return None
+    return Panel(path, meta)
+
+def read_columns(data_path: Path, columns, date_col=None) -> pd.DataFrame:
+    """
+    `columns` of the preprocessed data from the panel when it is present and fresh,
+    else from the CSV. `date_col` (if given) comes back parsed as datetimes.
+    """
+    columns = list(columns)
+    panel = open_panel(data_path)
+    if panel is not None and all(c in panel for c in columns):
+        return panel.frame(columns)
+    return pd.read_csv(data_path, usecols=columns, parse_dates=[date_col] if date_col else False)
@@ -0,0 +1,86 @@
+# plotting.py — figure helpers with a fast path for large panels
+from pathlib import Path
+import numpy as np
+
+FIG_SIZE = (9, 5.5)
+FULL_DPI = 300
+FAST_DPI = 150
+# residual scatter switches to hexbin density above this many points
+HEXBIN_ABOVE = 50_000
+
+def _plt():
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+def envelope(y: np.ndarray, n_bins: int):
+    """
+    Split y (in time order) into n_bins contiguous chunks and return
+    (bin start positions, min, max, mean) per chunk — one chunk per pixel column.
+    NaNs are ignored within a chunk.
+    """
+    y = np.asarray(y, dtype=float)
+    starts = np.unique(np.linspace(0, len(y), n_bins, endpoint=False).astype(int))
+    ok = ~np.isnan(y)
+    lo = np.fmin.reduceat(y, starts)
+    hi = np.fmax.reduceat(y, starts)
+    n_ok = np.add.reduceat(ok, starts)
+    mean = np.add.reduceat(np.where(ok, y, 0.0), starts) / np.where(n_ok > 0, n_ok, np.nan)
+    return starts, lo, hi, mean
+
+def plot_actual_fitted(x, actual, fitted, fig_path: Path, mode: str = "auto", xlabel: str = "Date"):
+    """
+    Actual vs fitted over time. mode="full" draws every point; mode="fast" draws a
+    min/max envelope per pixel column; "auto" picks fast once points outnumber pixels.
+    """
+    plt = _plt()
+    x = np.asarray(x)
+    n_px = int(FIG_SIZE[0] * FAST_DPI)
+    fast = mode == "fast" or (mode == "auto" and len(x) > n_px)
+
+    plt.figure(figsize=FIG_SIZE)
+    if fast:
+        starts, a_lo, a_hi, _ = envelope(actual, n_px)
+        _, f_lo, f_hi, f_mean = envelope(fitted, n_px)
+        xs = x[starts]
+        plt.fill_between(xs, a_lo, a_hi, step="post", alpha=0.5, linewidth=0, label="Actual (min/max)")
+        plt.fill_between(xs, f_lo, f_hi, step="post", alpha=0.3, linewidth=0)
+        plt.step(xs, f_mean, where="post", linewidth=1.0, label="Fitted")
+        dpi = FAST_DPI
+    else:
+        plt.plot(x, actual, label="Actual", linewidth=1.6)
+        plt.plot(x, fitted, label="Fitted", linewidth=1.6)
+        dpi = FULL_DPI
+    plt.xlabel(xlabel)
+    plt.ylabel("Value")
+    plt.title("OLS: Actual vs. Fitted")
+    plt.legend()
+    if np.issubdtype(x.dtype, np.datetime64):
+        plt.gcf().autofmt_xdate()
+    plt.tight_layout()
+    plt.savefig(fig_path, dpi=dpi, bbox_inches="tight")
+    plt.close()
+    return fig_path
+
+def plot_residuals(fitted, resid, fig_path: Path, mode: str = "auto"):
+    """Residuals vs fitted: scatter for small samples, hexbin density for large ones."""
+    plt = _plt()
+    fast = mode == "fast" or (mode == "auto" and len(fitted) > HEXBIN_ABOVE)
+
+    plt.figure(figsize=FIG_SIZE)
+    if fast:
+        hb = plt.hexbin(fitted, resid, gridsize=120, bins="log", mincnt=1)
+        plt.colorbar(hb, label="count (log)")
+        dpi = FAST_DPI
+    else:
+        plt.scatter(fitted, resid, s=12)
+        dpi = FULL_DPI
+    plt.axhline(0, linewidth=1)
+    plt.xlabel("Fitted")
+    plt.ylabel("Residual")
+    plt.title("OLS Residuals vs Fitted")
+    plt.tight_layout()
+    plt.savefig(fig_path, dpi=dpi, bbox_inches="tight")
+    plt.close()
+    return fig_path
@@ -0,0 +1,165 @@
+# predict.py — batch scoring / local HTTP endpoint on top of the saved OLS artifact
+from pathlib import Path
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import argparse
+import json
+import sys
+import time
+import numpy as np
+import pandas as pd
+from scipy import stats
+from model_artifact import load_model_artifact
+
+# ---------- Portable, repo-relative paths ----------
+BASE_DIR   = Path(__file__).resolve().parent
+MODEL_PATH = BASE_DIR / "ols_model"
+
+# rows scored per vectorised pass; bounds the temporary (chunk, k) buffers
+CHUNK_ROWS = 1 << 18
+
+class Predictor:
+    """
+    Loads the model once and keeps the coefficient vector / covariance hot in memory.
+    Prediction intervals: yhat ± t(df_resid) * sqrt(x'Σx + σ²).
+    """
+
+    def __init__(self, model_path: Path = MODEL_PATH, alpha: float = 0.05):
+        self.model = load_model_artifact(model_path, mmap=False)
+        self.features = list(self.model.features)
+        self.has_const = self.model.meta["has_const"]
+        self.params = np.ascontiguousarray(self.model.params, dtype=float)
+        self.cov = np.ascontiguousarray(self.model.cov, dtype=float)
+        self.scale = float(self.model.scale)
+        self.set_alpha(alpha)
+
+    def set_alpha(self, alpha: float):
+        self.alpha = alpha
+        self.tcrit = float(stats.t.ppf(1 - alpha / 2, self.model.df_resid))
+
+    def _design(self, X: np.ndarray) -> np.ndarray:
+        if self.has_const:
+            X = np.column_stack([np.ones(len(X)), X])
+        return X
+
+    def predict_array(self, X: np.ndarray) -> np.ndarray:
+        """Score an (n, len(features)) array; returns (n, 4): yhat, mean_se, pi_low, pi_high."""
+        X = np.asarray(X, dtype=float)
+        if X.ndim != 2 or X.shape[1] != len(self.features):
+            raise ValueError(f"Expected an (n, {len(self.features)}) array for {self.features}, got {X.shape}")
+        out = np.empty((len(X), 4))
+        for i in range(0, len(X), CHUNK_ROWS):
+            Xc = self._design(X[i:i + CHUNK_ROWS])
+            yhat = Xc @ self.params
+            mean_var = np.einsum("ij,jk,ik->i", Xc, self.cov, Xc)
+            half = self.tcrit * np.sqrt(mean_var + self.scale)
+            o = out[i:i + len(Xc)]
+            o[:, 0] = yhat
+            o[:, 1] = np.sqrt(mean_var)
+            o[:, 2] = yhat - half
+            o[:, 3] = yhat + half
+        return out
+
+    def predict(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Score a frame holding the model's feature columns (extra columns are ignored)."""
+        missing = [c for c in self.features if c not in df.columns]
+        if missing:
+            raise KeyError(f"Scenario data is missing model columns {missing}. Available: {list(df.columns)}")
+        res = self.predict_array(df[self.features].to_numpy(dtype=float))
+        return pd.DataFrame(res, index=df.index,
+                            columns=["prediction", "mean_se", "pi_low", "pi_high"])
+
+def make_handler(predictor: Predictor):
+    class ScoringHandler(BaseHTTPRequestHandler):
+        def _send(self, code: int, payload: dict):
+            body = json.dumps(payload, allow_nan=False).encode("utf-8")  # strict JSON, no bare NaN
+            self.send_response(code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            if self.path != "/health":
+                return self._send(404, {"error": f"unknown path {self.path}"})
+            self._send(200, {"status": "ok", "model": predictor.model.fingerprint,
+                             "features": predictor.features})
+
+        def do_POST(self):
+            # body: {"rows": [{feature: value, ...}, ...]}  or  {"columns": {feature: [values], ...}}
+            if self.path != "/predict":
+                return self._send(404, {"error": f"unknown path {self.path}"})
+            try:
+                n = int(self.headers.get("Content-Length", 0))
+                js = json.loads(self.rfile.read(n) or b"{}")
+                if not isinstance(js, dict):
+                    raise ValueError(f'body must be a JSON object with "rows" or "columns", got {type(js).__name__}')
+                df = pd.DataFrame(js["rows"]) if "rows" in js else pd.DataFrame(js["columns"])
+                with np.errstate(invalid="ignore", over="ignore"):  # checked right below
+                    pred = predictor.predict(df)
+                bad = np.flatnonzero(~np.isfinite(pred.to_numpy()).all(axis=1))
+                if len(bad):  # null/missing/overflowing inputs
+                    raise ValueError(f"rows {bad[:10].tolist()} have missing or non-finite values "
+                                     f"for {predictor.features}")
+            except (KeyError, TypeError, ValueError) as e:
+                return self._send(400, {"error": str(e)})
+            self._send(200, {c: pred[c].tolist() for c in pred.columns})
+
+        def log_message(self, fmt, *args):
+            pass  # keep the console quiet under load
+
+    return ScoringHandler
+
+def serve(predictor: Predictor, host: str = "127.0.0.1", port: int = 8395):
+    server = ThreadingHTTPServer((host, port), make_handler(predictor))
+    print(f"[info] Scoring endpoint on http://{host}:{port}  (POST /predict, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+def benchmark(predictor: Predictor, n_rows: int = 1_000_000, repeats: int = 3, seed: int = 395) -> dict:
+    """Time vectorised scoring of synthetic scenario batches."""
+    rng = np.random.default_rng(seed)
+    X = rng.normal(size=(n_rows, len(predictor.features)))
+    times = []
+    for _ in range(repeats):
+        t0 = time.perf_counter()
+        predictor.predict_array(X)
+        times.append(time.perf_counter() - t0)
+    best = min(times)
+    res = {"rows": n_rows, "best_s": best, "rows_per_s": n_rows / best}
+    print(f"[bench] {n_rows:,} rows: best {best * 1e3:.1f} ms over {repeats} runs "
+          f"→ {res['rows_per_s']:,.0f} rows/s")
+    return res
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Score scenarios with the fitted OLS model.")
+    ap.add_argument("scenarios", nargs="?", type=Path, help="CSV with the model's feature columns")
+    ap.add_argument("-o", "--out", type=Path, help="output CSV (default: <scenarios>_pred.csv)")
+    ap.add_argument("--model", type=Path, default=MODEL_PATH)
+    ap.add_argument("--alpha", type=float, default=0.05, help="prediction interval level (default 0.05 → 95%%)")
+    ap.add_argument("--serve", action="store_true", help="run the local HTTP scoring endpoint")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8395)
+    ap.add_argument("--bench", type=int, metavar="ROWS", help="benchmark scoring of ROWS synthetic rows")
+    args = ap.parse_args(argv)
+
+    predictor = Predictor(args.model, alpha=args.alpha)
+    if args.bench:
+        benchmark(predictor, args.bench)
+    elif args.serve:
+        serve(predictor, args.host, args.port)
+    elif args.scenarios:
+        df = pd.read_csv(args.scenarios)
+        out = args.out or args.scenarios.with_name(args.scenarios.stem + "_pred.csv")
+        pd.concat([df, predictor.predict(df)], axis=1).to_csv(out, index=False)
+        print(f"[done] Scored {len(df)} rows → {out}")
+    else:
+        ap.print_help()
+        return 2
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
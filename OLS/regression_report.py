@@ -1,97 +1,195 @@
 # regression_report.py
 from pathlib import Path
-import pickle
-import pandas as pd
+import hashlib
+import html
+import re
+import sys
+import warnings
 import numpy as np
+from model_artifact import load_model_artifact
+import repo_root  # noqa: F401  (instrumentation, DataCleaning)
+from instrumentation import span
 
 # ---------- Portable, repo-relative paths ----------
 BASE_DIR   = Path(__file__).resolve().parent
-MODEL_PATH = BASE_DIR / "ols_model.pkl"
-DATA_PATH  = BASE_DIR / "preprocessed_data.csv"
+MODEL_PATH = BASE_DIR / "ols_model"
 REPORT_PATH = BASE_DIR / "ols_regression_report.md"
 
-def generate_regression_report(model_path: Path = MODEL_PATH,
-                               data_path: Path = DATA_PATH,
-                               report_path: Path = REPORT_PATH) -> Path:
-    if not model_path.exists():
-        raise FileNotFoundError(f"Missing model at {model_path}. Run `python ols_regression.py` first.")
-    if not data_path.exists():
-        raise FileNotFoundError(f"Missing data at {data_path}. Run `python data_loader.py` first.")
-
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
-
-    df = pd.read_csv(data_path)
-
-    # --- Collect model stats (robust to different statsmodels types) ---
-    dep_var   = getattr(model.model, "endog_names", "y")
-    nobs      = getattr(model, "nobs", len(getattr(model.model, "endog", [])))
-    r2        = getattr(model, "rsquared", None)
-    r2_adj    = getattr(model, "rsquared_adj", None)
-    aic       = getattr(model, "aic", None)
-    bic       = getattr(model, "bic", None)
-    fvalue    = getattr(model, "fvalue", None)
-    f_pvalue  = getattr(model, "f_pvalue", None)
-
-    # Coeff table
-    params = model.params
-    conf   = model.conf_int()
-    pvals  = model.pvalues
-    coef_df = pd.DataFrame({
-        "coef": params,
-        "std_err": getattr(model, "bse", pd.Series(index=params.index, dtype=float)),
-        "t_or_z": getattr(model, "tvalues", pd.Series(index=params.index, dtype=float)),
-        "p_value": pvals,
-        "ci_low": conf[0],
-        "ci_high": conf[1],
-    })
-    coef_df = coef_df.rename_axis("term").reset_index()
-    coef_df = coef_df.round(6)
-
-    # Markdown table for coefficients (first 120 terms to keep file reasonable)
-    def to_md_table(df: pd.DataFrame, max_rows: int = 120) -> str:
-        show = df.head(max_rows)
-        return show.to_markdown(index=False)
-
-    # Build markdown
-    lines = []
-    lines.append(f"# OLS Regression Report")
-    lines.append("")
-    lines.append(f"- **Working dir**: `{BASE_DIR}`")
-    lines.append(f"- **Model file** : `{model_path.name}`")
-    lines.append(f"- **Data file**  : `{data_path.name}`")
-    lines.append("")
-    lines.append("## Model Summary (key stats)")
-    lines.append("")
-    lines.append("| metric | value |")
-    lines.append("|---|---:|")
-    lines.append(f"| Dependent var | `{dep_var}` |")
-    lines.append(f"| N (obs) | {int(nobs) if pd.notna(nobs) else 'NA'} |")
-    lines.append(f"| R² | {r2:.6f} |" if r2 is not None else "| R² | NA |")
-    lines.append(f"| Adj. R² | {r2_adj:.6f} |" if r2_adj is not None else "| Adj. R² | NA |")
-    lines.append(f"| F-stat | {fvalue:.6f} |" if fvalue is not None else "| F-stat | NA |")
-    lines.append(f"| Prob(F) | {f_pvalue:.6g} |" if f_pvalue is not None else "| Prob(F) | NA |")
-    lines.append(f"| AIC | {aic:.6f} |" if aic is not None else "| AIC | NA |")
-    lines.append(f"| BIC | {bic:.6f} |" if bic is not None else "| BIC | NA |")
-    lines.append("")
-    lines.append("## Coefficients")
-    lines.append("")
-    lines.append(to_md_table(coef_df))
-    lines.append("")
-    lines.append("> Note: Values rounded to 6 decimals. Confidence intervals are usually 95% by default in statsmodels.")
-
-    # Save
-    report_text = "\n".join(lines)
-    report_path.write_text(report_text, encoding="utf-8")
-    print(f"[done] Wrote report → {report_path}")
+# first line of every generated report (second in HTML, after the doctype, so browsers
+# stay in standards mode); lets us skip regeneration when nothing changed
+FINGERPRINT_TAG = "<!-- model-fingerprint: {} -->"
+MAX_ROWS = 120  # coefficient rows per section, to keep the file reasonable
+
+NOTES = ["Values rounded to 6 decimals. Confidence intervals are 95% (statsmodels default)."]
+BOOT_SCHEMES = {"moving": "moving-block", "block": "non-overlapping block"}
+
+def _fmt(v, spec: str = ".6f") -> str:
+    if v is None or (isinstance(v, float) and np.isnan(v)):
+        return "NA"
+    return format(v, spec) if isinstance(v, (float, np.floating)) else str(v)
+
+def inference_notes(model) -> list:
+    """Describe the robust / bootstrap columns from the settings stored with the fit."""
+    cols = model.meta["coef_columns"]
+    inf = model.meta.get("inference") or {}
+    notes = []
+    robust = [c.split("_")[-1] for c in cols if c.startswith("std_err_")]
+    if robust:
+        text = ("`*_" + "` / `*_".join(robust) + "` columns use heteroskedasticity- and "
+                "autocorrelation-robust covariances")
+        if "hac" in robust and inf.get("hac_maxlags") is not None:
+            text += f" (Newey-West HAC with {inf['hac_maxlags']} lags)"
+        notes.append(text + ".")
+    if any(c.startswith("boot_") for c in cols):
+        boot = inf.get("bootstrap")
+        if boot:
+            notes.append(f"`boot_*` columns come from {boot['n_boot']} "
+                         f"{BOOT_SCHEMES.get(boot['scheme'], boot['scheme'])} bootstrap replicates "
+                         f"(block length {boot['block_len']}, seed {boot['seed']}).")
+        else:  # artifact written before the settings were stored
+            notes.append("`boot_*` columns come from a block bootstrap.")
+    return notes
+
+def model_section(model, title: str) -> dict:
+    """Everything a report section needs, taken from the compact artifact only."""
+    stats = [
+        ("Dependent var", f"`{model.target}`"),
+        ("N (obs)", str(int(model.nobs))),
+        ("R²", _fmt(model.rsquared)),
+        ("Adj. R²", _fmt(model.rsquared_adj)),
+        ("F-stat", _fmt(model.fvalue)),
+        ("Prob(F)", _fmt(model.f_pvalue, ".6g")),
+        ("AIC", _fmt(model.aic)),
+        ("BIC", _fmt(model.bic)),
+    ]
+    header = ["term"] + model.meta["coef_columns"]
+    table = np.asarray(model.coef_table)[:MAX_ROWS]
+    rows = [[term] + [_fmt(round(float(v), 6)) for v in row]
+            for term, row in zip(model.terms, table)]
+    return {"title": title, "model_file": model.path.name, "fingerprint": model.fingerprint,
+            "stats": stats, "header": header, "rows": rows, "notes": inference_notes(model)}
+
+# ---------- renderers: one pass over the section list ----------
+def render_markdown(sections, title: str) -> str:
+    out = [f"# {title}", "", f"- **Working dir**: `{BASE_DIR}`", ""]
+    # one model: its parts sit directly under the title; several: one h2 per model
+    sub = "##" if len(sections) == 1 else "###"
+    for s in sections:
+        if len(sections) > 1:
+            out += [f"## {s['title']}", ""]
+        out += [f"- **Model file** : `{s['model_file']}` (fingerprint `{s['fingerprint']}`)", ""]
+        out += [f"{sub} Model Summary (key stats)", "", "| metric | value |", "|---|---:|"]
+        out += [f"| {k} | {v} |" for k, v in s["stats"]]
+        out += ["", f"{sub} Coefficients", ""]
+        out.append("| " + " | ".join(s["header"]) + " |")
+        out.append("|" + "|".join([":---"] + ["---:"] * (len(s["header"]) - 1)) + "|")
+        out += ["| " + " | ".join(r) + " |" for r in s["rows"]]
+        out.append("")
+        if len(sections) > 1 and s["notes"]:
+            out += [f"> Note: {n}" for n in s["notes"]] + [""]
+    notes = NOTES + (sections[0]["notes"] if len(sections) == 1 else [])
+    out += [f"> Note: {n}" for n in notes]
+    return "\n".join(out) + "\n"
+
+def render_html(sections, title: str) -> str:
+    e = html.escape
+    code = lambda v: re.sub(r"`([^`]*)`", r"<code>\1</code>", e(v))
+    out = ["<!DOCTYPE html>", f"<html><head><meta charset='utf-8'><title>{e(title)}</title>",
+           "<style>table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:2px 6px}"
+           "td{text-align:right}td:first-child{text-align:left}</style></head><body>",
+           f"<h1>{e(title)}</h1>"]
+    for s in sections:
+        out.append(f"<h2>{e(s['title'])}</h2>")
+        out.append(f"<p>Model file <code>{e(s['model_file'])}</code> "
+                   f"(fingerprint <code>{e(s['fingerprint'])}</code>)</p>")
+        out.append("<table>" + "".join(f"<tr><td>{e(k)}</td><td>{code(v)}</td></tr>"
+                                       for k, v in s["stats"]) + "</table>")
+        out.append("<table><tr>" + "".join(f"<th>{e(h)}</th>" for h in s["header"]) + "</tr>")
+        out += ["<tr>" + "".join(f"<td>{e(v)}</td>" for v in r) + "</tr>" for r in s["rows"]]
+        out.append("</table>")
+        out += [f"<p><small>{code(n)}</small></p>" for n in s["notes"]]
+    out += [f"<p><small>{code(n)}</small></p>" for n in NOTES]
+    out.append("</body></html>")
+    return "\n".join(out) + "\n"
+
+RENDERERS = {".md": render_markdown, ".html": render_html}
+
+def _with_fingerprint(text: str, fp: str) -> str:
+    tag = FINGERPRINT_TAG.format(fp)
+    if text.startswith("<!DOCTYPE"):
+        doctype, _, rest = text.partition("\n")
+        return f"{doctype}\n{tag}\n{rest}"
+    return f"{tag}\n{text}"
+
+def _stored_fingerprint(report_path: Path):
+    if not report_path.exists():
+        return None
+    with open(report_path, encoding="utf-8") as f:
+        head = f.readline() + f.readline()
+    m = re.search(r"^<!-- model-fingerprint: (\w+) -->$", head, re.M)
+    return m.group(1) if m else None
+
+def generate_batch_report(model_paths, report_path: Path = REPORT_PATH,
+                          title: str = "OLS Regression Report", force: bool = False) -> Path:
+    """
+    One report with a section per model artifact (specifications, rolling windows, ...).
+    Format follows the report suffix (.md or .html). The file is only rewritten when
+    the combined model fingerprint differs from the one stored in its first line.
+    """
+    report_path = Path(report_path)
+    render = RENDERERS.get(report_path.suffix.lower())
+    if render is None:
+        raise ValueError(f"Unsupported report format {report_path.suffix!r}; use .md or .html")
+
+    if isinstance(model_paths, dict):
+        named = list(model_paths.items())
+    else:
+        named = [(Path(p).name, p) for p in model_paths]
+    models = [(name, load_model_artifact(p)) for name, p in named]
+
+    fp = hashlib.sha256("|".join(f"{n}={m.fingerprint}" for n, m in models).encode()).hexdigest()[:16]
+    if not force and _stored_fingerprint(report_path) == fp:
+        print(f"[skip] Report up to date (fingerprint {fp}) → {report_path}")
+        return report_path
+
+    with span("write", stage="report", rows_in=len(models)) as sp:
+        sections = [model_section(m, name) for name, m in models]
+        text = _with_fingerprint(render(sections, title), fp)
+        report_path.write_text(text, encoding="utf-8")
+        sp.wrote(report_path)
+    print(f"[done] Wrote report → {report_path} ({len(sections)} section(s))")
     return report_path
 
-def main():
+def generate_regression_report(model_path: Path = MODEL_PATH,
+                               data_path: Path = None,
+                               report_path: Path = REPORT_PATH,
+                               *, force: bool = False) -> Path:
+    """
+    Single-model report. `data_path` is deprecated and ignored: every number now comes
+    from the model artifact. It stays in its old position so positional calls still
+    bind report_path correctly.
+    """
+    if data_path is not None:
+        warnings.warn("generate_regression_report(data_path=...) is ignored; the report is built "
+                      "from the model artifact alone", DeprecationWarning, stacklevel=2)
+    return generate_batch_report([model_path], report_path, force=force)
+
+def main(argv=None):
+    # python regression_report.py [model_dir ...] [--out report.md|report.html] [--force]
+    argv = sys.argv[1:] if argv is None else list(argv)
+    force = "--force" in argv
+    argv = [a for a in argv if a != "--force"]
+    out = REPORT_PATH
+    if "--out" in argv:
+        i = argv.index("--out")
+        out = Path(argv[i + 1])
+        del argv[i:i + 2]
+    models = [Path(a) for a in argv] or [MODEL_PATH]
+
     print(f"[info] BASE_DIR   = {BASE_DIR}")
-    print(f"[info] MODEL_PATH = {MODEL_PATH}")
-    print(f"[info] DATA_PATH  = {DATA_PATH}")
-    print(f"[info] REPORT_OUT = {REPORT_PATH}")
-    generate_regression_report()
+    print(f"[info] MODELS     = {[str(m) for m in models]}")
+    print(f"[info] REPORT_OUT = {out}")
+    generate_batch_report(models, out, force=force)
 
 if __name__ == "__main__":
     main()
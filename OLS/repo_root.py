@@ -0,0 +1,10 @@
+# repo_root.py — put the repository root on sys.path for the OLS scripts
+#
+# The OLS scripts run from OLS/ and import each other flat; instrumentation.py and the
+# DataCleaning package live one level up. `import repo_root` once, before those imports.
+import sys
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parents[1]
+if str(REPO) not in sys.path:
+    sys.path.append(str(REPO))
@@ -1,66 +1,67 @@
 # result_visual.py
 from pathlib import Path
-import pickle
 import pandas as pd
-import matplotlib.pyplot as plt
+from model_artifact import load_model_artifact
+from schema import load_schema
+from panel import read_columns
+from plotting import plot_actual_fitted
+import repo_root  # noqa: F401  (instrumentation, DataCleaning)
+from instrumentation import span
 
 # ---------- Portable, repo-relative paths ----------
 BASE_DIR = Path(__file__).resolve().parent
-MODEL_PATH = BASE_DIR / "ols_model.pkl"
+MODEL_PATH = BASE_DIR / "ols_model"
 DATA_PATH = BASE_DIR / "preprocessed_data.csv"
 FIG_PATH = BASE_DIR / "ols_fitted_actual.png"
+# ols_residuals_analysis.png is written by ols_regression.py
 
 def load_model_and_data(model_path: Path = MODEL_PATH, data_path: Path = DATA_PATH):
-    if not model_path.exists():
-        raise FileNotFoundError(
-            f"Missing model file: {model_path}\n"
-            "Run `python ols_regression.py` first to create it."
-        )
-    with open(model_path, "rb") as f:
-        model = pickle.load(f)
+    model = load_model_artifact(model_path)
 
     if not data_path.exists():
         raise FileNotFoundError(
             f"Missing data file: {data_path}\n"
             "Run `python data_loader.py` (or your preprocessing step) to create it."
         )
-    df = pd.read_csv(data_path)
+    roles = load_schema(data_path, required=False)  # fail fast on schema drift
+    date_col = roles.get("date")
+    usecols = [model.target] + model.features + ([date_col] if date_col else [])
+    with span("parse", stage="plot") as sp:
+        sp.read(data_path)
+        df = read_columns(data_path, usecols, date_col)  # mmap panel if fresh, else CSV
+        sp.rows_out = len(df)
+    if date_col:
+        df = df.rename(columns={date_col: "date"})
     return model, df
 
 def build_plot_df(model, df: pd.DataFrame) -> pd.DataFrame:
-    # Get actual y from the model/df in a robust way
-    target_name = getattr(model.model, "endog_names", None)
-    if target_name and target_name in df.columns:
-        actual = df[target_name].reset_index(drop=True)
-    else:
-        # Fall back to endog from the fitted model
-        actual = pd.Series(getattr(model.model, "endog", []), name=target_name or "y").reset_index(drop=True)
-
-    fitted = pd.Series(model.fittedvalues, name="fitted").reset_index(drop=True)
+    # Fitted values are computed from the data on demand (rows used in the fit only)
+    fitted = model.fitted_values(df)
+    resid = model.residuals(df)
+    actual = df.loc[fitted.index, model.target]
 
-    # Align lengths safely
-    n = min(len(actual), len(fitted))
     plot_df = pd.DataFrame({
-        "obs": range(1, n + 1),
-        "actual": actual.iloc[:n].values,
-        "fitted": fitted.iloc[:n].values,
+        "obs": range(1, len(fitted) + 1),
+        "actual": actual.values,
+        "fitted": fitted.values,
+        "resid": resid.values,
     })
+    if "date" in df.columns:
+        plot_df.insert(0, "date", df.loc[fitted.index, "date"].values)
     return plot_df
 
-def make_plot(plot_df: pd.DataFrame, fig_path: Path = FIG_PATH):
-    # Line plot over observation index; defaults use matplotlib's colors
-    plt.figure(figsize=(9, 5.5))
-    plt.plot(plot_df["obs"], plot_df["actual"], label="Actual", linewidth=1.6)
-    plt.plot(plot_df["obs"], plot_df["fitted"], label="Fitted", linewidth=1.6)
-    plt.xlabel("Observation")
-    plt.ylabel("Value")
-    plt.title("OLS: Actual vs. Fitted")
-    plt.legend()
-    plt.tight_layout()
-    plt.savefig(fig_path, dpi=300, bbox_inches="tight")
-    plt.close()
+def _x_axis(plot_df: pd.DataFrame):
+    # Real dates on the x-axis when the data has them, observation index otherwise
+    if "date" in plot_df.columns:
+        return plot_df["date"].values, "Date"
+    return plot_df["obs"].values, "Observation"
 
-def main():
+def make_plot(plot_df: pd.DataFrame, fig_path: Path = FIG_PATH, mode: str = "auto"):
+    x, xlabel = _x_axis(plot_df)
+    return plot_actual_fitted(x, plot_df["actual"].values, plot_df["fitted"].values,
+                              fig_path, mode=mode, xlabel=xlabel)
+
+def main(mode: str = "auto"):
     print(f"[info] BASE_DIR     = {BASE_DIR}")
     print(f"[info] MODEL_PATH   = {MODEL_PATH}")
     print(f"[info] DATA_PATH    = {DATA_PATH}")
@@ -68,9 +69,11 @@ def main():
 
     model, df = load_model_and_data()
     plot_df = build_plot_df(model, df)
-    make_plot(plot_df)
+
+    with span("plot", stage="plot", rows_in=len(plot_df)) as sp:
+        make_plot(plot_df, FIG_PATH, mode=mode)
+        sp.wrote(FIG_PATH)
     print(f"[done] Saved figure → {FIG_PATH}")
 
 if __name__ == "__main__":
     main()
-
@@ -0,0 +1,105 @@
+# robust_inference.py — HC / Newey-West HAC covariances + batched block bootstrap
+from concurrent.futures import ProcessPoolExecutor
+import os
+import numpy as np
+import pandas as pd
+
+# default covariance estimators reported next to the classic OLS standard errors
+ROBUST_COV_TYPES = ("HC1", "HAC")
+
+# cap on the (batch, n, k) gather buffer built for one batched solve
+BATCH_BYTES = 64 * 1024 * 1024
+
+def newey_west_lags(nobs: int) -> int:
+    """Newey-West (1994) rule of thumb: floor(4 * (n/100)^(2/9))."""
+    return int(np.floor(4 * (nobs / 100.0) ** (2.0 / 9.0)))
+
+def default_block_len(nobs: int) -> int:
+    """Block length ~ n^(1/3), the usual rate for moving-block bootstraps."""
+    return max(1, int(round(nobs ** (1.0 / 3.0))))
+
+def robust_table(model, cov_types=ROBUST_COV_TYPES, hac_maxlags=None) -> pd.DataFrame:
+    """
+    Re-use the fitted OLS to compute HC* / HAC standard errors and p-values.
+    Returns one row per term with columns std_err_<cov>, p_value_<cov>.
+    """
+    out = pd.DataFrame(index=model.params.index)
+    for cov in cov_types:
+        kw = {}
+        if cov.upper() == "HAC":
+            kw["maxlags"] = hac_maxlags if hac_maxlags is not None else newey_west_lags(int(model.nobs))
+        rob = model.get_robustcov_results(cov_type=cov.upper(), **kw)
+        tag = cov.lower()
+        out[f"std_err_{tag}"] = np.asarray(rob.bse)
+        out[f"p_value_{tag}"] = np.asarray(rob.pvalues)
+    return out
+
+def _block_indices(rng, n: int, block_len: int, size: int, scheme: str) -> np.ndarray:
+    """(size, n) row indices built from blocks of length block_len."""
+    n_blocks = -(-n // block_len)
+    if scheme == "moving":
+        # overlapping blocks: any start in [0, n - block_len]
+        starts = rng.integers(0, n - block_len + 1, size=(size, n_blocks))
+    elif scheme == "block":
+        # non-overlapping blocks: starts on the block grid only
+        starts = rng.integers(0, n // block_len, size=(size, n_blocks)) * block_len
+    else:
+        raise ValueError(f"Unknown bootstrap scheme {scheme!r}; use 'moving' or 'block'.")
+    idx = starts[:, :, None] + np.arange(block_len)
+    return idx.reshape(size, -1)[:, :n]
+
+def _bootstrap_batch(X: np.ndarray, y: np.ndarray, block_len: int, size: int,
+                     seed, scheme: str) -> np.ndarray:
+    """Draw `size` block resamples and solve all normal equations in one call."""
+    rng = np.random.default_rng(seed)
+    idx = _block_indices(rng, len(y), block_len, size, scheme)
+    Xb = X[idx]                      # (size, n, k)
+    yb = y[idx]                      # (size, n)
+    XtX = np.einsum("bni,bnj->bij", Xb, Xb)
+    Xty = np.einsum("bni,bn->bi", Xb, yb)
+    try:
+        return np.linalg.solve(XtX, Xty[..., None])[..., 0]
+    except np.linalg.LinAlgError:
+        # a replicate can be rank-deficient (e.g. a dummy never drawn)
+        return np.einsum("bij,bj->bi", np.linalg.pinv(XtX), Xty)
+
+def block_bootstrap(X, y, n_boot: int = 2000, block_len=None, scheme: str = "moving",
+                    seed: int = 395, n_jobs=None, batch_size=None) -> np.ndarray:
+    """
+    Moving-block (or non-overlapping block) bootstrap of OLS coefficients.
+
+    Replicates are solved in batches with NumPy and the batches are spread over a
+    process pool. Each batch gets its own child of SeedSequence(seed), so the
+    draws depend only on (seed, n_boot, batch_size) and not on n_jobs.
+    Returns an (n_boot, k) array of coefficient draws.
+    """
+    X = np.ascontiguousarray(X, dtype=float)
+    y = np.ascontiguousarray(y, dtype=float)
+    n, k = X.shape
+    block_len = default_block_len(n) if block_len is None else int(block_len)
+    if not 1 <= block_len <= n:
+        raise ValueError(f"block_len must be in [1, {n}], got {block_len}")
+    if batch_size is None:
+        batch_size = max(1, min(n_boot, BATCH_BYTES // (8 * n * (k + 1))))
+
+    sizes = [min(batch_size, n_boot - i) for i in range(0, n_boot, batch_size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    n_jobs = n_jobs or os.cpu_count() or 1
+
+    if n_jobs == 1 or len(sizes) == 1:
+        parts = [_bootstrap_batch(X, y, block_len, s, ss, scheme) for s, ss in zip(sizes, seeds)]
+    else:
+        with ProcessPoolExecutor(max_workers=min(n_jobs, len(sizes))) as pool:
+            futs = [pool.submit(_bootstrap_batch, X, y, block_len, s, ss, scheme)
+                    for s, ss in zip(sizes, seeds)]
+            parts = [f.result() for f in futs]
+    return np.vstack(parts)
+
+def bootstrap_table(draws: np.ndarray, terms, alpha: float = 0.05) -> pd.DataFrame:
+    """Summarise bootstrap draws: standard error and percentile confidence interval."""
+    lo, hi = np.nanpercentile(draws, [100 * alpha / 2, 100 * (1 - alpha / 2)], axis=0)
+    return pd.DataFrame({
+        "boot_std_err": np.nanstd(draws, axis=0, ddof=1),
+        "boot_ci_low": lo,
+        "boot_ci_high": hi,
+    }, index=pd.Index(terms))
@@ -0,0 +1,103 @@
+# schema.py — shared column-role resolver for the OLS scripts (+ persisted mapping)
+from pathlib import Path
+import csv
+import json
+import re
+
+# keywords to find columns (case-insensitive, allows optional suffixes like _t),
+# listed in priority order per role. "price" is the strict form of "target" without
+# the "p" fallback, for raw panels where a "p..." column may be something else.
+KEYS = {
+    "target": ["price", "p"],
+    "price": ["price"],
+    "load": ["load"],
+    "cdd": ["cdd", "coolingdegree", "cooling_deg"],
+    "hdd": ["hdd", "heatingdegree", "heating_deg"],
+    "renew": ["renewableshare", "renew_share", "renew", "rs", "solar_wind_share"],
+    "date": ["date", "timestamp", "time"],
+}
+FEATURE_ROLES = ("load", "cdd", "hdd", "renew")
+REQUIRED = {
+    "target": "Price (target)",
+    "load": "Load",
+    "cdd": "CDD",
+    "hdd": "HDD",
+    "renew": "RenewableShare",
+}
+
+# compiled once at import instead of once per keyword × column × call
+_PATTERNS = {
+    role: [re.compile(rf"^{re.escape(kw)}(_?\w+)?$", flags=re.I) for kw in kws]
+    for role, kws in KEYS.items()
+}
+
+def schema_path(data_path: Path) -> Path:
+    """preprocessed_data.csv → preprocessed_data.schema.json (same folder)."""
+    data_path = Path(data_path)
+    return data_path.with_name(data_path.stem + ".schema.json")
+
+def resolve_columns(cols) -> dict:
+    """
+    Map every role in KEYS to a column in one pass over `cols`.
+    Same rule as before: the highest-priority keyword wins, ties go to the earliest column.
+    Roles with no match map to None.
+    """
+    best = {role: (len(pats), None) for role, pats in _PATTERNS.items()}
+    for col in cols:
+        for role, pats in _PATTERNS.items():
+            rank_now = best[role][0]
+            for rank, pat in enumerate(pats[:rank_now]):
+                if pat.match(col):
+                    best[role] = (rank, col)
+                    break
+    return {role: col for role, (_, col) in best.items()}
+
+def check_required(roles: dict, cols, source: str = "preprocessed_data.csv"):
+    missing = [label for role, label in REQUIRED.items() if roles.get(role) is None]
+    if missing:
+        raise KeyError(
+            f"Could not find required columns in {source}:\n"
+            f"  Missing: {missing}\n"
+            f"  Available columns: {list(cols)}\n"
+            "Tip: rename your headers or extend KEYS in schema.py."
+        )
+
+def read_header(data_path: Path) -> list:
+    """Column names from the first line only (no full CSV parse)."""
+    with open(data_path, newline="", encoding="utf-8-sig") as f:
+        return [c.strip() for c in next(csv.reader(f), [])]
+
+def write_schema(data_path: Path, cols) -> Path:
+    """Persist the resolved role → column mapping next to the data file."""
+    cols = list(cols)
+    out = schema_path(data_path)
+    out.write_text(json.dumps({"columns": cols, "roles": resolve_columns(cols)}, indent=2),
+                   encoding="utf-8")
+    return out
+
+def load_schema(data_path: Path, required: bool = True) -> dict:
+    """
+    Return the role → column mapping for `data_path`.
+
+    If a persisted schema exists, only the header line is read and compared with it;
+    any difference is schema drift and fails fast. Without one, roles are resolved
+    from the header.
+    """
+    data_path = Path(data_path)
+    header = read_header(data_path)
+    sp = schema_path(data_path)
+    if sp.exists():
+        saved = json.loads(sp.read_text(encoding="utf-8"))
+        if saved["columns"] != header:
+            raise KeyError(
+                f"Schema drift in {data_path.name}: header no longer matches {sp.name}.\n"
+                f"  Expected: {saved['columns']}\n"
+                f"  Found:    {header}\n"
+                "Re-run `python data_loader.py` to regenerate both files."
+            )
+        roles = saved["roles"]
+    else:
+        roles = resolve_columns(header)
+    if required:
+        check_required(roles, header, data_path.name)
+    return roles
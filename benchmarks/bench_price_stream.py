@@ -0,0 +1,141 @@
+'''
+---------------------------------------------------------------
+Replay benchmark for the incremental RTM price aggregator
+---------------------------------------------------------------
+
+    python benchmarks/bench_price_stream.py --days 31 --points 15
+    python benchmarks/bench_price_stream.py --days 366 --points 500 --files --out stream.json
+
+Replays synthetic 15-minute settlement intervals (ERCOT DST conventions from
+fixtures.py) into DataCleaning/price_stream.PriceAggregator one interval at a time
+and reports the per-interval update latency (p50/p95/p99/max), throughput, O(1)
+query latency and checkpoint size/time. The final state is checked against the
+batch clean_price aggregation (hourly mean → daily mean) of the same rows.
+--files writes every interval as a CSV and goes through the directory poll instead,
+so parsing is included in the latency.
+'''
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(REPO / "benchmarks"))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from fixtures import SETTLEMENT_POINTS, hour_endings  # noqa: E402
+from DataCleaning.price_stream import PriceAggregator  # noqa: E402
+
+
+def intervals(days: int, n_points: int, seed: int):
+    '''Yield (name, frame) per 15-minute interval, in posting order.'''
+    rng = np.random.default_rng(seed)
+    names = [n for n, _ in SETTLEMENT_POINTS][:n_points]
+    names += [f"RN_{i:05d}" for i in range(n_points - len(names))]
+    for k in range(days):
+        day = date(2024, 1, 1) + timedelta(days=k)
+        for h, flag in hour_endings(day):
+            for q in range(1, 5):
+                yield f"{day:%Y%m%d}.{h:02d}{flag}{q}", pd.DataFrame({
+                    "DeliveryDate": day.strftime("%m/%d/%Y"),
+                    "DeliveryHour": h,
+                    "DeliveryInterval": q,
+                    "SettlementPointName": names,
+                    "SettlementPointPrice": np.round(rng.lognormal(np.log(30), 0.5, n_points) - 2.0, 2),
+                    "DSTFlag": flag,
+                })
+
+
+def _pct(a: np.ndarray) -> dict:
+    return {f"p{q}": float(np.percentile(a, q)) for q in (50, 95, 99)} | {"max": float(a.max()),
+                                                                          "mean": float(a.mean())}
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Replay RTM intervals through the incremental aggregator.")
+    ap.add_argument("--days", type=int, default=31)
+    ap.add_argument("--points", type=int, default=15, help="settlement points per interval")
+    ap.add_argument("--files", action="store_true", help="replay through interval CSVs + poll()")
+    ap.add_argument("--queries", type=int, default=10_000)
+    ap.add_argument("--seed", type=int, default=395)
+    ap.add_argument("--out", type=Path, default=REPO / "benchmarks" / "price_stream_results.json")
+    args = ap.parse_args(argv)
+
+    agg = PriceAggregator()
+    lat_ns, frames = [], []
+    with tempfile.TemporaryDirectory(prefix="rtm_stream_") as tmp:
+        for name, df in intervals(args.days, args.points, args.seed):
+            frames.append(df)
+            if args.files:
+                df.to_csv(os.path.join(tmp, f"{name}.csv"), index=False)
+                t0 = time.perf_counter_ns()
+                agg.poll(tmp)
+            else:
+                t0 = time.perf_counter_ns()
+                agg.ingest_frame(df)
+            lat_ns.append(time.perf_counter_ns() - t0)
+
+        ckpt = Path(tmp) / "state.npz"
+        t0 = time.perf_counter()
+        agg.save(ckpt)
+        save_s = time.perf_counter() - t0
+        size = ckpt.stat().st_size
+        t0 = time.perf_counter()
+        PriceAggregator.load(ckpt)
+        load_s = time.perf_counter() - t0
+
+    lat_us = np.asarray(lat_ns) / 1e3
+    total_s = lat_us.sum() / 1e6
+    print(f"[bench] {len(lat_us)} intervals × {args.points} points"
+          f"{' (files)' if args.files else ''}: p50 {np.percentile(lat_us, 50):.0f} µs, "
+          f"p99 {np.percentile(lat_us, 99):.0f} µs, max {lat_us.max():.0f} µs, "
+          f"{len(lat_us) / total_s:,.0f} intervals/s")
+
+    # O(1) queries against the latest day
+    pts = agg.points
+    rng = np.random.default_rng(args.seed)
+    pick = [pts[i] for i in rng.integers(0, len(pts), args.queries)]
+    t0 = time.perf_counter_ns()
+    for p in pick:
+        agg.daily(p)
+        agg.month_to_date(p)
+    query_ns = (time.perf_counter_ns() - t0) / (2 * args.queries)
+    print(f"[bench] query {query_ns:.0f} ns (daily + month-to-date), checkpoint "
+          f"{size / 1e6:.1f} MB in {save_s * 1e3:.0f} ms, reload {load_s * 1e3:.0f} ms")
+
+    # same numbers as the batch path in clean_price?
+    full = pd.concat(frames, ignore_index=True)
+    full["DeliveryDate"] = pd.to_datetime(full["DeliveryDate"])
+    hourly = full.groupby(["SettlementPointName", "DeliveryDate", "DeliveryHour"])["SettlementPointPrice"].mean()
+    batch = hourly.groupby(level=[0, 1]).mean().rename("batch").reset_index()
+    inc = agg.daily_frame().rename(columns={"settlement_point": "SettlementPointName",
+                                            "date": "DeliveryDate"})
+    both = batch.merge(inc, on=["SettlementPointName", "DeliveryDate"], how="outer")
+    max_diff = float((both["batch"] - both["Price_t"]).abs().max())
+    running = np.array([agg.daily(p) for p in pts])
+    last = both[both["DeliveryDate"] == both["DeliveryDate"].max()].set_index("SettlementPointName")["batch"]
+    drift = float(np.abs(running - last.loc[pts].to_numpy()).max())
+    print(f"[check] max |batch - exported| {max_diff:.2e}, max |batch - running daily()| {drift:.2e}")
+
+    payload = {
+        "config": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+        "intervals": len(lat_us), "rows": agg.n_rows,
+        "update_latency_us": _pct(lat_us), "intervals_per_s": len(lat_us) / total_s,
+        "query_ns": query_ns,
+        "checkpoint": {"bytes": size, "save_s": save_s, "load_s": load_s},
+        "check": {"max_abs_diff_export": max_diff, "max_abs_diff_running": drift},
+    }
+    args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(f"[done] Wrote price stream benchmark → {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,160 @@
+'''
+---------------------------------------------------------------
+Offline load test of DataScraping against the mock server
+---------------------------------------------------------------
+
+    python benchmarks/bench_scraping.py --fault-every 7 --latency-ms 20 --page-limit 10
+    python benchmarks/bench_scraping.py --concurrency 4 --out scraping.json
+
+Starts benchmarks/mock_server.py in-process on a free port, points the
+fetchers at it and reports, per fetcher: wall time, requests/sec seen by
+the server, injected faults, and how much of the wall time was spent
+sleeping in retry back-off versus page pacing.
+'''
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))  # DataScraping.py imports instrumentation
+sys.path.insert(0, str(REPO / "benchmarks"))
+
+from mock_server import MockState, build_archives, start_server  # noqa: E402
+
+ZONES = {
+    "HOUSTON": "GHCND:USW00012960",
+    "NORTH":   "GHCND:USW00003927",
+    "SOUTH":   "GHCND:USW00012921",
+    "WEST":    "GHCND:USW00023023",
+}
+
+
+class SleepMeter:
+    '''Stand-in for the `time` module inside DataScraping that tallies sleep().'''
+
+    def __init__(self, page_sleep: float):
+        self.page_sleep = page_sleep
+        self.pacing_s = 0.0
+        self.retry_s = 0.0
+        self.retries = 0
+        self._lock = threading.Lock()
+
+    def sleep(self, seconds: float):
+        # the fetcher sleeps exactly `sleep_between_pages` between pages; anything else is back-off
+        with self._lock:
+            if seconds == self.page_sleep:
+                self.pacing_s += seconds
+            else:
+                self.retry_s += seconds
+                self.retries += 1
+        time.sleep(seconds)
+
+    def __getattr__(self, name):
+        return getattr(time, name)
+
+
+def _load_scraper():
+    spec = importlib.util.spec_from_file_location("DataScraping", REPO / "DataScraping" / "DataScraping.py")
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+def timed(name: str, state: MockState, meter: SleepMeter, fn) -> dict:
+    before = state.snapshot()
+    p0, r0, n0 = meter.pacing_s, meter.retry_s, meter.retries
+    error = None
+    t0 = time.perf_counter()
+    try:
+        fn()
+    except Exception as e:  # e.g. an injected fault on a fetcher without retries
+        error = repr(e)
+    wall = time.perf_counter() - t0
+    after = state.snapshot()
+    reqs = after["requests"] - before["requests"]
+    res = {
+        "name": name,
+        "wall_s": wall,
+        "requests": reqs,
+        "requests_per_s": reqs / wall if wall else None,
+        "faults": after["faults"] - before["faults"],
+        "pages": after["pages"] - before["pages"],
+        "retries": meter.retries - n0,
+        "retry_sleep_s": meter.retry_s - r0,
+        "pacing_sleep_s": meter.pacing_s - p0,
+        "error": error,
+    }
+    print(f"[bench] {name:<26} {wall:8.2f}s  {reqs:5d} req  {res['requests_per_s'] or 0:7.1f} req/s  "
+          f"faults {res['faults']:3d}  retry sleep {res['retry_sleep_s']:6.2f}s"
+          + (f"  ERROR {error}" if error else ""))
+    return res
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the scraping module against a local mock.")
+    ap.add_argument("--fault-every", type=int, default=7)
+    ap.add_argument("--fault-codes", default="429,503,500")
+    ap.add_argument("--latency-ms", type=float, default=10.0)
+    ap.add_argument("--jitter-ms", type=float, default=5.0)
+    ap.add_argument("--page-limit", type=int, default=10, help="CDO page size (small → more pages)")
+    ap.add_argument("--sleep-between-pages", type=float, default=0.0)
+    ap.add_argument("--backoff-base", type=float, default=0.8)
+    ap.add_argument("--fault-all", action="store_true", help="also fail the ERCOT ZIP routes")
+    ap.add_argument("--concurrency", type=int, default=1, help="parallel NOAA fetches, one zone each")
+    ap.add_argument("--out", type=Path, default=REPO / "benchmarks" / "scraping_results.json")
+    args = ap.parse_args(argv)
+
+    state = MockState(args.fault_every, tuple(int(c) for c in args.fault_codes.split(",")),
+                      args.latency_ms, args.jitter_ms, fault_all=args.fault_all)
+    build_archives(state)
+    server = start_server(state)
+    host, port = server.server_address
+    base = f"http://{host}:{port}"
+    print(f"[info] Mock server on {base}")
+
+    os.environ.setdefault("NOAA_TOKEN", "mock-token")
+    ds = _load_scraper()
+    meter = SleepMeter(args.sleep_between_pages)
+    ds.time = meter
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="scrape_bench_") as tmp:
+        def noaa(zones, sub):
+            ds.fetch_noaa_weather_2024(
+                out_dir=os.path.join(tmp, sub), zones=zones, page_limit=args.page_limit,
+                sleep_between_pages=args.sleep_between_pages, backoff_base=args.backoff_base,
+                base_url=f"{base}/cdo-web/api/v2/data")
+
+        if args.concurrency <= 1:
+            results.append(timed("fetch_noaa_weather", state, meter, lambda: noaa(ZONES, "noaa")))
+        else:
+            def fan_out():
+                with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+                    list(pool.map(lambda kv: noaa(dict([kv]), kv[0]), ZONES.items()))
+            results.append(timed(f"fetch_noaa_weather x{args.concurrency}", state, meter, fan_out))
+
+        results.append(timed("fetch_ercot_lmp", state, meter, lambda: ds.fetch_ercot_lmp_2024(
+            url=f"{base}/misdownload/servlets/mirDownload?doclookupId=1", output_dir=os.path.join(tmp, "price"))))
+        results.append(timed("fetch_ercot_renewableshare", state, meter,
+                             lambda: ds.fetch_ercot_renewableshare_2024_from_archive(
+                                 url=f"{base}/files/docs/FuelMixReport_PreviousYears.zip",
+                                 output_dir=os.path.join(tmp, "RenewableShare"))))
+
+    server.shutdown()
+    payload = {"config": {k: (str(v) if isinstance(v, Path) else v) for k, v in vars(args).items()},
+               "server": state.snapshot(), "results": results}
+    args.out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(f"[done] Wrote scraping benchmark → {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+'''
+---------------------------------------------------------------
+Synthetic, schema-faithful raw inputs for the pipeline
+---------------------------------------------------------------
+
+Writes the same files DataScraping/ produces, under <root>/DataScraping/Rawdata:
+
+    price/Price.xlsx                          RTM SPP workbook, one sheet per month
+    load/load.zip                             ZIP of daily ZIPs, one CSV each
+    load/load_raw_data/*.csv                  the extracted daily CSVs
+    CDD_HDD/noaa_raw.csv                      [date, zone, station_id, datatype, value]
+    RenewableShare/IntGenbyFuel<year>.xlsx    fuel mix workbook per year
+
+Scale runs from 1 year / 1 hub up to N years / all settlement points.
+Values are random but plausible, and the DST conventions match ERCOT's
+(skipped HE03 in March, repeated HE02 with DSTFlag=Y in November).
+'''
+
+import os
+import zipfile
+from datetime import date, timedelta
+from io import BytesIO
+
+import numpy as np
+import pandas as pd
+
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+
+SETTLEMENT_POINTS = [
+    ("HB_BUSAVG", "SH"), ("HB_HOUSTON", "HU"), ("HB_HUBAVG", "SH"), ("HB_NORTH", "HU"),
+    ("HB_PAN", "HU"), ("HB_SOUTH", "HU"), ("HB_WEST", "HU"),
+    ("LZ_AEN", "LZ"), ("LZ_CPS", "LZ"), ("LZ_HOUSTON", "LZ"), ("LZ_LCRA", "LZ"),
+    ("LZ_NORTH", "LZ"), ("LZ_RAYBN", "LZ"), ("LZ_SOUTH", "LZ"), ("LZ_WEST", "LZ"),
+]
+WEATHER_ZONES = ["NORTH", "SOUTH", "WEST", "HOUSTON"]
+NOAA_STATIONS = {
+    "HOUSTON": "GHCND:USW00012960",
+    "NORTH":   "GHCND:USW00003927",
+    "SOUTH":   "GHCND:USW00012921",
+    "WEST":    "GHCND:USW00023023",
+}
+FUELS = ["Biomass", "Coal", "Gas", "Gas-CC", "Hydro", "Nuclear", "Other", "Solar", "Wind", "WSL"]
+# 15-minute interval columns as ERCOT labels them: 0:15, 0:30, ..., 23:45, and 0:00 for
+# the interval ending at midnight. November sheets repeat the HE02 columns (1:15-2:00)
+# for the fall-back day; on the spring-forward day the HE03 cells (2:15-3:00) are empty.
+FUEL_INTERVALS = [f"{q * 15 // 60}:{q * 15 % 60:02d}" for q in range(1, 96)] + ["0:00"]
+FUEL_HE02, FUEL_HE03 = slice(4, 8), slice(8, 12)
+
+
+def _dst_days(year: int) -> tuple[date, date]:
+    '''US DST (2007+): 2nd Sunday of March, 1st Sunday of November.'''
+    mar = date(year, 3, 1)
+    spring = mar + timedelta(days=(6 - mar.weekday()) % 7 + 7)
+    nov = date(year, 11, 1)
+    fall = nov + timedelta(days=(6 - nov.weekday()) % 7)
+    return spring, fall
+
+
+def hour_endings(day: date) -> list[tuple[int, str]]:
+    '''ERCOT hour-ending labels for one operating day as (hour, DSTFlag) pairs.'''
+    spring, fall = _dst_days(day.year)
+    hours = [(h, "N") for h in range(1, 25)]
+    if day == spring:
+        hours = [x for x in hours if x[0] != 3]
+    elif day == fall:
+        hours.insert(2, (2, "Y"))
+    return hours
+
+
+def _days(years) -> list[date]:
+    out = []
+    for y in years:
+        d = date(y, 1, 1)
+        while d.year == y:
+            out.append(d)
+            d += timedelta(days=1)
+    return out
+
+
+def _seasonal(days: list[date], rng, base: float, amp: float, noise: float) -> np.ndarray:
+    doy = np.array([d.timetuple().tm_yday for d in days], dtype=float)
+    return base + amp * np.cos(2 * np.pi * (doy - 200) / 365.25) + rng.normal(0, noise, len(days))
+
+
+def write_price_xlsx(root: str, years, n_hubs: int, rng) -> str:
+    '''RTM "Load Zone and Hub" SPP workbook: 15-minute prices, one sheet per month.'''
+    out = os.path.join(root, "DataScraping", "Rawdata", "price", "Price.xlsx")
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    points = SETTLEMENT_POINTS[:n_hubs]
+    multi_year = len(years) > 1
+    with pd.ExcelWriter(out, engine="openpyxl") as xw:
+        for y in years:
+            for m, mon in enumerate(MONTHS, start=1):
+                days = [d for d in _days([y]) if d.month == m]
+                rows = []
+                for d in days:
+                    for h, flag in hour_endings(d):
+                        for q in range(1, 5):
+                            rows.append((d.strftime("%m/%d/%Y"), h, q, flag))
+                base = pd.DataFrame(rows, columns=["Delivery Date", "Delivery Hour",
+                                                   "Delivery Interval", "Repeated Hour Flag"])
+                parts = []
+                for name, kind in points:
+                    p = base.copy()
+                    p["Settlement Point Name"] = name
+                    p["Settlement Point Type"] = kind
+                    p["Settlement Point Price"] = np.round(
+                        rng.lognormal(np.log(30), 0.5, len(p)) - 2.0, 2)
+                    parts.append(p)
+                sheet = f"{mon}{y}" if multi_year else mon
+                pd.concat(parts, ignore_index=True).to_excel(xw, sheet_name=sheet, index=False)
+    return out
+
+
+def write_load(root: str, years, rng) -> str:
+    '''NP6-346 "Actual System Load by Weather Zone": load.zip of daily ZIPs + extracted CSVs.'''
+    load_dir = os.path.join(root, "DataScraping", "Rawdata", "load")
+    raw_dir = os.path.join(load_dir, "load_raw_data")
+    os.makedirs(raw_dir, exist_ok=True)
+    outer = os.path.join(load_dir, "load.zip")
+    with zipfile.ZipFile(outer, "w", zipfile.ZIP_DEFLATED) as zf:
+        for i, d in enumerate(_days(years)):
+            oper = d - timedelta(days=1)  # each posting carries the previous operating day
+            hes = hour_endings(oper)
+            zones = {z: np.round(rng.normal(11000, 1500, len(hes)), 2) for z in WEATHER_ZONES}
+            df = pd.DataFrame({
+                "OperDay": oper.strftime("%m/%d/%Y"),
+                "HourEnding": [f"{h:02d}:00" for h, _ in hes],
+                **zones,
+            })
+            df["TOTAL"] = df[WEATHER_ZONES].sum(axis=1).round(2)
+            df["DSTFlag"] = [flag for _, flag in hes]
+
+            name = f"cdr.00014836.0000000000000000.{d:%Y%m%d}.055000.ACTUALSYSLOADFZNP6346"
+            csv_bytes = df.to_csv(index=False).encode()
+            with open(os.path.join(raw_dir, name + ".csv"), "wb") as f:
+                f.write(csv_bytes)
+            inner = BytesIO()
+            with zipfile.ZipFile(inner, "w", zipfile.ZIP_DEFLATED) as sub:
+                sub.writestr(name + ".csv", csv_bytes)
+            zf.writestr(f"{970000000 + i}.{name}_csv.zip", inner.getvalue())
+    return outer
+
+
+def write_noaa(root: str, years, rng) -> str:
+    '''Long NOAA GHCND table as written by fetch_noaa_weather_2024.'''
+    out = os.path.join(root, "DataScraping", "Rawdata", "CDD_HDD", "noaa_raw.csv")
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    days = _days(years)
+    parts = []
+    for zone, sid in NOAA_STATIONS.items():
+        tavg = _seasonal(days, rng, 68, 17, 5)
+        for dt, vals in (("TMAX", tavg + 10), ("TMIN", tavg - 10), ("TAVG", tavg)):
+            parts.append(pd.DataFrame({
+                "date": [d.isoformat() for d in days],
+                "zone": zone,
+                "station_id": sid,
+                "datatype": dt,
+                "value": np.round(vals),
+            }))
+    pd.concat(parts, ignore_index=True).to_csv(out, index=False)
+    return out
+
+
+def write_fuel_mix(root: str, years, rng) -> list[str]:
+    '''IntGenbyFuel<year>.xlsx: per month, one row per (date, fuel) with 15-minute MWh.'''
+    out_dir = os.path.join(root, "DataScraping", "Rawdata", "RenewableShare")
+    os.makedirs(out_dir, exist_ok=True)
+    paths = []
+    for y in years:
+        path = os.path.join(out_dir, f"IntGenbyFuel{y}.xlsx")
+        with pd.ExcelWriter(path, engine="openpyxl") as xw:
+            for m, mon in enumerate(MONTHS, start=1):
+                days = [d for d in _days([y]) if d.month == m]
+                idx = pd.MultiIndex.from_product([[d.strftime("%m/%d/%Y") for d in days], FUELS],
+                                                 names=["Date", "Fuel"])
+                spring, fall = _dst_days(y)
+                cols = list(FUEL_INTERVALS)
+                vals = np.round(rng.gamma(2.0, 400.0, (len(idx), len(cols))), 2)
+                day_of_row = np.repeat(days, len(FUELS))
+                vals[day_of_row == spring, FUEL_HE03] = np.nan
+                if m == fall.month:
+                    cols[FUEL_HE02.stop:FUEL_HE02.stop] = FUEL_INTERVALS[FUEL_HE02]
+                    extra = np.round(rng.gamma(2.0, 400.0, (len(idx), 4)), 2)
+                    extra[day_of_row != fall] = np.nan
+                    vals = np.insert(vals, [FUEL_HE02.stop] * 4, extra, axis=1)
+                df = pd.DataFrame(vals, index=idx, columns=cols).reset_index()
+                df.insert(2, "Settlement Type", "FINAL")
+                df.insert(3, "Total", np.nansum(vals, axis=1).round(2))
+                df.to_excel(xw, sheet_name=mon, index=False)
+        paths.append(path)
+    return paths
+
+
+def make_fixtures(root: str, years=(2024,), hubs: int = 1, seed: int = 395) -> dict:
+    '''Write every raw input for `years` and the first `hubs` settlement points.'''
+    rng = np.random.default_rng(seed)
+    years = list(years)
+    hubs = len(SETTLEMENT_POINTS) if hubs in (0, None) else min(hubs, len(SETTLEMENT_POINTS))
+    return {
+        "price": write_price_xlsx(root, years, hubs, rng),
+        "load": write_load(root, years, rng),
+        "noaa": write_noaa(root, years, rng),
+        "fuel_mix": write_fuel_mix(root, years, rng),
+    }
@@ -0,0 +1,210 @@
+'''
+---------------------------------------------------------------
+Local stand-in for NOAA CDO v2 and the ERCOT download endpoints
+---------------------------------------------------------------
+
+    python benchmarks/mock_server.py --port 8766 --fault-every 7 --latency-ms 20
+
+Routes (same paths and query parameters the real services use):
+    GET /cdo-web/api/v2/data                     paginated GHCND rows; needs a "token" header
+    GET /misapp/servlets/IceDocListJsonWS        NP6-785-ER listing, one RTMLZHBSPP_<year>.zip per year
+    GET /misdownload/servlets/mirDownload        RTM SPP ZIP holding one .xlsx
+    GET /files/docs/<...>/FuelMixReport_PreviousYears.zip
+                                                 fuel mix ZIP holding IntGenbyFuel<year>.xlsx
+    GET /stats                                   request / fault counters as JSON
+
+Faults are injected on a fixed schedule: every `fault_every`-th request (counting
+all routes) answers with the next code from `fault_codes` (429/5xx), so runs are
+reproducible. Only CDO requests are failed unless `fault_all` is set, since the
+ERCOT fetchers have no retry. Every response is delayed by `latency_ms`
+(+ up to `jitter_ms`).
+'''
+
+import argparse
+import io
+import itertools
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+import zipfile
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from fixtures import write_fuel_mix, write_price_xlsx
+
+import numpy as np
+
+
+class MockState:
+    '''Fault schedule, latency and counters shared by all handler threads.'''
+
+    def __init__(self, fault_every: int = 0, fault_codes=(429, 503, 500),
+                 latency_ms: float = 0.0, jitter_ms: float = 0.0, seed: int = 395,
+                 fault_all: bool = False):
+        self.fault_every = fault_every
+        self.fault_all = fault_all
+        self._codes = itertools.cycle(fault_codes)
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.counts = {"requests": 0, "faults": 0, "pages": 0, "zips": 0}
+        self.rtm_zip = b""
+        self.rtm_years = ()
+        self.fuel_zip = b""
+
+    def next_request(self, faultable: bool = True):
+        '''Count the request; return a fault status code if it is scheduled to fail.'''
+        with self._lock:
+            self.counts["requests"] += 1
+            n = self.counts["requests"]
+            delay = (self.latency_ms + self._rng.random() * self.jitter_ms) / 1000.0
+            fault = None
+            if faultable and self.fault_every and n % self.fault_every == 0:
+                self.counts["faults"] += 1
+                fault = next(self._codes)
+        if delay:
+            time.sleep(delay)
+        return fault
+
+    def bump(self, key: str):
+        with self._lock:
+            self.counts[key] += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return dict(self.counts)
+
+
+def build_archives(state: MockState, years=(2024,), hubs: int = 1, seed: int = 395):
+    '''Pre-build the ERCOT ZIP payloads once from the synthetic fixtures.'''
+    rng = np.random.default_rng(seed)
+    with tempfile.TemporaryDirectory(prefix="ercot_mock_") as tmp:
+        price = write_price_xlsx(tmp, list(years), hubs, rng)
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.write(price, f"RTMLZHBSPP_{years[-1]}.xlsx")
+        state.rtm_zip = buf.getvalue()
+        state.rtm_years = tuple(years)
+
+        fuel = write_fuel_mix(tmp, list(years), rng)
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
+            for p in fuel:
+                zf.write(p, os.path.join("FuelMixReport_PreviousYears", os.path.basename(p)))
+        state.fuel_zip = buf.getvalue()
+
+
+def _cdo_rows(station: str, datatype: str, start: str, end: str) -> list[dict]:
+    '''Deterministic daily GHCND rows for one station + datatype.'''
+    d0, d1 = date.fromisoformat(start[:10]), date.fromisoformat(end[:10])
+    rows, d = [], d0
+    seed = sum(map(ord, station + datatype))
+    while d <= d1:
+        doy = d.timetuple().tm_yday
+        base = 68 + 17 * np.cos(2 * np.pi * (doy - 200) / 365.25) + (seed % 7 - 3)
+        val = base + {"TMAX": 10, "TMIN": -10}.get(datatype, 0)
+        rows.append({"date": f"{d.isoformat()}T00:00:00", "datatype": datatype, "station": station,
+                     "attributes": ",,W,2400", "value": round(float(val))})
+        d += timedelta(days=1)
+    return rows
+
+
+def make_handler(state: MockState):
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send(self, code: int, body: bytes, ctype: str = "application/json"):
+            self.send_response(code)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _json(self, code: int, payload: dict):
+            self._send(code, json.dumps(payload).encode())
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            if url.path == "/stats":
+                return self._json(200, state.snapshot())
+
+            # the ERCOT fetchers do not retry, so by default only CDO requests are failed
+            fault = state.next_request(url.path.startswith("/cdo-web") or state.fault_all)
+            if fault:
+                return self._json(fault, {"status": fault, "message": "injected fault"})
+
+            if url.path == "/cdo-web/api/v2/data":
+                return self._cdo(parse_qs(url.query))
+            if url.path == "/misapp/servlets/IceDocListJsonWS":
+                docs = [{"Document": {"DocID": str(1000 + y), "FriendlyName": f"RTMLZHBSPP_{y}",
+                                      "ConstructedName": f"ext.00013061.RTMLZHBSPP_{y}.zip"}}
+                        for y in state.rtm_years]
+                return self._json(200, {"ListDocsByRptTypeRes": {"DocumentList": docs}})
+            if url.path == "/misdownload/servlets/mirDownload":
+                state.bump("zips")
+                return self._send(200, state.rtm_zip, "application/zip")
+            if url.path.endswith("FuelMixReport_PreviousYears.zip"):
+                state.bump("zips")
+                return self._send(200, state.fuel_zip, "application/zip")
+            self._json(404, {"message": f"unknown path {url.path}"})
+
+        def _cdo(self, q: dict):
+            if not self.headers.get("token"):
+                return self._json(400, {"message": "Token parameter is required."})
+            get = lambda k, d=None: q.get(k, [d])[0]
+            rows = _cdo_rows(get("stationid", ""), get("datatypeid", "TAVG"),
+                             get("startdate"), get("enddate"))
+            limit = min(int(get("limit", 25)), 1000)
+            offset = int(get("offset", 1))
+            page = rows[offset - 1: offset - 1 + limit]
+            state.bump("pages")
+            if not page:
+                return self._json(200, {})  # CDO returns an empty object past the end
+            self._json(200, {
+                "metadata": {"resultset": {"offset": offset, "count": len(rows), "limit": limit}},
+                "results": page,
+            })
+
+        def log_message(self, fmt, *args):
+            pass
+
+    return MockHandler
+
+
+def start_server(state: MockState, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+    '''Serve in a daemon thread; port=0 picks a free port (see server.server_address).'''
+    server = ThreadingHTTPServer((host, port), make_handler(state))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Mock NOAA CDO / ERCOT MIS server.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8766)
+    ap.add_argument("--fault-every", type=int, default=0, help="fail every Nth request (0 = never)")
+    ap.add_argument("--fault-codes", default="429,503,500")
+    ap.add_argument("--latency-ms", type=float, default=0.0)
+    ap.add_argument("--jitter-ms", type=float, default=0.0)
+    ap.add_argument("--fault-all", action="store_true", help="also fail the ERCOT ZIP routes")
+    args = ap.parse_args()
+
+    state = MockState(args.fault_every, tuple(int(c) for c in args.fault_codes.split(",")),
+                      args.latency_ms, args.jitter_ms, fault_all=args.fault_all)
+    build_archives(state)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(state))
+    print(f"[info] Mock NOAA/ERCOT server on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+'''
+---------------------------------------------------------------
+End-to-end benchmark harness on synthetic ERCOT/NOAA inputs
+---------------------------------------------------------------
+
+    python benchmarks/run_benchmarks.py --years 1 --hubs 1
+    python benchmarks/run_benchmarks.py --years 10 --hubs 0 --out bench_10y_all.json
+
+Builds a throw-away workspace with benchmarks/fixtures.py, runs every stage
+from the workspace root (the cleaning scripts use repo-relative paths), and
+records per function:
+    wall / CPU seconds (best and median of --repeat runs),
+    peak traced Python heap (tracemalloc, separate run), peak process RSS.
+Results go to a JSON file so they can be tracked across versions.
+'''
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(REPO / "OLS"))
+sys.path.insert(0, str(REPO / "benchmarks"))
+RESULTS_DIR = REPO / "benchmarks" / "results"
+
+import pandas as pd  # noqa: E402
+from fixtures import make_fixtures  # noqa: E402
+from instrumentation import peak_rss_mb  # noqa: E402
+
+
+def _git_version() -> str:
+    try:
+        return subprocess.check_output(["git", "describe", "--always", "--dirty"],
+                                       cwd=REPO, text=True, stderr=subprocess.DEVNULL).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def measure(name: str, fn, repeat: int) -> dict:
+    '''Time `fn` `repeat` times, then run it once more under tracemalloc.'''
+    walls, cpus = [], []
+    for _ in range(repeat):
+        w0, c0 = time.perf_counter(), time.process_time()
+        fn()
+        walls.append(time.perf_counter() - w0)
+        cpus.append(time.process_time() - c0)
+
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    res = {
+        "name": name,
+        "wall_s_best": min(walls),
+        "wall_s_median": statistics.median(walls),
+        "cpu_s_median": statistics.median(cpus),
+        "peak_traced_mb": peak / 2**20,
+        "peak_rss_mb": peak_rss_mb(),
+        "repeat": repeat,
+    }
+    print(f"[bench] {name:<28} wall {res['wall_s_best']:8.3f}s  cpu {res['cpu_s_median']:8.3f}s  "
+          f"heap {res['peak_traced_mb']:8.1f}MB")
+    return res
+
+
+def merge_all(out_path: Path, years) -> Path:
+    '''
+    Stand-in for the merge step: join the four cleaned daily series on date. Every
+    year must survive the inner join; only 12-31 of the last year is missing, because
+    each load posting carries the previous operating day.
+    '''
+    d = Path("DataCleaning")
+    frames = [pd.read_csv(d / f, parse_dates=["date"]) for f in
+              ("Price_Clean.csv", "Load_Clean.csv", "CDD_HDD_Clean.csv", "RenewableShare_Clean.csv")]
+    merged = frames[0]
+    for f in frames[1:]:
+        merged = merged.merge(f, on="date", how="inner")
+    expected = sum(366 if y % 4 == 0 else 365 for y in years) - 1
+    if len(merged) != expected:
+        raise RuntimeError(f"ALL_IN_ONE has {len(merged)} rows, expected {expected}: "
+                           + ", ".join(f"{n}={len(f)}" for n, f in zip(("price", "load", "weather", "renewables"), frames)))
+    merged.to_csv(out_path, index=False)
+    return out_path
+
+
+def run(years: int, hubs: int, repeat: int, n_boot: int, seed: int, workdir: Path) -> list[dict]:
+    year_list = list(range(2024 - years + 1, 2025))
+    t0 = time.perf_counter()
+    make_fixtures(str(workdir), year_list, hubs, seed)
+    print(f"[info] Fixtures for {year_list[0]}–{year_list[-1]}, hubs={hubs or 'all'} "
+          f"in {time.perf_counter() - t0:.1f}s under {workdir}")
+
+    os.chdir(workdir)
+    # the cleaners use repo-relative paths, which now resolve inside workdir
+    from DataCleaning import Price_Clean as price, load_clean as load, cdd_hdd_clean as cdd
+    from DataCleaning import renew_share_clean as renew
+    from DataCleaning.lake import read_series
+    import data_loader
+    import ols_regression
+
+    def renew_all_years():
+        # one workbook per year: clean each into the lake, then flatten all of them
+        for y in year_list:
+            renew.main(y)
+        read_series("renewables").to_csv(renew.OUT, index=False)
+
+    results = [
+        measure("clean_price", price.clean_price, repeat),
+        measure("load_and_clean", load.load_and_clean, repeat),
+        measure("cdd_hdd.main", cdd.main, repeat),
+        measure("renew_share.main", renew_all_years, repeat),
+    ]
+
+    ols_dir = workdir / "OLS"
+    ols_dir.mkdir(exist_ok=True)
+    raw = merge_all(workdir / "DataCleaning" / "ALL_IN_ONE.csv", year_list)
+    pre = ols_dir / "preprocessed_data.csv"
+    results.append(measure("load_and_preprocess_data",
+                           lambda: data_loader.load_and_preprocess_data(raw, pre), repeat))
+    results.append(measure("run_ols_regression", lambda: ols_regression.run_ols_regression(
+        data_path=pre, model_path=ols_dir / "ols_model", coef_csv=ols_dir / "ols_coefficients.csv",
+        resid_png=ols_dir / "ols_residuals_analysis.png", n_boot=n_boot, seed=seed), repeat))
+    return results
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Benchmark the pipeline on synthetic inputs.")
+    ap.add_argument("--years", type=int, default=1, help="number of years ending 2024 (1–10+)")
+    ap.add_argument("--hubs", type=int, default=1, help="settlement points in Price.xlsx (0 = all)")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--n-boot", type=int, default=2000, help="bootstrap replicates in the OLS fit")
+    ap.add_argument("--seed", type=int, default=395)
+    ap.add_argument("--workdir", type=Path, help="keep fixtures here instead of a temp dir")
+    ap.add_argument("--out", type=Path, default=RESULTS_DIR / "results.json",
+                    help="results JSON (default benchmarks/results/, which git ignores)")
+    args = ap.parse_args(argv)
+    out = args.out.resolve()
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    if args.workdir:
+        args.workdir.mkdir(parents=True, exist_ok=True)
+        results = run(args.years, args.hubs, args.repeat, args.n_boot, args.seed, args.workdir.resolve())
+    else:
+        with tempfile.TemporaryDirectory(prefix="ercot_bench_") as tmp:
+            results = run(args.years, args.hubs, args.repeat, args.n_boot, args.seed, Path(tmp))
+            os.chdir(REPO)
+
+    import numpy as np
+    payload = {
+        "version": _git_version(),
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "scale": {"years": args.years, "hubs": args.hubs, "n_boot": args.n_boot, "seed": args.seed},
+        "env": {"python": platform.python_version(), "platform": platform.platform(),
+                "pandas": pd.__version__, "numpy": np.__version__, "cpus": os.cpu_count()},
+        "results": results,
+    }
+    out.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    print(f"[done] Wrote benchmark results → {out}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
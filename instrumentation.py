@@ -0,0 +1,137 @@
+'''
+---------------------------------------------------------------
+Per-stage instrumentation shared by DataScraping, DataCleaning and OLS
+---------------------------------------------------------------
+
+    with span("groupby", stage="price", rows_in=len(df)) as s:
+        daily = ...
+        s.rows_out = len(daily)
+
+Each span records wall time, CPU time, process peak RSS, rows in/out and
+bytes read/written. Export is opt-in through environment variables:
+
+    PIPELINE_SPANS=spans.jsonl        append one JSON line per finished span
+    PIPELINE_PROFILE=fit,groupby      run matching spans (or "*" for all) under cProfile
+    PIPELINE_PROFILE_DIR=profiles     where the .prof files go (default: ./profiles)
+
+Without PIPELINE_SPANS the spans are still timed and logged at DEBUG level,
+so the overhead is two clock reads per step. Span names double as function
+boundaries, which keeps py-spy flame graphs aligned with the JSON records.
+'''
+
+import cProfile
+import itertools
+import json
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+SPANS_ENV = "PIPELINE_SPANS"
+PROFILE_ENV = "PIPELINE_PROFILE"
+PROFILE_DIR_ENV = "PIPELINE_PROFILE_DIR"
+
+log = logging.getLogger("pipeline")
+_profile_seq = itertools.count(1)  # per-process, so a span that runs twice keeps both profiles
+
+
+def peak_rss_mb() -> float | None:
+    '''Peak resident set size of this process in MiB; None if it cannot be read.'''
+    if resource is not None:
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss / (1024 * 1024) if sys.platform == "darwin" else rss / 1024
+    try:
+        import psutil
+    except ImportError:
+        return None
+    mem = psutil.Process().memory_info()
+    return getattr(mem, "peak_wset", mem.rss) / (1024 * 1024)  # peak working set on Windows
+
+
+def _profiled(name: str) -> bool:
+    wanted = os.getenv(PROFILE_ENV, "")
+    return bool(wanted) and (wanted == "*" or name in {w.strip() for w in wanted.split(",")})
+
+
+class Span:
+    '''Mutable record for one step; fill rows/bytes in while the step runs.'''
+
+    def __init__(self, name: str, stage: str | None, rows_in: int | None, attrs: dict):
+        self.name = name
+        self.stage = stage
+        self.rows_in = rows_in
+        self.rows_out = None
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.attrs = attrs
+
+    def read(self, *paths) -> None:
+        '''Count the size of input files (missing files are ignored).'''
+        for p in paths:
+            if os.path.isfile(p):
+                self.bytes_read += os.path.getsize(p)
+
+    def wrote(self, *paths) -> None:
+        for p in paths:
+            if os.path.isfile(p):
+                self.bytes_written += os.path.getsize(p)
+
+    def record(self, wall: float, cpu: float, error: str | None) -> dict:
+        rss = peak_rss_mb()
+        return {
+            "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds"),
+            "pid": os.getpid(),
+            "stage": self.stage,
+            "span": self.name,
+            "wall_s": round(wall, 6),
+            "cpu_s": round(cpu, 6),
+            "peak_rss_mb": None if rss is None else round(rss, 1),
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "error": error,
+            **self.attrs,
+        }
+
+
+def _export(rec: dict) -> None:
+    log.debug("span %s/%s %.3fs", rec["stage"], rec["span"], rec["wall_s"])
+    path = os.getenv(SPANS_ENV)
+    if not path:
+        return
+    # one write() per line so concurrent worker processes do not interleave records
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(rec, default=str) + "\n")
+
+
+@contextmanager
+def span(name: str, stage: str | None = None, rows_in: int | None = None, **attrs):
+    s = Span(name, stage, rows_in, attrs)
+    prof = cProfile.Profile() if _profiled(name) else None
+    error = None
+    w0, c0 = time.perf_counter(), time.process_time()
+    if prof:
+        prof.enable()
+    try:
+        yield s
+    except BaseException as e:
+        error = repr(e)
+        raise
+    finally:
+        if prof:
+            prof.disable()
+            out_dir = os.getenv(PROFILE_DIR_ENV, "profiles")
+            os.makedirs(out_dir, exist_ok=True)
+            fname = f"{stage or 'main'}.{name}.{os.getpid()}.{next(_profile_seq)}.prof"
+            prof.dump_stats(os.path.join(out_dir, fname))
+        _export(s.record(time.perf_counter() - w0, time.process_time() - c0, error))
+
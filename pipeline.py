@@ -0,0 +1,138 @@
+'''
+---------------------------------------------------------------
+Multi-year driver: fetch + clean per (source, year), in parallel
+---------------------------------------------------------------
+
+    python pipeline.py --years 2011-2024 --jobs 8            # clean what is out of date
+    python pipeline.py --years 2025 --fetch --merge          # add a year, rebuild ALL_IN_ONE.csv
+    python pipeline.py --years 2019-2024 --sources price,load --force
+
+Every (source, year) pair is one task writing DataCleaning/lake/<source>/year=<year>/
+(see DataCleaning/lake.py). A task is skipped when its partition is newer than its raw
+inputs and the cleaning script, so adding a year only costs that year. --merge stacks
+the complete years into DataCleaning/ALL_IN_ONE.csv for the OLS stage.
+'''
+
+import argparse
+import importlib
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent
+sys.path.insert(0, str(REPO))
+
+SOURCES = ("price", "load", "weather", "renewables")
+CLEANERS = {
+    "price": ("DataCleaning.Price_Clean", "clean_price"),
+    "load": ("DataCleaning.load_clean", "load_and_clean"),
+    "weather": ("DataCleaning.cdd_hdd_clean", "main"),
+    "renewables": ("DataCleaning.renew_share_clean", "main"),
+}
+
+
+def parse_years(spec: str) -> list[int]:
+    '''"2011-2024", "2019,2021,2024" or a mix of both.'''
+    years = set()
+    for part in spec.split(","):
+        lo, _, hi = part.strip().partition("-")
+        years.update(range(int(lo), int(hi or lo) + 1))
+    return sorted(years)
+
+
+def up_to_date(written, inputs, code_path: str) -> bool:
+    if written is None or not inputs:
+        return False
+    newest = max(os.path.getmtime(p) for p in [*inputs, code_path] if os.path.exists(p))
+    return written >= newest
+
+
+def fetch(source: str, year: int) -> None:
+    # scraping pulls in requests/dotenv, so only import it when asked to fetch
+    from DataScraping import DataScraping as ds
+
+    if source == "price":
+        if not os.path.exists(os.path.join(ds.PRICE_DIR, str(year), "Price.xlsx")):
+            ds.fetch_ercot_lmp(year)
+    elif source == "load":
+        # the yearly NP6-346-CD archive is a manual download; extract it if it is there
+        zip_path = os.path.join(ds.RAW_DIR, "load", f"load_{year}.zip")
+        if os.path.exists(zip_path) and not os.path.isdir(os.path.join(ds.RAW_DIR, "load", "load_raw_data", str(year))):
+            ds.extract_load_zip(year, zip_path)
+    elif source == "weather":
+        if not os.path.exists(os.path.join(ds.CDD_HDD_DIR, str(year), "noaa_raw.csv")):
+            ds.fetch_noaa_weather(year)
+    # renewables: one archive covers every year, fetched once in main()
+
+
+def run_task(source: str, year: int, do_fetch: bool, force: bool) -> dict:
+    from DataCleaning.lake import written_at
+
+    t0 = time.perf_counter()
+    res = {"source": source, "year": year, "status": "done", "error": None}
+    try:
+        if do_fetch:
+            fetch(source, year)
+        mod_name, fn_name = CLEANERS[source]
+        mod = importlib.import_module(mod_name)
+        before = written_at(source, year)
+        if not force and up_to_date(before, mod.raw_inputs(year), mod.__file__):
+            res["status"] = "skipped"
+        else:
+            getattr(mod, fn_name)(year)
+            after = written_at(source, year)
+            if after is None or after == before:  # the cleaner ran but kept no rows of this year
+                raise ValueError(f"no {source} rows written for {year}")
+    except Exception as e:  # one bad year should not stop the others
+        res["status"], res["error"] = "error", repr(e)
+    res["seconds"] = round(time.perf_counter() - t0, 2)
+    return res
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description="Fetch and clean ERCOT/NOAA inputs year by year.")
+    ap.add_argument("--years", default="2024", help='e.g. "2011-2024" or "2019,2024"')
+    ap.add_argument("--sources", default=",".join(SOURCES), help="comma list of " + ", ".join(SOURCES))
+    ap.add_argument("--jobs", type=int, default=os.cpu_count(), help="worker processes")
+    ap.add_argument("--fetch", action="store_true", help="download/extract missing raw inputs first")
+    ap.add_argument("--force", action="store_true", help="rebuild partitions even if up to date")
+    ap.add_argument("--merge", action="store_true", help="write DataCleaning/ALL_IN_ONE.csv afterwards")
+    args = ap.parse_args(argv)
+
+    years = parse_years(args.years)
+    sources = [s.strip() for s in args.sources.split(",") if s.strip()]
+    unknown = set(sources) - set(SOURCES)
+    if unknown:
+        ap.error(f"unknown source(s) {sorted(unknown)}; choose from {SOURCES}")
+
+    os.chdir(REPO)  # the cleaning scripts use repo-relative paths
+    print(f"[info] years={years[0]}–{years[-1]} ({len(years)}) sources={sources} jobs={args.jobs}")
+
+    if args.fetch and "renewables" in sources:
+        from DataScraping import DataScraping as ds
+        ds.fetch_ercot_renewableshare_from_archive(years)
+
+    t0 = time.perf_counter()
+    results = []
+    with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+        futs = [pool.submit(run_task, s, y, args.fetch, args.force) for y in years for s in sources]
+        for f in as_completed(futs):
+            r = f.result()
+            results.append(r)
+            print(f"[{r['status']}] {r['source']:<10} {r['year']}  {r['seconds']:6.2f}s"
+                  + (f"  {r['error']}" if r["error"] else ""))
+
+    n = {k: sum(r["status"] == k for r in results) for k in ("done", "skipped", "error")}
+    print(f"[done] {n['done']} built, {n['skipped']} up to date, {n['error']} failed "
+          f"in {time.perf_counter() - t0:.1f}s")
+
+    if args.merge:
+        from DataCleaning.lake import merge_years
+        merge_years(years)
+    return 1 if n["error"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
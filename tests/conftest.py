@@ -0,0 +1,43 @@
+# conftest.py — repo root (DataCleaning.*, instrumentation) and OLS/ (flat script imports) on sys.path, shared fixtures
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO = Path(__file__).resolve().parents[1]
+for p in (REPO, REPO / "OLS"):
+    if str(p) not in sys.path:
+        sys.path.insert(0, str(p))
+
+
+def synthetic_panel(n=400, seed=0) -> pd.DataFrame:
+    """Daily frame in the preprocessed_data.csv layout with a known linear relation."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "date": pd.date_range("2023-01-01", periods=n, freq="D"),
+        "Load_t": rng.normal(45_000, 5_000, n),
+        "CDD_t": rng.uniform(0, 20, n),
+        "HDD_t": rng.uniform(0, 20, n),
+        "RenewableShare_t": rng.uniform(0.1, 0.5, n),
+    })
+    df["ln_Price_t"] = (1.0 + 2e-5 * df["Load_t"] + 0.01 * df["CDD_t"] - 0.5 * df["RenewableShare_t"]
+                        + rng.normal(0, 0.1, n))
+    return df
+
+
+@pytest.fixture
+def fitted_artifact(tmp_path):
+    """(artifact path, fitted statsmodels results, X, y) for a small OLS fit."""
+    sm = pytest.importorskip("statsmodels.api")
+    from model_artifact import save_model_artifact
+
+    df = synthetic_panel()
+    X = sm.add_constant(df[["Load_t", "CDD_t", "HDD_t", "RenewableShare_t"]])
+    y = df["ln_Price_t"]
+    model = sm.OLS(y, X).fit()
+    coef = pd.DataFrame({"term": model.params.index, "coef": model.params.values,
+                         "std_err": model.bse.values, "p_value": model.pvalues.values})
+    path = save_model_artifact(model, coef, tmp_path / "ols_model", y.to_numpy(), X.to_numpy())
+    return path, model, X, y
@@ -0,0 +1,46 @@
+# test_instrumentation.py — span export and opt-in profiling (instrumentation.py)
+import json
+import sys
+
+import pytest
+
+import instrumentation
+from instrumentation import peak_rss_mb, span
+
+
+def test_span_exports_one_json_line(tmp_path, monkeypatch):
+    out = tmp_path / "spans.jsonl"
+    monkeypatch.setenv("PIPELINE_SPANS", str(out))
+    with span("groupby", stage="price", rows_in=10, year=2024) as s:
+        s.rows_out = 3
+    with pytest.raises(RuntimeError):
+        with span("write", stage="price"):
+            raise RuntimeError("disk full")
+    recs = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [r["span"] for r in recs] == ["groupby", "write"]
+    assert recs[0]["rows_in"] == 10 and recs[0]["rows_out"] == 3 and recs[0]["year"] == 2024
+    assert recs[1]["error"] == "RuntimeError('disk full')"
+
+
+def test_repeated_span_keeps_every_profile(tmp_path, monkeypatch):
+    monkeypatch.setenv("PIPELINE_PROFILE", "fit")
+    monkeypatch.setenv("PIPELINE_PROFILE_DIR", str(tmp_path))
+    for _ in range(3):
+        with span("fit", stage="ols"):
+            sum(range(1000))
+    with span("plot", stage="ols"):
+        pass
+    assert len(list(tmp_path.glob("ols.fit.*.prof"))) == 3
+    assert not list(tmp_path.glob("ols.plot.*"))
+
+
+def test_peak_rss_without_resource_module(tmp_path, monkeypatch):
+    assert peak_rss_mb() > 0
+    monkeypatch.setattr(instrumentation, "resource", None)  # as on Windows
+    monkeypatch.setitem(sys.modules, "psutil", None)        # and without psutil
+    assert peak_rss_mb() is None
+    out = tmp_path / "spans.jsonl"
+    monkeypatch.setenv("PIPELINE_SPANS", str(out))
+    with span("parse", stage="load"):
+        pass
+    assert json.loads(out.read_text())["peak_rss_mb"] is None
@@ -0,0 +1,56 @@
+# test_lake.py — year/month partitioned Parquet lake (DataCleaning/lake.py)
+import pandas as pd
+import pytest
+
+pytest.importorskip("pyarrow")
+
+from DataCleaning.lake import files, read_series, write_series, years_available
+
+
+def load_days(start, end, value):
+    dates = pd.date_range(start, end, freq="D")
+    return pd.DataFrame({"date": dates, "Load_t": float(value)})
+
+
+def test_write_series_partitions_by_year_and_month(tmp_path):
+    years = write_series("load", load_days("2023-01-01", "2024-12-31", 1.0), root=tmp_path)
+    assert years == [2023, 2024]
+    assert years_available("load", root=tmp_path) == [2023, 2024]
+    assert len(files("load", [2023], root=tmp_path)) == 12
+    df = read_series("load", start="2024-02-01", end="2024-02-29", root=tmp_path)
+    assert len(df) == 29
+    assert df["date"].is_monotonic_increasing
+
+
+def test_partial_year_is_merged_not_replaced(tmp_path):
+    write_series("load", load_days("2023-01-01", "2023-12-31", 1.0), root=tmp_path)
+    # a legacy run over the 2024 postings carries 2023-12-31 as its first operating day
+    write_series("load", load_days("2023-12-31", "2024-12-30", 2.0), root=tmp_path)
+    y2023 = read_series("load", start="2023-01-01", end="2023-12-31", root=tmp_path)
+    assert len(y2023) == 365
+    assert y2023["Load_t"].iloc[-1] == 2.0
+    assert (y2023["Load_t"].iloc[:-1] == 1.0).all()
+    assert len(read_series("load", start="2024-01-01", end="2024-12-31", root=tmp_path)) == 365
+
+
+def test_price_rewrite_keeps_other_hubs(tmp_path):
+    dates = pd.date_range("2024-01-01", "2024-01-31", freq="D")
+    both = pd.concat([pd.DataFrame({"date": dates, "settlement_point": hub, "Price_t": 10.0})
+                      for hub in ("HB_BUSAVG", "HB_HOUSTON")], ignore_index=True)
+    write_series("price", both, root=tmp_path)
+    write_series("price", pd.DataFrame({"date": dates, "settlement_point": "HB_BUSAVG", "Price_t": 20.0}),
+                 root=tmp_path)
+    df = read_series("price", root=tmp_path)
+    assert len(df) == 62
+    by_hub = df.groupby("settlement_point")["Price_t"].mean()
+    assert by_hub["HB_BUSAVG"] == 20.0
+    assert by_hub["HB_HOUSTON"] == 10.0
+
+
+def test_missing_pyarrow_is_optional_for_flat_runs(tmp_path, monkeypatch):
+    import DataCleaning.lake as lake
+    monkeypatch.setattr(lake, "have_pyarrow", lambda: False)
+    assert write_series("load", load_days("2024-01-01", "2024-01-31", 1.0), root=tmp_path, optional=True) == []
+    assert not list(tmp_path.iterdir())
+    with pytest.raises(ImportError, match="requirements.txt"):
+        write_series("load", load_days("2024-01-01", "2024-01-31", 1.0), root=tmp_path)
@@ -0,0 +1,56 @@
+# test_model_artifact.py — save/load round-trip of the OLS artifact (OLS/model_artifact.py)
+import json
+
+import numpy as np
+import pytest
+
+from conftest import synthetic_panel
+from model_artifact import load_model_artifact
+
+
+@pytest.mark.parametrize("mmap", [True, False])
+def test_round_trip(fitted_artifact, mmap):
+    path, model, _, _ = fitted_artifact
+    art = load_model_artifact(path, mmap=mmap)
+    assert isinstance(art.params, np.memmap) is mmap
+    assert art.terms == list(model.params.index)
+    assert art.features == [t for t in art.terms if t != "const"]
+    np.testing.assert_allclose(art.params, model.params.to_numpy())
+    np.testing.assert_allclose(art.cov, model.cov_params().to_numpy())
+    assert art.nobs == model.nobs
+    assert art.rsquared == pytest.approx(model.rsquared)
+    coef = art.coef_frame()
+    assert list(coef["term"]) == art.terms
+    np.testing.assert_allclose(coef["std_err"], model.bse.to_numpy())
+
+
+def test_fitted_values_match_statsmodels(fitted_artifact):
+    path, model, _, _ = fitted_artifact
+    art = load_model_artifact(path)
+    df = synthetic_panel()
+    np.testing.assert_allclose(art.fitted_values(df), model.fittedvalues.to_numpy())
+    np.testing.assert_allclose(art.residuals(df), model.resid.to_numpy())
+
+
+def test_changed_data_is_rejected(fitted_artifact):
+    art = load_model_artifact(fitted_artifact[0])
+    df = synthetic_panel()
+    df.loc[0, "Load_t"] += 1.0
+    with pytest.raises(ValueError, match="does not match"):
+        art.fitted_values(df)
+    with pytest.raises(KeyError):
+        art.fitted_values(df.drop(columns="CDD_t"))
+
+
+def test_unsupported_version(fitted_artifact):
+    path = fitted_artifact[0]
+    meta = json.loads((path / "meta.json").read_text())
+    meta["version"] = 0
+    (path / "meta.json").write_text(json.dumps(meta))
+    with pytest.raises(ValueError, match="version"):
+        load_model_artifact(path)
+
+
+def test_missing_artifact(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_model_artifact(tmp_path / "nope")
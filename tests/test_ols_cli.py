@@ -0,0 +1,90 @@
+# test_ols_cli.py — subcommand dispatch, lazy imports and the Agg default of OLS/ols.py
+import os
+import subprocess
+import sys
+import types
+
+import pytest
+
+import ols
+from conftest import REPO
+
+HEAVY = ("numpy", "pandas", "statsmodels", "matplotlib", "scipy")
+
+
+def run_python(code: str, **env) -> str:
+    """Run `code` in a fresh interpreter from OLS/ (how the scripts are launched)."""
+    full_env = {k: v for k, v in os.environ.items() if k != "MPLBACKEND"}
+    full_env.update(env)
+    out = subprocess.run([sys.executable, "-c", code], cwd=REPO / "OLS", env=full_env,
+                         capture_output=True, text=True, check=True)
+    return out.stdout.strip()
+
+
+@pytest.fixture
+def fake_module(monkeypatch):
+    """Swap a lazily imported OLS module for a stub that records its calls."""
+    def install(name, *funcs, **attrs):
+        calls = []
+        mod = types.ModuleType(name)
+        for f in funcs:
+            setattr(mod, f, lambda *a, _f=f, **kw: calls.append((_f, a, kw)))
+        for k, v in attrs.items():
+            setattr(mod, k, v)
+        monkeypatch.setitem(sys.modules, name, mod)
+        return calls
+    return install
+
+
+def test_fit_dispatch(fake_module, capsys):
+    calls = fake_module("ols_regression", "run_ols_regression")
+    assert ols.main(["fit", "--n-boot", "0", "--seed", "7", "--jobs", "2", "--plot-mode", "fast"]) == 0
+    assert calls == [("run_ols_regression", (), {"n_boot": 0, "block_len": None, "seed": 7, "n_jobs": 2,
+                                                 "hac_maxlags": None, "plot_mode": "fast"})]
+    assert "[info] fit took" in capsys.readouterr().out
+
+
+def test_plot_dispatch(fake_module):
+    calls = fake_module("result_visual", "main")
+    ols.main(["plot", "--plot-mode", "fast"])
+    assert calls == [("main", (), {"mode": "fast"})]
+
+
+def test_report_dispatch(fake_module, tmp_path):
+    calls = fake_module("regression_report", "generate_batch_report",
+                        MODEL_PATH="default_model", REPORT_PATH="default.md")
+    ols.main(["report"])
+    ols.main(["report", "--model", str(tmp_path / "a"), "--model", str(tmp_path / "b"),
+              "--out", str(tmp_path / "r.html"), "--force"])
+    assert calls[0] == ("generate_batch_report", (["default_model"], "default.md"), {"force": False})
+    assert calls[1] == ("generate_batch_report", ([tmp_path / "a", tmp_path / "b"], tmp_path / "r.html"),
+                        {"force": True})
+
+
+def test_subcommand_is_required(capsys):
+    with pytest.raises(SystemExit) as exc:
+        ols.main([])
+    assert exc.value.code == 2
+    with pytest.raises(SystemExit):
+        ols.main(["fit", "--plot-mode", "slow"])
+    assert "invalid choice" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["fit", "--help"], ["report", "--help"]])
+def test_help_skips_heavy_imports(argv):
+    loaded = run_python(
+        "import sys, ols\n"
+        "try:\n"
+        f"    ols.main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print('loaded:' + ','.join(m for m in {HEAVY!r} if m in sys.modules))"
+    )
+    assert loaded.splitlines()[-1] == "loaded:"
+
+
+def test_agg_backend_by_default():
+    pytest.importorskip("matplotlib")
+    code = "import ols, matplotlib; print(matplotlib.get_backend().lower())"
+    assert run_python(code) == "agg"
+    assert run_python(code, MPLBACKEND="pdf") == "pdf"  # an explicit choice is kept
@@ -0,0 +1,61 @@
+# test_pipeline.py — per-year raw inputs and task status in pipeline.py
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+import pipeline
+from benchmarks.fixtures import write_noaa, write_price_xlsx
+from DataCleaning import Price_Clean, cdd_hdd_clean
+
+pytest.importorskip("openpyxl")
+
+
+@pytest.fixture(scope="module")
+def flat_inputs(tmp_path_factory):
+    root = tmp_path_factory.mktemp("raw")
+    rng = np.random.default_rng(0)
+    write_price_xlsx(str(root), [2024], 1, rng)
+    write_noaa(str(root), [2024], rng)
+    return root
+
+
+@pytest.fixture
+def raw_2024(flat_inputs, tmp_path, monkeypatch):
+    """Only the original flat 2024 price workbook and NOAA pull, cwd at a fresh copy."""
+    shutil.copytree(flat_inputs, tmp_path, dirs_exist_ok=True)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+def test_year_never_falls_back_to_flat_inputs(raw_2024):
+    assert Price_Clean.raw_inputs() == [os.path.join("DataScraping/Rawdata", "price", "Price.xlsx")]
+    with pytest.raises(FileNotFoundError, match=r"price[/\\]2019[/\\]Price.xlsx"):
+        Price_Clean.raw_inputs(2019)
+    assert len(cdd_hdd_clean.raw_inputs()) == 1
+    (raw_2024 / "DataScraping/Rawdata/CDD_HDD/2019").mkdir()
+    with pytest.raises(FileNotFoundError, match=r"CDD_HDD[/\\]2019/"):
+        cdd_hdd_clean.raw_inputs(2019)
+
+
+def test_wrong_year_workbook_has_no_rows(raw_2024):
+    price_dir = raw_2024 / "DataScraping/Rawdata/price"
+    (price_dir / "2019").mkdir()
+    shutil.copy(price_dir / "Price.xlsx", price_dir / "2019" / "Price.xlsx")
+    with pytest.raises(ValueError, match="No 2019 price rows"):
+        Price_Clean.clean_price(2019)
+
+
+@pytest.mark.parametrize("source", ["price", "weather"])
+def test_missing_year_is_an_error_not_built(raw_2024, source):
+    res = pipeline.run_task(source, 2019, do_fetch=False, force=True)
+    assert res["status"] == "error"
+    assert "FileNotFoundError" in res["error"]
+
+
+def test_task_without_rows_for_its_year_fails(raw_2024, monkeypatch):
+    monkeypatch.setattr(Price_Clean, "clean_price", lambda year: [])
+    res = pipeline.run_task("price", 2024, do_fetch=False, force=True)
+    assert res["status"] == "error"
+    assert "no price rows written for 2024" in res["error"]
@@ -0,0 +1,66 @@
+# test_predict.py — OLS/predict.py batch scoring and HTTP endpoint
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from predict import Predictor, make_handler
+
+
+@pytest.fixture
+def server(fitted_artifact):
+    predictor = Predictor(fitted_artifact[0])
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(predictor))
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{srv.server_address[1]}", predictor
+    srv.shutdown()
+    srv.server_close()
+
+
+def post(url, body: bytes):
+    req = urllib.request.Request(url + "/predict", data=body, method="POST",
+                                 headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(req, timeout=5) as r:
+            return r.status, json.loads(r.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read())
+
+
+def test_predict_matches_statsmodels(fitted_artifact):
+    path, model, X, _ = fitted_artifact
+    pred = Predictor(path).predict(X.drop(columns="const"))
+    np.testing.assert_allclose(pred["prediction"], model.predict(X), rtol=1e-10)
+    frame = model.get_prediction(X).summary_frame(alpha=0.05)
+    np.testing.assert_allclose(pred["pi_low"], frame["obs_ci_lower"], rtol=1e-8)
+
+
+def test_post_rows(server):
+    url, predictor = server
+    row = {f: 1.0 for f in predictor.features}
+    code, js = post(url, json.dumps({"rows": [row, row]}).encode())
+    assert code == 200
+    assert len(js["prediction"]) == 2
+
+
+@pytest.mark.parametrize("body", [b"[1, 2]", b'"x"', b"3", b'{"rows": [{"Load_t": 1}]}', b"{not json"])
+def test_post_bad_body_is_400(server, body):
+    url, _ = server
+    code, js = post(url, body)
+    assert code == 400
+    assert "error" in js
+
+
+def test_post_missing_value_is_400(server):
+    url, predictor = server
+    row = {f: 1.0 for f in predictor.features}
+    holes = [row, {**row, predictor.features[0]: None}, {f: 1.0 for f in predictor.features[1:]}]
+    code, js = post(url, json.dumps({"rows": holes}).encode())
+    assert code == 400
+    assert "rows [1, 2]" in js["error"]
+    code, _ = post(url, json.dumps({"columns": {f: [1e400] for f in predictor.features}}).encode())
+    assert code == 400
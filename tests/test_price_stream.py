@@ -0,0 +1,84 @@
+# test_price_stream.py — incremental RTM aggregation and checkpoint/resume (DataCleaning/price_stream.py)
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataCleaning.price_stream import PriceAggregator
+
+
+@pytest.fixture(scope="module")
+def intervals():
+    """15-minute rows for two hubs over 40 days (crosses a month end), a few hours left empty."""
+    rng = np.random.default_rng(5)
+    days = pd.date_range("2024-01-10", periods=40, freq="D")
+    idx = pd.MultiIndex.from_product([["HB_HOUSTON", "HB_NORTH"], days, range(1, 25), range(4)],
+                                     names=["SettlementPointName", "DeliveryDate", "DeliveryHour", "q"])
+    df = idx.to_frame(index=False).drop(columns="q")
+    df["SettlementPointPrice"] = rng.gamma(4.0, 8.0, len(df))
+    gaps = (df["DeliveryHour"] == 7) & (df["DeliveryDate"].dt.day % 5 == 0)
+    return df[~gaps].sample(frac=1.0, random_state=1).reset_index(drop=True)
+
+
+def batch_daily(df: pd.DataFrame) -> pd.DataFrame:
+    """Price_Clean's aggregation: interval → hourly mean → daily mean of the hourly means."""
+    keys = ["SettlementPointName", "DeliveryDate"]
+    hourly = df.groupby(keys + ["DeliveryHour"])["SettlementPointPrice"].mean()
+    daily = hourly.groupby(level=keys).mean().rename("Price_t").reset_index()
+    return daily.rename(columns={"SettlementPointName": "settlement_point", "DeliveryDate": "date"})
+
+
+def as_sorted(df: pd.DataFrame) -> pd.DataFrame:
+    out = df.assign(date=pd.to_datetime(df["date"]).astype("datetime64[ns]"))
+    return out.sort_values(["settlement_point", "date"]).reset_index(drop=True)
+
+
+def write_files(df: pd.DataFrame, directory, days):
+    for day in days:
+        part = df[df["DeliveryDate"] == day]
+        part.to_csv(directory / f"rtm_{day:%Y%m%d}.csv", index=False)
+
+
+def test_matches_batch_aggregation(intervals):
+    agg = PriceAggregator(days=8, points=1)  # forces the arrays to grow
+    for start in range(0, len(intervals), 1100):
+        agg.ingest_frame(intervals.iloc[start:start + 1100])
+    expected = batch_daily(intervals)
+    pd.testing.assert_frame_equal(as_sorted(agg.daily_frame()), as_sorted(expected),
+                                  check_dtype=False)
+
+    row = expected.iloc[0]
+    assert agg.daily(row["settlement_point"], row["date"]) == pytest.approx(row["Price_t"])
+    jan = expected[(expected["settlement_point"] == "HB_NORTH") & (expected["date"].dt.month == 1)]
+    assert agg.month_to_date("HB_NORTH", "2024-01-31") == pytest.approx(jan["Price_t"].mean())
+
+
+def test_checkpoint_resume(intervals, tmp_path):
+    days = sorted(intervals["DeliveryDate"].unique())
+    inbox = tmp_path / "intervals"
+    inbox.mkdir()
+    write_files(intervals, inbox, days[:15])
+
+    first = PriceAggregator()
+    assert len(first.poll(inbox)) == 15
+    ckpt = first.save(tmp_path / "state.npz")
+
+    resumed = PriceAggregator.load(ckpt)
+    assert resumed.ingested == first.ingested and resumed.n_rows == first.n_rows
+    write_files(intervals, inbox, days[15:])
+    new = resumed.poll(inbox)
+    assert len(new) == len(days) - 15  # files from before the restart are not read again
+    assert resumed.n_rows == len(intervals)
+
+    straight = PriceAggregator()
+    straight.ingest_frame(intervals)
+    pd.testing.assert_frame_equal(as_sorted(resumed.daily_frame()), as_sorted(straight.daily_frame()))
+    assert resumed.month_to_date("HB_HOUSTON") == pytest.approx(straight.month_to_date("HB_HOUSTON"))
+
+
+def test_hub_filter_and_origin(intervals):
+    agg = PriceAggregator(hubs=["HB_NORTH"])
+    agg.ingest_frame(intervals)
+    assert agg.points == ["HB_NORTH"]
+    assert agg.origin == np.datetime64("2024-01-01")
+    with pytest.raises(ValueError, match="before the state origin"):
+        agg.ingest_frame(intervals.assign(DeliveryDate=pd.Timestamp("2023-12-31")))
@@ -0,0 +1,121 @@
+# test_quality.py — DataCleaning/quality.py checks and repair policies
+import numpy as np
+import pandas as pd
+import pytest
+
+from DataCleaning.quality import MAD_K, check_day_lengths, rolling_band, run_quality
+
+
+def daily_frame(n=60, seed=0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=n, freq="D"),
+        "Price_t": rng.uniform(20, 40, n),
+        "Load_t": rng.uniform(40_000, 60_000, n),
+    })
+
+
+def test_run_quality_daily_frame():
+    clean, issues = run_quality(daily_frame())
+    assert len(clean) == 60
+    assert issues.empty
+
+
+def test_run_quality_daily_gap_is_flagged():
+    df = daily_frame().drop(index=[10, 11]).reset_index(drop=True)
+    _, issues = run_quality(df)
+    gaps = issues[issues["check"] == "gaps"]
+    assert len(gaps) == 1
+    assert gaps["rows"].iloc[0] == 2
+    assert gaps["start"].iloc[0] == pd.Timestamp("2024-01-11")
+
+
+def test_run_quality_hourly_frame():
+    ts = pd.date_range("2024-01-01", periods=72, freq="h")
+    df = pd.DataFrame({"date": ts, "Price_t": np.linspace(20, 30, len(ts))})
+    clean, issues = run_quality(df, freq="h")
+    assert len(clean) == 72
+    assert issues.empty
+
+
+def test_outlier_clip_moves_value_to_band_edge():
+    df = daily_frame(n=90)
+    df.loc[45, "Price_t"] = 5_000.0
+    clean, issues = run_quality(df, policy={"outliers": "clip"})
+    assert (issues["check"] == "outliers").any()
+    med, mad = rolling_band(df["Price_t"])
+    edge = med[45] + MAD_K * mad[45]
+    assert clean.loc[45, "Price_t"] == pytest.approx(edge)
+    assert clean.loc[45, "Price_t"] > med[45]
+
+
+def test_duplicate_mean_keeps_non_numeric_columns():
+    df = daily_frame(n=5)
+    df["source"] = "lake"
+    df = pd.concat([df, df.iloc[[2]].assign(Price_t=df.loc[2, "Price_t"] + 10)], ignore_index=True)
+    clean, issues = run_quality(df)
+    assert (issues["check"] == "duplicates").any()
+    assert len(clean) == 5
+    assert list(clean.columns) == list(df.columns)
+    assert (clean["source"] == "lake").all()
+    assert clean.loc[2, "Price_t"] == pytest.approx(df.loc[2, "Price_t"] + 5)
+
+
+def local_hours(year=2024) -> pd.Series:
+    """Naive Central-time hour starts for a year: 23 rows on the spring day, 25 in the fall."""
+    utc = pd.date_range(f"{year}-01-01 06:00", f"{year + 1}-01-01 05:00", freq="h", tz="UTC")
+    return pd.Series(utc.tz_convert("US/Central").tz_localize(None), name="date")
+
+
+def test_day_lengths_accept_dst_days():
+    ts = local_hours()
+    counts = ts.dt.normalize().value_counts()
+    assert counts[pd.Timestamp("2024-03-10")] == 23
+    assert counts[pd.Timestamp("2024-11-03")] == 25
+    assert check_day_lengths(ts).empty
+
+
+def test_day_lengths_flag_averaged_fall_hour():
+    ts = local_hours().drop_duplicates()  # repeated 01:00 merged upstream
+    issues = check_day_lengths(ts)
+    assert list(issues["start"]) == [pd.Timestamp("2024-11-03")]
+    assert issues["severity"].iloc[0] == "warn"
+    assert issues["detail"].iloc[0] == "24 hours, expected 25"
+
+
+def test_run_quality_hourly_reports_day_length():
+    ts = local_hours()
+    ts = ts[~((ts.dt.normalize() == pd.Timestamp("2024-07-04")) & (ts.dt.hour == 12))]
+    df = pd.DataFrame({"date": ts, "Price_t": np.linspace(20, 30, len(ts))})
+    _, issues = run_quality(df, freq="h")
+    lengths = issues[issues["check"] == "day_length"]
+    assert list(lengths["start"]) == [pd.Timestamp("2024-07-04")]
+    assert lengths["severity"].iloc[0] == "error"
+
+
+def test_run_quality_hourly_keeps_dst_hours():
+    ts = local_hours()
+    df = pd.DataFrame({"date": ts, "Price_t": np.linspace(20, 30, len(ts))})
+    df = pd.concat([df, df.iloc[[100]]], ignore_index=True)  # one genuine duplicate
+    clean, issues = run_quality(df, freq="h")
+    assert len(clean) == len(ts)
+    counts = clean["date"].dt.normalize().value_counts()
+    assert counts[pd.Timestamp("2024-03-10")] == 23
+    assert counts[pd.Timestamp("2024-11-03")] == 25
+    repeat = issues[issues["check"] == "dst_repeat"]
+    assert list(repeat["start"]) == [pd.Timestamp("2024-11-03 01:00")]
+    assert repeat["rows"].iloc[0] == 2 and repeat["action"].iloc[0] == "kept"
+    assert list(issues.loc[issues["check"] == "duplicates", "start"]) == [ts.iloc[100]]
+    assert list(issues.loc[issues["check"] == "day_length", "start"]) == [ts.iloc[100].normalize()]
+    assert not (issues["check"] == "gaps").any()
+
+
+def test_interpolate_does_not_fill_spring_hour():
+    ts = local_hours()
+    ts = ts[ts != pd.Timestamp("2024-07-04 12:00")]
+    df = pd.DataFrame({"date": ts, "Price_t": np.linspace(20, 30, len(ts))})
+    clean, issues = run_quality(df, freq="h", policy={"gaps": "interpolate"})
+    assert list(issues.loc[issues["check"] == "gaps", "start"]) == [pd.Timestamp("2024-07-04 12:00")]
+    assert len(clean) == len(ts) + 1
+    assert not (clean["date"] == pd.Timestamp("2024-03-10 02:00")).any()
+    assert clean["Price_t"].notna().all()
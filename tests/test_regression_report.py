@@ -0,0 +1,63 @@
+# test_regression_report.py — OLS/regression_report.py incremental reports
+import shutil
+
+import pytest
+
+from conftest import synthetic_panel
+from regression_report import _stored_fingerprint, generate_batch_report, generate_regression_report
+
+
+def test_html_report_starts_with_doctype(fitted_artifact, tmp_path):
+    out = generate_batch_report([fitted_artifact[0]], tmp_path / "report.html")
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert lines[0] == "<!DOCTYPE html>"
+    assert lines[1].startswith("<!-- model-fingerprint: ")
+    assert _stored_fingerprint(out) is not None
+
+
+@pytest.mark.parametrize("suffix", [".md", ".html"])
+def test_unchanged_model_skips_rewrite(fitted_artifact, tmp_path, suffix):
+    out = generate_batch_report([fitted_artifact[0]], tmp_path / f"report{suffix}")
+    mtime = out.stat().st_mtime_ns
+    generate_batch_report([fitted_artifact[0]], out)
+    assert out.stat().st_mtime_ns == mtime
+
+
+def test_legacy_positional_data_path_is_ignored(fitted_artifact, tmp_path):
+    out = tmp_path / "report.md"
+    with pytest.warns(DeprecationWarning):
+        got = generate_regression_report(fitted_artifact[0], tmp_path / "preprocessed_data.csv", out)
+    assert got == out and out.exists()
+
+
+def headings(path):
+    return [line for line in path.read_text(encoding="utf-8").splitlines() if line.startswith("#")]
+
+
+def test_single_model_headings_step_from_h1_to_h2(fitted_artifact, tmp_path):
+    out = generate_batch_report([fitted_artifact[0]], tmp_path / "report.md")
+    assert headings(out) == ["# OLS Regression Report", "## Model Summary (key stats)", "## Coefficients"]
+
+
+def test_batch_report_has_one_h2_per_model(fitted_artifact, tmp_path):
+    other = shutil.copytree(fitted_artifact[0], tmp_path / "rolling_2023")
+    out = generate_batch_report({"full": fitted_artifact[0], "rolling_2023": other}, tmp_path / "report.md")
+    assert headings(out) == ["# OLS Regression Report",
+                             "## full", "### Model Summary (key stats)", "### Coefficients",
+                             "## rolling_2023", "### Model Summary (key stats)", "### Coefficients"]
+
+
+@pytest.mark.parametrize("scheme, label", [("block", "non-overlapping block"), ("moving", "moving-block")])
+def test_notes_describe_the_bootstrap_that_ran(tmp_path, scheme, label):
+    pytest.importorskip("statsmodels")
+    pytest.importorskip("matplotlib")
+    from ols_regression import run_ols_regression
+
+    data = tmp_path / "preprocessed_data.csv"
+    synthetic_panel().rename(columns={"ln_Price_t": "Price_t"}).to_csv(data, index=False)
+    run_ols_regression(data_path=data, model_path=tmp_path / "ols_model", coef_csv=tmp_path / "coef.csv",
+                       resid_png=tmp_path / "resid.png", n_boot=40, block_len=5, boot_scheme=scheme,
+                       seed=1, n_jobs=1, plot_mode="fast")
+    text = generate_batch_report([tmp_path / "ols_model"], tmp_path / "report.md").read_text(encoding="utf-8")
+    assert f"`boot_*` columns come from 40 {label} bootstrap replicates (block length 5, seed 1)." in text
+    assert "Newey-West HAC with 5 lags" in text
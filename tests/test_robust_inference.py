@@ -0,0 +1,55 @@
+# test_robust_inference.py — HC/HAC tables and the block bootstrap (OLS/robust_inference.py)
+import numpy as np
+import pytest
+
+from robust_inference import block_bootstrap, bootstrap_table, robust_table
+
+
+@pytest.fixture
+def design():
+    rng = np.random.default_rng(1)
+    n = 300
+    X = np.column_stack([np.ones(n), rng.normal(size=n), rng.normal(size=n)])
+    y = X @ np.array([1.0, 2.0, -0.5]) + rng.normal(0, 0.3, n)
+    return X, y
+
+
+def test_bootstrap_same_draws_for_any_n_jobs(design):
+    X, y = design
+    serial = block_bootstrap(X, y, n_boot=120, seed=7, n_jobs=1, batch_size=25)
+    parallel = block_bootstrap(X, y, n_boot=120, seed=7, n_jobs=3, batch_size=25)
+    assert serial.shape == (120, 3)
+    np.testing.assert_array_equal(serial, parallel)
+
+
+def test_bootstrap_seed_changes_draws(design):
+    X, y = design
+    a = block_bootstrap(X, y, n_boot=50, seed=1, n_jobs=1)
+    b = block_bootstrap(X, y, n_boot=50, seed=2, n_jobs=1)
+    assert not np.array_equal(a, b)
+
+
+@pytest.mark.parametrize("scheme", ["moving", "block"])
+def test_bootstrap_centres_on_ols(design, scheme):
+    X, y = design
+    beta = np.linalg.lstsq(X, y, rcond=None)[0]
+    draws = block_bootstrap(X, y, n_boot=400, scheme=scheme, seed=3, n_jobs=1)
+    np.testing.assert_allclose(draws.mean(axis=0), beta, atol=0.05)
+    table = bootstrap_table(draws, ["const", "x1", "x2"])
+    assert (table["boot_ci_low"] < beta).all() and (beta < table["boot_ci_high"]).all()
+
+
+def test_bootstrap_rejects_bad_block_len(design):
+    X, y = design
+    with pytest.raises(ValueError):
+        block_bootstrap(X, y, n_boot=10, block_len=0)
+    with pytest.raises(ValueError):
+        block_bootstrap(X, y, n_boot=10, scheme="stationary")
+
+
+def test_robust_table_columns(fitted_artifact):
+    model = fitted_artifact[1]
+    table = robust_table(model)
+    assert list(table.index) == list(model.params.index)
+    assert {"std_err_hc1", "std_err_hac"} <= set(table.columns)
+    assert (table.filter(like="std_err") > 0).all().all()
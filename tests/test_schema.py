@@ -0,0 +1,39 @@
+# test_schema.py — column-role resolution and the persisted schema (OLS/schema.py)
+import pytest
+
+from schema import load_schema, resolve_columns, write_schema
+
+PREPROCESSED = ["date", "Price_t", "Load_t", "CDD_t", "HDD_t", "RenewableShare_t", "ln_Price", "ln_Load"]
+
+
+def test_resolve_columns_roles():
+    roles = resolve_columns(["date", "Price_t", "Load_t", "CDD_t", "HDD_t", "RenewableShare_t"])
+    assert roles == {"target": "Price_t", "price": "Price_t", "load": "Load_t", "cdd": "CDD_t", "hdd": "HDD_t",
+                     "renew": "RenewableShare_t", "date": "date"}
+
+
+def test_resolve_columns_priority_beats_position():
+    # "price" outranks the "p" fallback even when the fallback column comes first
+    assert resolve_columns(["p_other", "PRICE2022"])["target"] == "PRICE2022"
+    assert resolve_columns(["Load_t"])["target"] is None
+
+
+@pytest.mark.parametrize("cols, expected", [
+    (["date", "Price_t", "Load_t"], "Price_t"),
+    (["PRICE2022", "Load_t"], "PRICE2022"),
+    (["date", "population", "Load_t"], None),
+    (["date", "pct_renew", "Load_t"], None),
+])
+def test_price_role_is_anchored_on_price(cols, expected):
+    assert resolve_columns(cols)["price"] == expected
+
+
+def test_schema_round_trip_and_drift(tmp_path):
+    data = tmp_path / "preprocessed_data.csv"
+    data.write_text(",".join(PREPROCESSED) + "\n2024-01-01,30,45000,3,4,0.5,3.4,10.7\n", encoding="utf-8")
+    write_schema(data, PREPROCESSED)
+    assert load_schema(data)["load"] == "Load_t"
+
+    data.write_text(",".join(PREPROCESSED[:-1]) + ",Renew\n", encoding="utf-8")
+    with pytest.raises(KeyError, match="Schema drift"):
+        load_schema(data)
@@ -0,0 +1,65 @@
+# test_scraping.py — DataScraping/DataScraping.py year handling (no network)
+import inspect
+
+import pytest
+
+pytest.importorskip("requests")
+pytest.importorskip("dotenv")
+from DataScraping import DataScraping as ds  # noqa: E402
+
+
+class FakeListing:
+    """Stands in for requests.get on the NP6-785-ER document list."""
+
+    def __init__(self, docs):
+        self.docs, self.calls = docs, []
+
+    def __call__(self, url, params=None, timeout=None):
+        self.calls.append((url, params))
+        return self
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"ListDocsByRptTypeRes": {"DocumentList": self.docs}}
+
+
+def doc(doc_id, year):
+    return {"Document": {"DocID": doc_id, "FriendlyName": f"RTMLZHBSPP_{year}",
+                         "ConstructedName": f"ext.00013061.0000000000000000.RTMLZHBSPP_{year}.zip"}}
+
+
+@pytest.fixture
+def listing(monkeypatch):
+    monkeypatch.setattr(ds, "ERCOT_RTM_URLS", {2024: ds.ERCOT_RTM_2024_URL})
+    fake = FakeListing([doc("111", 2019), doc("222", 2020), doc("333", 2024)])
+    monkeypatch.setattr(ds.requests, "get", fake)
+    return fake
+
+
+def test_rtm_url_resolved_from_archive_listing(listing):
+    assert ds.ercot_rtm_url(2024) == ds.ERCOT_RTM_2024_URL
+    assert listing.calls == []  # known years need no lookup
+    assert ds.ercot_rtm_url(2019) == "https://www.ercot.com/misdownload/servlets/mirDownload?doclookupId=111"
+    assert ds.ercot_rtm_url(2020).endswith("doclookupId=222")
+    assert listing.calls == [(ds.ERCOT_DOC_LIST_URL, {"reportTypeId": 13061})]  # cached after one lookup
+
+
+def test_rtm_url_single_document_listing(listing):
+    listing.docs = doc("444", 2011)
+    assert ds.ercot_rtm_url(2011, "http://127.0.0.1:1/misapp/servlets/IceDocListJsonWS") == \
+        "http://127.0.0.1:1/misdownload/servlets/mirDownload?doclookupId=444"
+
+
+def test_unknown_rtm_year_lists_available_years(listing):
+    with pytest.raises(ValueError, match=r"available years: \[2019, 2020, 2024\]"):
+        ds.ercot_rtm_url(2010)
+
+
+def test_noaa_2024_wrapper_keeps_positional_signature():
+    params = list(inspect.signature(ds.fetch_noaa_weather_2024).parameters.values())
+    positional = [p.name for p in params if p.kind is p.POSITIONAL_OR_KEYWORD]
+    assert positional[:4] == ["out_dir", "year", "datatypes", "zones"]
+    assert positional[-1] == "save_per_station"
+    assert [p.name for p in params if p.kind is p.KEYWORD_ONLY] == ["base_url"]
@@ -0,0 +1,140 @@
+# test_time_align.py — ERCOT hour-ending labels → UTC (DataCleaning/time_align.py)
+from datetime import date
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.fixtures import hour_endings, make_fixtures
+from DataCleaning import time_align
+from DataCleaning.quality import check_day_lengths
+from DataCleaning.time_align import minutes_ending, repeated_hour, to_utc
+
+
+def test_minutes_ending_labels():
+    assert minutes_ending(["01:00", "24:00", "1:15"]).tolist() == [60, 1440, 75]
+    assert minutes_ending(pd.Series([1, 24])).tolist() == [60, 1440]
+
+
+def test_hour_24_is_last_hour_of_its_day():
+    ts = to_utc(["2024-01-15"], [1440], [False])
+    assert ts[0] == pd.Timestamp("2024-01-16 05:00", tz="UTC")  # 23:00 CST
+
+
+@pytest.mark.parametrize("day, hours", [(date(2024, 3, 10), 23), (date(2024, 11, 3), 25),
+                                        (date(2024, 7, 1), 24)])
+def test_dst_days_map_to_distinct_utc_hours(day, hours):
+    labels = hour_endings(day)
+    he = np.array([h for h, _ in labels])
+    rep = repeated_hour(pd.Series([f for _, f in labels]), None)
+    ts = to_utc([day] * len(labels), he * 60, rep)
+    assert len(ts) == hours
+    assert ts.is_unique and ts.is_monotonic_increasing
+    assert ((ts[1:] - ts[:-1]) == pd.Timedelta("1h")).all()
+
+
+def test_repeated_hour_without_flag_uses_second_label():
+    keys = pd.DataFrame({"d": ["2024-11-03"] * 3, "m": [60, 120, 120]})
+    assert repeated_hour(None, keys).tolist() == [False, False, True]
+
+
+def test_skipped_spring_hour_is_nat():
+    ts = to_utc(["2024-03-10"], [180], [False])
+    assert ts.isna().all()
+
+
+@pytest.fixture(scope="module")
+def raw_2024(tmp_path_factory):
+    """Legacy flat 2024 inputs for HB_BUSAVG plus a daily weather CSV; cwd is the fixture root."""
+    root = tmp_path_factory.mktemp("raw")
+    make_fixtures(str(root), years=(2024,), hubs=1, seed=0)
+    days = pd.date_range("2024-01-01", "2024-12-31", freq="D")
+    (root / "DataCleaning").mkdir()
+    pd.DataFrame({"date": days.strftime("%Y-%m-%d"), "CDD_t": np.arange(len(days), dtype=float),
+                  "HDD_t": 0.0}).to_csv(root / time_align.WEATHER_CSV, index=False)
+    mp = pytest.MonkeyPatch()
+    mp.chdir(root)
+    yield root
+    mp.undo()
+
+
+@pytest.fixture(scope="module")
+def fuel_2024(raw_2024):
+    return time_align.fuel_intervals(2024), time_align.fuel_hourly(2024)
+
+
+def test_fuel_hourly_covers_2024_exactly(fuel_2024):
+    quarters, hourly = fuel_2024
+    assert len(hourly) == 8784
+    per_hour = quarters.groupby(quarters["ts_utc"].dt.floor("h"))["ts_utc"].nunique()
+    assert (per_hour == 4).all()
+    local = hourly["ts_utc"].dt.tz_convert(time_align.CENTRAL)
+    assert local.iloc[0] == pd.Timestamp("2024-01-01 00:00", tz=time_align.CENTRAL)
+    assert local.iloc[-1] == pd.Timestamp("2024-12-31 23:00", tz=time_align.CENTRAL)
+    assert check_day_lengths(local.dt.tz_localize(None)).empty
+
+
+@pytest.fixture(scope="module")
+def prices(raw_2024):
+    return time_align.price_hourly()
+
+
+@pytest.fixture(scope="module")
+def panel(raw_2024):
+    return time_align.hourly_panel(out_path=None)
+
+
+def local_day_lengths(ts_utc: pd.Series) -> pd.Series:
+    return ts_utc.dt.tz_convert(time_align.CENTRAL).dt.tz_localize(None).dt.normalize().value_counts()
+
+
+def test_price_hourly_dst_days(prices):
+    assert len(prices) == 8784
+    assert prices["ts_utc"].is_unique and prices["ts_utc"].is_monotonic_increasing
+    days = local_day_lengths(prices["ts_utc"])
+    assert days[pd.Timestamp("2024-03-10")] == 23
+    assert days[pd.Timestamp("2024-11-03")] == 25
+    assert days.drop([pd.Timestamp("2024-03-10"), pd.Timestamp("2024-11-03")]).eq(24).all()
+
+
+def test_price_hourly_averages_each_hour_ending(raw_2024, prices):
+    xls = pd.read_excel(raw_2024 / "DataScraping/Rawdata/price/Price.xlsx", sheet_name="Nov")
+    he02 = xls[(xls["Delivery Date"] == "11/03/2024") & (xls["Delivery Hour"] == 2)]
+    price = prices.set_index("ts_utc")["Price_h"]
+    # HE02 is 01:00-02:00 local: 06:00 UTC in daylight time, 07:00 UTC for the repeated pass
+    for flag, utc in (("N", "2024-11-03 06:00"), ("Y", "2024-11-03 07:00")):
+        quarters = he02.loc[he02["Repeated Hour Flag"] == flag, "Settlement Point Price"]
+        assert len(quarters) == 4
+        assert price[pd.Timestamp(utc, tz="UTC")] == pytest.approx(quarters.mean())
+
+
+def test_hourly_panel_is_one_row_per_utc_hour(panel):
+    assert list(panel.columns) == ["ts_utc", "ts_local", "date", "Price_h", "Load_h",
+                                   "RenewableShare_h", "CDD_t", "HDD_t"]
+    assert len(panel) == 8784
+    assert ((panel["ts_utc"].diff().iloc[1:]) == pd.Timedelta("1h")).all()
+    assert panel["ts_utc"].iloc[0] == pd.Timestamp("2024-01-01 06:00", tz="UTC")  # HE01 CST
+    assert (panel["ts_local"] == panel["ts_utc"].dt.tz_convert(time_align.CENTRAL)).all()
+    days = panel["date"].value_counts()
+    assert days[pd.Timestamp("2024-03-10")] == 23
+    assert days[pd.Timestamp("2024-11-03")] == 25
+
+
+def test_hourly_panel_aligns_hour_ending_load(raw_2024, panel):
+    # the 2024-07-02 posting carries operating day 2024-07-01; HE15 is 14:00-15:00 CDT
+    (csv_path,) = (raw_2024 / "DataScraping/Rawdata/load/load_raw_data").glob("*.20240702.*.csv")
+    raw = pd.read_csv(csv_path).set_index("HourEnding")["TOTAL"]
+    load = panel.set_index("ts_utc")["Load_h"]
+    assert load[pd.Timestamp("2024-07-01 19:00", tz="UTC")] == pytest.approx(raw["15:00"])
+    assert load[pd.Timestamp("2024-07-01 05:00", tz="UTC")] == pytest.approx(raw["01:00"])
+    # the last posting in the fixture carries 2024-12-30, so 2024-12-31 has no load
+    missing = panel.loc[panel["Load_h"].isna(), "date"].unique()
+    assert list(missing) == [pd.Timestamp("2024-12-31")]
+
+
+def test_hourly_panel_broadcasts_daily_weather(panel):
+    fall = panel[panel["date"] == pd.Timestamp("2024-11-03")]
+    assert len(fall) == 25
+    assert fall["CDD_t"].nunique() == 1
+    assert fall["CDD_t"].iloc[0] == float(pd.Timestamp("2024-11-03").dayofyear - 1)
+    assert panel["RenewableShare_h"].between(0, 1).all()